@@ -5,20 +5,46 @@ This module provides CRUD (Create, Retrieve, Update, Delete) operations
 """
 
 import logging
-from typing import Annotated, Optional
+from typing import Annotated, Iterator, Literal, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Header,
+    Response,
+    status,
+)
 from fastapi.params import Path, Query
+from fastapi.responses import StreamingResponse
 from pydantic import NonNegativeInt, PositiveInt
 
 from app.config.init_settings import init_setting
+from app.config.settings import setting
+from app.core.etag import etag_matches
 from app.core.exceptions import (
     DatabaseException,
     NotFoundException,
+    PreconditionFailedException,
     ServiceException,
 )
+from app.core.export import (
+    CSV_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    iter_csv,
+    iter_ndjson,
+)
+from app.core.responses import PydanticJSONResponse
 from app.crud.user import UserRepository, get_user_repository
-from app.schemas.user import User, UserCreate, UserUpdate, UsersResponse
+from app.models.user import User as UserModel
+from app.schemas.user import (
+    User,
+    UserCreate,
+    UserUpdate,
+    UsersBulkResponse,
+    UsersResponse,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 router: APIRouter = APIRouter(prefix="/user", tags=["user"])
@@ -49,7 +75,7 @@ def get_users(
             openapi_examples=init_setting.LIMIT_EXAMPLES,
         ),
     ] = 100,
-) -> UsersResponse:
+) -> Response:
     """
     Retrieve all users' basic information from the system using
      pagination.
@@ -73,7 +99,7 @@ def get_users(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
         ) from exc
     users: UsersResponse = UsersResponse(users=found_users)
-    return users
+    return PydanticJSONResponse(users)
 
 
 @router.post("", response_model=User, status_code=status.HTTP_201_CREATED)
@@ -88,7 +114,7 @@ def create_user(
         ),
     ],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-) -> User:
+) -> Response:
     """
     Register new user into the system.
     ## Parameter:
@@ -102,7 +128,7 @@ def create_user(
     :type user_repository: UserRepository
     """
     try:
-        new_user: User | None = user_repository.create_user(user)
+        new_user: UserModel | None = user_repository.create_user(user)
     except ServiceException as exc:
         detail: str = "Error at creating user."
         logger.error(detail)
@@ -114,10 +140,105 @@ def create_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User could not be created",
         )
-    return new_user
+    return PydanticJSONResponse(
+        User.model_validate(new_user), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=UsersBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_users_bulk(
+    users: Annotated[
+        list[UserCreate],
+        Body(
+            ...,
+            title="Users data",
+            description="List of users data to create",
+            min_length=1,
+            max_length=setting.USER_BULK_MAX_ITEMS,
+        ),
+    ],
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+) -> Response:
+    """
+    Register many users into the system in a single request.
+    Users whose username or email already exists, or that violate another
+     constraint, are reported in `errors` without failing the others.
+    ## Parameter:
+    - `:param users:` **List of body objects for user creation.**
+    - `:type users:` **list[UserCreate]**
+    ## Response:
+    - `:return:` **Users created with their data and the rejected ones**
+    - `:rtype:` **UsersBulkResponse**
+    \f
+    :param user_repository: Dependency method for user service layer
+    :type user_repository: UserRepository
+    """
+    try:
+        result: UsersBulkResponse = user_repository.create_users(
+            users, setting.USER_BULK_CHUNK_SIZE
+        )
+    except DatabaseException as exc:
+        detail: str = "Error at creating users."
+        logger.error(exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+        ) from exc
+    return PydanticJSONResponse(result, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/{user_id}", response_model=User)
+@router.get("/export", response_class=StreamingResponse)
+def export_users(
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    export_format: Annotated[
+        Literal["ndjson", "csv"],
+        Query(
+            alias="format",
+            title="Format",
+            description="Format of the exported users",
+        ),
+    ] = "ndjson",
+) -> StreamingResponse:
+    """
+    Export all users as a stream of NDJSON or CSV in a single request.
+    ## Parameter:
+    - `:param format:` **Output format, either ndjson or csv**
+    - `:type format:` **str**
+    ## Response:
+    - `:return:` **Streamed users from the database**
+    - `:rtype:` **StreamingResponse**
+    \f
+    :param user_repository: Dependency method for user service layer
+    :type user_repository: UserRepository
+    """
+    batch_size: int = setting.USER_EXPORT_BATCH_SIZE
+    users: Iterator[User] = user_repository.stream_users(batch_size)
+    if export_format == "csv":
+        return StreamingResponse(
+            iter_csv(
+                users,
+                list(User.model_fields),
+                batch_size,
+                init_setting.ENCODING,
+            ),
+            media_type=CSV_MEDIA_TYPE,
+            headers={"Content-Disposition": "attachment; filename=users.csv"},
+        )
+    return StreamingResponse(
+        iter_ndjson(users, batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": "attachment; filename=users.ndjson"},
+    )
+
+
+@router.get(
+    "/{user_id}",
+    response_model=User,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}},
+)
 def get_user_by_id(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     user_id: Annotated[
@@ -130,9 +251,18 @@ def get_user_by_id(
             example=1,
         ),
     ],
-) -> User:
+    if_none_match: Annotated[
+        str | None,
+        Header(
+            title="If-None-Match",
+            description="ETags of the representations already held",
+        ),
+    ] = None,
+) -> Response:
     """
     Retrieve an existing user's information given their user ID.
+    The response carries an ETag, and a request whose If-None-Match
+     header lists it is answered with 304 Not Modified and no body.
     ## Parameter:
     - `:param user_id:` **Unique identifier of the user to be retrieved**
     - `:type user_id:` **PositiveInt**
@@ -142,9 +272,11 @@ def get_user_by_id(
     \f
     :param user_repository: Dependency method for user service layer
     :type user_repository: UserRepository
+    :param if_none_match: The If-None-Match header value
+    :type if_none_match: Optional[str]
     """
     try:
-        user: User = user_repository.read_by_id(user_id)
+        etag, content = user_repository.read_cached_entry(user_id)
     except ServiceException as exc:
         detail: str = f"User with id {user_id} not found in the system."
         logger.error(detail)
@@ -156,10 +288,26 @@ def get_user_by_id(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(not_found_exc)
         ) from not_found_exc
-    return user
+    if etag_matches(etag, if_none_match):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return Response(
+        content,
+        media_type=PydanticJSONResponse.media_type,
+        headers={"ETag": etag},
+    )
 
 
-@router.put("/{user_id}", response_model=User)
+@router.put(
+    "/{user_id}",
+    response_model=User,
+    responses={
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "Precondition Failed"
+        }
+    },
+)
 def update_user(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     user_id: Annotated[
@@ -181,10 +329,20 @@ def update_user(
             openapi_examples=init_setting.USER_UPDATE_EXAMPLES,
         ),
     ],
-) -> User | None:
+    if_match: Annotated[
+        str | None,
+        Header(
+            title="If-Match",
+            description="ETag the update is conditioned on",
+        ),
+    ] = None,
+) -> Response:
     """
     Update an existing user's information given their user ID and new
      information.
+    When an If-Match header is sent, the update only applies if the user
+     still has that strong ETag; otherwise 412 Precondition Failed is
+     returned.
     ## Parameters:
     - `:param user_id:` **Unique identifier of the user to be updated**
     - `:type user_id:` **PositiveInt**
@@ -198,16 +356,36 @@ def update_user(
     \f
     :param user_repository: Dependency method for user service layer
     :type user_repository: UserRepository
+    :param if_match: The If-Match header value
+    :type if_match: Optional[str]
     """
     try:
-        user: User | None = user_repository.update_user(user_id, user_in)
+        user: UserModel | None = user_repository.update_user(
+            user_id, user_in, if_match
+        )
     except ServiceException as exc:
         detail: str = f"User with id {user_id} not found in the system."
         logger.error(detail)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=detail
         ) from exc
-    return user
+    except NotFoundException as not_found_exc:
+        logger.error(not_found_exc)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(not_found_exc)
+        ) from not_found_exc
+    except PreconditionFailedException as precondition_exc:
+        logger.warning(precondition_exc)
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(precondition_exc),
+        ) from precondition_exc
+    if not user:
+        return PydanticJSONResponse(None)
+    return PydanticJSONResponse(
+        User.model_validate(user),
+        headers={"ETag": user_repository.etag(user)},
+    )
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -2,31 +2,15 @@
 A module for base settings in the app.core.config package.
 """
 
-import base64
 from datetime import date
-from functools import lru_cache
-from pathlib import Path
+from functools import cached_property, lru_cache
+from typing import Any
 
 from fastapi.openapi.models import Example
 from pydantic_extra_types.phone_numbers import PhoneNumber
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-def get_image_b64(image_path: str) -> str:
-    """
-    Converts an image to base64 format
-    :param image_path: Path to the image file
-    :type image_path: str
-    :return: The image file in base64 format
-    :rtype: str
-    """
-    return base64.b64encode(Path(image_path).read_bytes()).decode("utf")
-
-
-img_b64: str = get_image_b64("./assets/images/project.png")
-users_b64: str = get_image_b64("./assets/images/users.png")
-
-
 class InitSettings(BaseSettings):
     """
     Init Settings class based on Pydantic Base Settings
@@ -44,12 +28,15 @@ class InitSettings(BaseSettings):
     VERSION: str = "1.0"
     ENCODING: str = "UTF-8"
     OPENAPI_FILE_PATH: str = "/openapi.json"
+    OPENAPI_CACHE_DIRECTORY: str = "cache/openapi"
     DATE_FORMAT: str = "%Y-%m-%d"
     DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     FILE_DATE_FORMAT: str = "%d-%b-%Y-%H-%M-%S"
     IMAGES_APP: str = "images"
     IMAGES_PATH: str = "/assets/images"
     IMAGES_DIRECTORY: str = "assets/images"
+    PROJECT_IMAGE: str = "./assets/images/project.png"
+    USERS_IMAGE: str = "./assets/images/users.png"
     LOG_FORMAT: str = (
         "[%(name)s][%(asctime)s][%(levelname)s][%(module)s]"
         "[%(funcName)s][%(lineno)d]: %(message)s"
@@ -57,24 +44,14 @@ class InitSettings(BaseSettings):
     PASSWORD_REGEX: str = (
         "^(?=.*?[A-Z])(?=.*?[a-z])(?=.*?[0-9])(?=.*?" "[#?!@$%^&*-]).{8,14}$"
     )
+    PHONE_NUMBER_CACHE_SIZE: int = 4096
     SUMMARY: str = """This backend project is a small demo as a use case for
      FastAPI with Pydantic and SQLAlchemy..
     """
-    DESCRIPTION: str = f"""**FastAPI**, **Pydantic** and **SQLAlchemy** helps
-     you do awesome stuff. 🚀
-    \n\n<img src="data:image/png;base64,{img_b64}"/>"""
     LICENSE_INFO: dict[str, str] = {
         "name": "MIT",
         "identifier": "MIT",
     }
-    TAGS_METADATA: list[dict[str, str]] = [
-        {
-            "name": "user",
-            "description": f"""Operations with users, such as register, get,
-             update and delete.\n\n<img src="data:image/png;base64,
-             {users_b64}" width="150" height="100"/>""",
-        },
-    ]
     USER_CREATE_EXAMPLES: dict[str, Example] = {
         "normal": {
             "summary": "A normal example",
@@ -184,6 +161,39 @@ class InitSettings(BaseSettings):
         },
     }
 
+    @cached_property
+    def DESCRIPTION(self) -> str:
+        """
+        The API description with the project image served from its
+         fingerprinted static URL, built on first access
+        :return: The description for the OpenAPI document
+        :rtype: str
+        """
+        from app.core.static import get_image_url
+
+        return f"""**FastAPI**, **Pydantic** and **SQLAlchemy** helps
+     you do awesome stuff. 🚀
+    \n\n<img src="{get_image_url(self.PROJECT_IMAGE)}"/>"""
+
+    @cached_property
+    def TAGS_METADATA(self) -> list[dict[str, str]]:
+        """
+        The OpenAPI tags metadata with the users image served from its
+         fingerprinted static URL, built on first access
+        :return: The tags metadata for the OpenAPI document
+        :rtype: list[dict[str, str]]
+        """
+        from app.core.static import get_image_url
+
+        return [
+            {
+                "name": "user",
+                "description": f"""Operations with users, such as register, get,
+             update and delete.\n\n<img src="{get_image_url(self.USERS_IMAGE)}"
+             width="150" height="100"/>""",
+            },
+        ]
+
 
 @lru_cache
 def get_init_settings() -> InitSettings:
@@ -195,4 +205,18 @@ def get_init_settings() -> InitSettings:
     return InitSettings()
 
 
-init_setting: InitSettings = get_init_settings()
+init_setting: InitSettings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the init settings singleton on first access instead of at import, so
+     importing this module does not read the environment
+    :param name: The name of the module attribute
+    :type name: str
+    :return: The attribute value
+    :rtype: Any
+    """
+    if name == "init_setting":
+        return get_init_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
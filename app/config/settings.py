@@ -2,13 +2,16 @@
 A module for settings in the app.core.config package.
 """
 
+import os
 from functools import lru_cache
 from typing import Any
 
 from pydantic import (
     AnyHttpUrl,
     EmailStr,
+    Field,
     IPvAnyAddress,
+    NonNegativeInt,
     PositiveInt,
     PostgresDsn,
     field_validator,
@@ -18,6 +21,18 @@ from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def get_cpu_count() -> PositiveInt:
+    """
+    Get the number of CPUs this process may run on, honouring the CPU
+     affinity set by containers or taskset
+    :return: The number of available CPUs
+    :rtype: PositiveInt
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 class Settings(BaseSettings):
     """
     Settings class based on Pydantic Base Settings
@@ -38,6 +53,15 @@ class Settings(BaseSettings):
     SERVER_DESCRIPTION: str
     BACKEND_CORS_ORIGINS: list[AnyHttpUrl] = []
     SERVER_URL: AnyHttpUrl
+    SERVER_DEBUG: bool = False
+    # One worker process per available CPU unless configured explicitly
+    SERVER_WORKERS: PositiveInt = Field(default_factory=get_cpu_count)
+    SERVER_BACKLOG: PositiveInt = 2048
+    SERVER_KEEP_ALIVE: PositiveInt = 65  # seconds, above LB idle timeouts
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: PositiveInt = 30  # seconds
+    SERVER_LIMIT_CONCURRENCY: PositiveInt | None = None
+    SERVER_LIMIT_MAX_REQUESTS: PositiveInt | None = None
+    SERVER_ACCESS_LOG: bool = False
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     def assemble_cors_origins(cls, v: str | list[str]) -> list[str] | str:
@@ -70,6 +94,30 @@ class Settings(BaseSettings):
     POSTGRES_PORT: PositiveInt
     POSTGRES_DB: str
     SQLALCHEMY_DATABASE_URI: PostgresDsn | None = None
+    SQLALCHEMY_ECHO: bool = False  # log every SQL statement
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAXSIZE: PositiveInt = 1024
+    USER_CACHE_TTL: PositiveInt = 300  # seconds
+    USER_CACHE_LOCAL_TTL: PositiveInt = 5  # seconds, with Redis or workers
+    USER_CACHE_REDIS_URL: str | None = None
+    USER_BULK_CHUNK_SIZE: PositiveInt = 1000
+    USER_BULK_MAX_ITEMS: PositiveInt = 50000
+    USER_EXPORT_BATCH_SIZE: PositiveInt = 1000
+
+    COMPRESSION_MINIMUM_SIZE: NonNegativeInt = 1024  # bytes
+    COMPRESSION_LEVEL: int = Field(default=6, ge=1, le=9)  # gzip level
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11)
+    COMPRESSION_CONTENT_TYPES: list[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "image/svg+xml",
+        "text/",
+    ]
+    STATIC_MAX_AGE: PositiveInt = 31536000  # seconds
+    STATIC_MEMORY_MAX_FILE_SIZE: NonNegativeInt = 131072  # bytes
+    STATIC_MEMORY_MAX_TOTAL_SIZE: NonNegativeInt = 8388608  # bytes
 
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     def assemble_postgresql_connection(
@@ -140,4 +188,18 @@ def get_settings() -> Settings:
     return Settings()
 
 
-setting: Settings = get_settings()
+setting: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the settings singleton on first access instead of at import, so
+     importing this module does not read the environment
+    :param name: The name of the module attribute
+    :type name: str
+    :return: The attribute value
+    :rtype: Any
+    """
+    if name == "setting":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
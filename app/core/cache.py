@@ -0,0 +1,465 @@
+"""
+A module for cache in the app-core package.
+It provides a read-through cache with an in-process TTL LRU tier, an
+ optional Redis-compatible tier, single-flight loading and hit/miss
+ metrics.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Protocol
+
+from pydantic import NonNegativeInt, PositiveInt
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """
+    Interface of a cache tier storing serialized values by key
+    """
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a value from the tier
+        :param key: The key of the entry
+        :type key: str
+        :return: The cached value or None
+        :rtype: Optional[bytes]
+        """
+        ...
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value in the tier
+        :param key: The key of the entry
+        :type key: str
+        :param value: The serialized value
+        :type value: bytes
+        :return: None
+        :rtype: NoneType
+        """
+        ...
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the tier
+        :param key: The key of the entry
+        :type key: str
+        :return: None
+        :rtype: NoneType
+        """
+        ...
+
+
+class RedisClient(Protocol):
+    """
+    The subset of the Redis client API used by the cache, so any
+     compatible client (or a local fake) can be plugged in
+    """
+
+    def get(self, name: str) -> bytes | None:
+        """
+        Get the value of a key
+        :param name: The key
+        :type name: str
+        :return: The value or None if the key does not exist
+        :rtype: Optional[bytes]
+        """
+        ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        """
+        Set the value of a key
+        :param name: The key
+        :type name: str
+        :param value: The value
+        :type value: bytes
+        :param ex: Expiration of the key in seconds
+        :type ex: Optional[int]
+        :return: The reply of the server
+        :rtype: Any
+        """
+        ...
+
+    def delete(self, *names: str) -> Any:
+        """
+        Delete one or more keys
+        :param names: The keys
+        :type names: str
+        :return: The reply of the server
+        :rtype: Any
+        """
+        ...
+
+
+class TTLLRUCache:
+    """
+    Thread-safe in-process LRU cache whose entries expire after a TTL
+    """
+
+    def __init__(self, maxsize: PositiveInt, ttl: PositiveInt):
+        self.maxsize: PositiveInt = maxsize
+        self.ttl: PositiveInt = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a value from the cache if present and not expired
+        :param key: The key of the entry
+        :type key: str
+        :return: The cached value or None
+        :rtype: Optional[bytes]
+        """
+        with self._lock:
+            entry: tuple[float, bytes] | None = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value, evicting the least recently used entry when full
+        :param key: The key of the entry
+        :type key: str
+        :param value: The serialized value
+        :type value: bytes
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache
+        :param key: The key of the entry
+        :type key: str
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend:
+    """
+    Out-of-process cache tier backed by a Redis-compatible client
+    """
+
+    def __init__(
+        self, client: RedisClient, ttl: PositiveInt, prefix: str = "cache:"
+    ):
+        self.client: RedisClient = client
+        self.ttl: PositiveInt = ttl
+        self.prefix: str = prefix
+
+    @classmethod
+    def from_url(
+        cls, url: str, ttl: PositiveInt, prefix: str = "cache:"
+    ) -> "RedisCacheBackend":
+        """
+        Create the backend from a Redis URL. The redis package is only
+         required when this backend is configured.
+        :param url: The Redis connection URL
+        :type url: str
+        :param ttl: Time to live of the entries in seconds
+        :type ttl: PositiveInt
+        :param prefix: Prefix for the keys stored in Redis
+        :type prefix: str
+        :return: The Redis cache backend
+        :rtype: RedisCacheBackend
+        """
+        import redis
+
+        return cls(redis.Redis.from_url(url), ttl, prefix)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a value from Redis
+        :param key: The key of the entry
+        :type key: str
+        :return: The cached value or None
+        :rtype: Optional[bytes]
+        """
+        return self.client.get(f"{self.prefix}{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value in Redis with the configured TTL
+        :param key: The key of the entry
+        :type key: str
+        :param value: The serialized value
+        :type value: bytes
+        :return: None
+        :rtype: NoneType
+        """
+        self.client.set(f"{self.prefix}{key}", value, ex=self.ttl)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from Redis
+        :param key: The key of the entry
+        :type key: str
+        :return: None
+        :rtype: NoneType
+        """
+        self.client.delete(f"{self.prefix}{key}")
+
+
+@dataclass
+class CacheMetrics:
+    """
+    Counters describing the behavior of a cache
+    """
+
+    hits: NonNegativeInt = 0
+    remote_hits: NonNegativeInt = 0
+    misses: NonNegativeInt = 0
+    loads: NonNegativeInt = 0
+    invalidations: NonNegativeInt = 0
+    errors: NonNegativeInt = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def increment(self, counter: str) -> None:
+        """
+        Increment one of the counters
+        :param counter: The name of the counter
+        :type counter: str
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict[str, int | float]:
+        """
+        Get the current values of the counters and the hit ratio
+        :return: The metrics of the cache
+        :rtype: dict[str, int | float]
+        """
+        with self._lock:
+            lookups: int = self.hits + self.remote_hits + self.misses
+            return {
+                "hits": self.hits,
+                "remote_hits": self.remote_hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+                "errors": self.errors,
+                "hit_ratio": (
+                    round((self.hits + self.remote_hits) / lookups, 4)
+                    if lookups
+                    else 0.0
+                ),
+            }
+
+
+class _Call:
+    """
+    An in-flight load shared by concurrent callers of the same key, with
+     its result or error once it completes
+    """
+
+    def __init__(self) -> None:
+        self.event: threading.Event = threading.Event()
+        self.result: bytes | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Ensure only one load per key runs at a time; concurrent callers wait
+     for and share its result instead of stampeding the database.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def do(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        """
+        Run the loader for the key, or wait for the one already running
+        :param key: The key being loaded
+        :type key: str
+        :param loader: The function that loads the value
+        :type loader: Callable[[], bytes]
+        :return: The loaded value
+        :rtype: bytes
+        """
+        with self._lock:
+            call: _Call | None = self._calls.get(key)
+            leader: bool = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+        if not leader:
+            call.event.wait()
+        else:
+            try:
+                call.result = loader()
+            except BaseException as exc:
+                call.error = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.event.set()
+        if call.error is not None:
+            raise call.error
+        return call.result  # type: ignore
+
+
+class ReadThroughCache:
+    """
+    Read-through cache combining a local tier, an optional remote tier,
+     single-flight loading and metrics.
+    """
+
+    def __init__(
+        self,
+        local: CacheBackend,
+        remote: CacheBackend | None = None,
+    ):
+        self.local: CacheBackend = local
+        self.remote: CacheBackend | None = remote
+        self.metrics: CacheMetrics = CacheMetrics()
+        self._single_flight: SingleFlight = SingleFlight()
+        # Keys being loaded, flagged True when invalidated during the load
+        self._loading: dict[str, bool] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_remote(self, key: str) -> bytes | None:
+        """
+        Get a value from the remote tier, counting and logging its errors
+         as misses
+        :param key: The key of the entry
+        :type key: str
+        :return: The cached value or None
+        :rtype: Optional[bytes]
+        """
+        if self.remote is None:
+            return None
+        try:
+            return self.remote.get(key)
+        except Exception as exc:
+            self.metrics.increment("errors")
+            logger.warning("Remote cache get failed for %s: %s", key, exc)
+            return None
+
+    def _set_remote(self, key: str, value: bytes) -> None:
+        """
+        Store a value in the remote tier, counting and logging its errors
+        :param key: The key of the entry
+        :type key: str
+        :param value: The serialized value
+        :type value: bytes
+        :return: None
+        :rtype: NoneType
+        """
+        if self.remote is None:
+            return
+        try:
+            self.remote.set(key, value)
+        except Exception as exc:
+            self.metrics.increment("errors")
+            logger.warning("Remote cache set failed for %s: %s", key, exc)
+
+    def _delete_remote(self, key: str) -> None:
+        """
+        Delete a key from the remote tier, counting and logging its errors
+        :param key: The key of the entry
+        :type key: str
+        :return: None
+        :rtype: NoneType
+        """
+        if self.remote is None:
+            return
+        try:
+            self.remote.delete(key)
+        except Exception as exc:
+            self.metrics.increment("errors")
+            logger.warning("Remote cache delete failed for %s: %s", key, exc)
+
+    def _load(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        """
+        Load a missing value from the remote tier or the loader and store
+         it, unless the key was invalidated while it was loading, since the
+         loaded value may predate the write that triggered the invalidation
+        :param key: The key of the entry
+        :type key: str
+        :param loader: The function that loads the serialized value
+        :type loader: Callable[[], bytes]
+        :return: The serialized value
+        :rtype: bytes
+        """
+        if (value := self._get_remote(key)) is not None:
+            self.metrics.increment("remote_hits")
+            self.local.set(key, value)
+            return value
+        self.metrics.increment("misses")
+        with self._lock:
+            self._loading[key] = False
+        try:
+            value = loader()
+        except BaseException:
+            with self._lock:
+                self._loading.pop(key, None)
+            raise
+        self.metrics.increment("loads")
+        # The remote call runs outside the lock, so a slow Redis does not
+        #  stall the other keys; the flag is checked again afterwards
+        with self._lock:
+            store: bool = not self._loading.get(key, True)
+        if store:
+            self._set_remote(key, value)
+        with self._lock:
+            invalidated: bool = self._loading.pop(key, True)
+            if store and not invalidated:
+                self.local.set(key, value)
+        if store and invalidated:
+            self._delete_remote(key)
+        return value
+
+    def get_or_load(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        """
+        Get the value of a key from the cache tiers, loading and storing
+         it on a miss
+        :param key: The key of the entry
+        :type key: str
+        :param loader: The function that loads the serialized value
+        :type loader: Callable[[], bytes]
+        :return: The serialized value
+        :rtype: bytes
+        """
+        if (value := self.local.get(key)) is not None:
+            self.metrics.increment("hits")
+            return value
+        return self._single_flight.do(key, lambda: self._load(key, loader))
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a key from every cache tier
+        :param key: The key of the entry
+        :type key: str
+        :return: None
+        :rtype: NoneType
+        """
+        self.metrics.increment("invalidations")
+        with self._lock:
+            if key in self._loading:
+                self._loading[key] = True
+            self.local.delete(key)
+        self._delete_remote(key)
@@ -0,0 +1,70 @@
+"""
+A module for etag in the app-core package.
+It builds entity tags from a resource id and its version counter, and
+ evaluates If-None-Match / If-Match headers against them.
+"""
+
+import re
+
+from pydantic import PositiveInt
+
+ETAG_PATTERN: re.Pattern[str] = re.compile(r'^"(\d+)-(\d+)"$')
+
+
+def make_etag(_id: PositiveInt, version: PositiveInt) -> str:
+    """
+    Build the strong ETag of a resource version
+    :param _id: The id of the resource
+    :type _id: PositiveInt
+    :param version: The version counter of the resource
+    :type version: PositiveInt
+    :return: The strong ETag, e.g. "1-3"
+    :rtype: str
+    """
+    return f'"{_id}-{version}"'
+
+
+def parse_etag(etag: str) -> tuple[PositiveInt, PositiveInt] | None:
+    """
+    Extract the id and version encoded in a strong ETag. Weak tags never
+     match with the strong comparison that If-Match requires.
+    :param etag: The ETag to parse
+    :type etag: str
+    :return: The id and version, or None if it is weak or was not built
+     here
+    :rtype: Optional[tuple[PositiveInt, PositiveInt]]
+    """
+    if not (match := ETAG_PATTERN.match(etag.strip())):
+        return None
+    return int(match[1]), int(match[2])
+
+
+def split_etags(header: str) -> list[str]:
+    """
+    Split the value of an If-None-Match or If-Match header
+    :param header: The header value
+    :type header: str
+    :return: The listed entity tags
+    :rtype: list[str]
+    """
+    return [etag.strip() for etag in header.split(",") if etag.strip()]
+
+
+def etag_matches(etag: str, header: str | None) -> bool:
+    """
+    Check an ETag against a conditional header with the weak comparison,
+     where `*` matches any current representation
+    :param etag: The current ETag of the resource
+    :type etag: str
+    :param header: The If-None-Match or If-Match header value
+    :type header: Optional[str]
+    :return: True if any listed tag matches
+    :rtype: bool
+    """
+    if not header:
+        return False
+    opaque_tag: str = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque_tag
+        for tag in split_etags(header)
+    )
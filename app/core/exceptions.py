@@ -36,3 +36,14 @@ class NotFoundException(Exception):
         super().__init__(message)
         if note:
             self.add_note(note)
+
+
+class PreconditionFailedException(Exception):
+    """
+    Precondition Failed Exception class
+    """
+
+    def __init__(self, message: str, note: str | None = None):
+        super().__init__(message)
+        if note:
+            self.add_note(note)
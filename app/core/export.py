@@ -0,0 +1,73 @@
+"""
+A module for export in the app-core package.
+It encodes streams of validated models as NDJSON or CSV byte chunks for
+ streaming responses.
+"""
+
+import csv
+import io
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, PositiveInt
+
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+CSV_MEDIA_TYPE: str = "text/csv"
+
+
+def iter_ndjson(
+    models: Iterable[BaseModel], batch_size: PositiveInt
+) -> Iterator[bytes]:
+    """
+    Encode models as newline-delimited JSON, yielding one chunk per batch
+    :param models: The models to encode
+    :type models: Iterable[BaseModel]
+    :param batch_size: The number of models per yielded chunk
+    :type batch_size: PositiveInt
+    :return: The NDJSON encoded chunks
+    :rtype: Iterator[bytes]
+    """
+    lines: list[bytes] = []
+    for model in models:
+        lines.append(model.model_dump_json().encode())
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines.clear()
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def iter_csv(
+    models: Iterable[BaseModel],
+    fieldnames: list[str],
+    batch_size: PositiveInt,
+    encoding: str,
+) -> Iterator[bytes]:
+    """
+    Encode models as CSV with a header row, yielding one chunk per batch
+    :param models: The models to encode
+    :type models: Iterable[BaseModel]
+    :param fieldnames: The model fields to write as columns
+    :type fieldnames: list[str]
+    :param batch_size: The number of models per yielded chunk
+    :type batch_size: PositiveInt
+    :param encoding: The encoding of the CSV output
+    :type encoding: str
+    :return: The CSV encoded chunks
+    :rtype: Iterator[bytes]
+    """
+    buffer: io.StringIO = io.StringIO()
+    writer: csv.DictWriter[str] = csv.DictWriter(
+        buffer, fieldnames=fieldnames, extrasaction="ignore"
+    )
+    writer.writeheader()
+    rows: int = 0
+    for model in models:
+        writer.writerow(model.model_dump(mode="json"))
+        rows += 1
+        if rows >= batch_size:
+            yield buffer.getvalue().encode(encoding)
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode(encoding)
@@ -10,7 +10,9 @@ from fastapi import FastAPI
 
 from app.config.init_settings import get_init_settings
 from app.config.settings import get_settings
+from app.core.openapi import load_openapi_document
 from app.crud.user import get_user_repository
+from app.db.session import get_engine
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -30,9 +32,15 @@ async def lifespan(application: FastAPI) -> AsyncGenerator[Any, None]:
         application.state.init_settings = get_init_settings()
         application.state.user_repository = get_user_repository()
         logger.info("Configuration settings loaded.")
+        application.state.openapi_document = load_openapi_document(
+            application, application.state.init_settings.OPENAPI_CACHE_DIRECTORY
+        )
         yield
     except Exception as exc:
         logger.error(f"Error during application startup: {exc}")
         raise
     finally:
+        if get_engine.cache_info().currsize:
+            get_engine().dispose()
+            logger.info("Database connection pool disposed.")
         logger.info("Application shutdown completed.")
@@ -0,0 +1,303 @@
+"""
+A module for middleware in the app-core package.
+"""
+
+import zlib
+from typing import Any, Protocol
+
+from pydantic import NonNegativeInt, PositiveInt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+SKIPPED_STATUS_CODES: frozenset[int] = frozenset({204, 206, 304})
+
+
+class _Compressor(Protocol):
+    """
+    Streaming compressor interface shared by gzip and brotli
+    """
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a chunk of data, possibly buffering part of it
+        :param data: The chunk to compress
+        :type data: bytes
+        :return: The compressed output available so far
+        :rtype: bytes
+        """
+        ...
+
+    def flush(self) -> bytes:
+        """
+        Flush the buffered data so the client can decode it right away
+        :return: The compressed buffered data
+        :rtype: bytes
+        """
+        ...
+
+    def finish(self) -> bytes:
+        """
+        Flush the buffered data and end the compressed stream
+        :return: The remaining compressed data
+        :rtype: bytes
+        """
+        ...
+
+
+class _GzipCompressor:
+    """
+    Streaming gzip compressor based on zlib
+    """
+
+    def __init__(self, level: int):
+        self._compressor: Any = zlib.compressobj(
+            level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a chunk of data
+        :param data: The chunk to compress
+        :type data: bytes
+        :return: The compressed output available so far
+        :rtype: bytes
+        """
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        """
+        Flush the buffered data with a sync flush
+        :return: The compressed buffered data
+        :rtype: bytes
+        """
+        return bytes(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+
+    def finish(self) -> bytes:
+        """
+        End the compressed stream
+        :return: The remaining compressed data
+        :rtype: bytes
+        """
+        return bytes(self._compressor.flush(zlib.Z_FINISH))
+
+
+class _BrotliCompressor:
+    """
+    Streaming brotli compressor
+    """
+
+    def __init__(self, quality: int):
+        self._compressor: Any = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a chunk of data
+        :param data: The chunk to compress
+        :type data: bytes
+        :return: The compressed output available so far
+        :rtype: bytes
+        """
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        """
+        Flush the buffered data
+        :return: The compressed buffered data
+        :rtype: bytes
+        """
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        """
+        End the compressed stream
+        :return: The remaining compressed data
+        :rtype: bytes
+        """
+        return bytes(self._compressor.finish())
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """
+    Parse the content codings accepted by the client
+    :param accept_encoding: The value of the Accept-Encoding header
+    :type accept_encoding: str
+    :return: The accepted encodings, excluding those with q=0
+    :rtype: set[str]
+    """
+    encodings: set[str] = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding:
+            encodings.add(coding)
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with brotli (when installed) or
+     gzip. Only allowlisted content types at or above a minimum size are
+     compressed, and streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: NonNegativeInt,
+        gzip_level: PositiveInt,
+        brotli_quality: NonNegativeInt,
+        content_types: list[str],
+    ) -> None:
+        self.app: ASGIApp = app
+        self.minimum_size: NonNegativeInt = minimum_size
+        self.gzip_level: PositiveInt = gzip_level
+        self.brotli_quality: NonNegativeInt = brotli_quality
+        self.content_types: tuple[str, ...] = tuple(content_types)
+
+    def _select_encoding(self, scope: Scope) -> str | None:
+        """
+        Select the content coding of the response from the request
+        :param scope: The ASGI scope of the request
+        :type scope: Scope
+        :return: br or gzip, or None if the client accepts neither
+        :rtype: Optional[str]
+        """
+        encodings: set[str] = accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if brotli is not None and "br" in encodings:
+            return "br"
+        if "gzip" in encodings:
+            return "gzip"
+        return None
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding: str | None = self._select_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder: _CompressionResponder = _CompressionResponder(
+            self, encoding, send
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """
+    Wraps the send callable of a single response to compress its body
+    """
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+    ) -> None:
+        self.middleware: CompressionMiddleware = middleware
+        self.encoding: str = encoding
+        self._send: Send = send
+        self._start_message: Message | None = None
+        self._compressor: _Compressor | None = None
+        self._passthrough: bool = False
+
+    def _new_compressor(self) -> _Compressor:
+        """
+        Create a streaming compressor for the selected encoding
+        :return: The compressor
+        :rtype: _Compressor
+        """
+        if self.encoding == "br":
+            return _BrotliCompressor(self.middleware.brotli_quality)
+        return _GzipCompressor(self.middleware.gzip_level)
+
+    def _is_compressible(self, headers: MutableHeaders) -> bool:
+        """
+        Check whether the response may be compressed from its status and
+         headers
+        :param headers: The headers of the response
+        :type headers: MutableHeaders
+        :return: True if the content type is allowlisted and the response
+         is not already encoded
+        :rtype: bool
+        """
+        if self._start_message is None or "content-encoding" in headers:
+            return False
+        if self._start_message["status"] in SKIPPED_STATUS_CODES:
+            return False
+        content_type: str = headers.get("content-type", "")
+        return content_type.startswith(self.middleware.content_types)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+        if self._compressor is not None:
+            body: bytes = self._compressor.compress(message.get("body", b""))
+            more_body: bool = message.get("more_body", False)
+            body += (
+                self._compressor.flush()
+                if more_body
+                else self._compressor.finish()
+            )
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": body,
+                    "more_body": more_body,
+                }
+            )
+            return
+        await self._start(message)
+
+    async def _start(self, message: Message) -> None:
+        """
+        Send the start message and the first body chunk, compressed when
+         the response qualifies. A strong ETag is weakened once the body is
+         encoded, as the encoded bytes are not those it was computed for.
+        :param message: The first body message of the response
+        :type message: Message
+        :return: None
+        :rtype: NoneType
+        """
+        start_message: Message = self._start_message  # type: ignore
+        headers: MutableHeaders = MutableHeaders(scope=start_message)
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if not self._is_compressible(headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self._passthrough = True
+            await self._send(start_message)
+            await self._send(message)
+            return
+        compressor: _Compressor = self._new_compressor()
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag: str | None = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        if more_body:
+            self._compressor = compressor
+            del headers["Content-Length"]
+            body = compressor.compress(body) + compressor.flush()
+        else:
+            body = compressor.compress(body) + compressor.finish()
+            headers["Content-Length"] = str(len(body))
+        await self._send(start_message)
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
@@ -0,0 +1,254 @@
+"""
+A module for the OpenAPI document cache in the app-core package.
+The document is generated once, written to disk keyed by the application
+ version and a hash of its routes and sources, and served as pre-encoded bytes.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import fastapi
+import pydantic
+from fastapi import FastAPI, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.routing import Route
+
+from app.core.etag import etag_matches
+from app.core.middleware import accepted_encodings
+
+logger: logging.Logger = logging.getLogger(__name__)
+SOURCE_ROOT: Path = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class OpenAPIDocument:
+    """
+    The serialized OpenAPI document with its compressed variant and the
+     ETag of each representation
+    """
+
+    content: bytes
+    gzip_content: bytes
+    etag: str
+
+    @property
+    def gzip_etag(self) -> str:
+        """
+        The ETag of the gzip representation, distinct from the identity one
+        :return: The strong entity tag
+        :rtype: str
+        """
+        return f'{self.etag[:-1]}-gzip"'
+
+    @classmethod
+    def from_content(cls, content: bytes) -> "OpenAPIDocument":
+        """
+        Build the document variants from the serialized JSON
+        :param content: The OpenAPI document as JSON bytes
+        :type content: bytes
+        :return: The pre-encoded OpenAPI document
+        :rtype: OpenAPIDocument
+        """
+        return cls(
+            content=content,
+            gzip_content=gzip.compress(content, mtime=0),
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        )
+
+
+def _source_digest(root: Path) -> str:
+    """
+    Hash the Python sources of a package, so any change to the routes,
+     schemas or models that shape the document changes the cache key
+    :param root: The directory of the package
+    :type root: Path
+    :return: The SHA-256 hexadecimal digest of the file paths and contents
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def compute_openapi_key(app: FastAPI) -> str:
+    """
+    Compute the cache key of the OpenAPI document for the application.
+    The key only uses inputs that are cheap to read, so a cache hit costs
+     far less than generating the schema: the application and library
+     versions, the document metadata with the fingerprinted URLs of its
+     images, the paths, methods and endpoints of the API routes, and a
+     digest of the application sources that define their schemas.
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :return: The hexadecimal hash that identifies the document
+    :rtype: str
+    """
+    init_settings = app.state.init_settings
+    signature: list[Any] = [
+        init_settings.VERSION,
+        fastapi.__version__,
+        pydantic.VERSION,
+        init_settings.PROJECT_NAME,
+        init_settings.SUMMARY,
+        init_settings.DESCRIPTION,
+        init_settings.TAGS_METADATA,
+        init_settings.LICENSE_INFO,
+        str(app.state.settings.SERVER_URL),
+        app.state.settings.SERVER_DESCRIPTION,
+        app.state.settings.CONTACT,
+        _source_digest(SOURCE_ROOT),
+    ]
+    signature.extend(
+        [
+            route.path,
+            sorted(route.methods),
+            route.unique_id,
+            f"{route.endpoint.__module__}.{route.endpoint.__qualname__}",
+        ]
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.include_in_schema
+    )
+    return hashlib.sha256(
+        json.dumps(signature, default=str, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """
+    Write the content to a file without exposing partial writes to other
+     workers
+    :param path: The destination file
+    :type path: Path
+    :param content: The bytes to write
+    :type content: bytes
+    :return: None
+    :rtype: NoneType
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path: Path = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary_path.write_bytes(content)
+    os.replace(temporary_path, path)
+
+
+def load_openapi_document(
+    app: FastAPI, cache_directory: str
+) -> OpenAPIDocument:
+    """
+    Load the OpenAPI document from the disk cache, generating and storing
+     it when there is no file for the current key
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :param cache_directory: The directory for the cached documents
+    :type cache_directory: str
+    :return: The pre-encoded OpenAPI document
+    :rtype: OpenAPIDocument
+    """
+    path: Path = (
+        Path(cache_directory) / f"openapi-{compute_openapi_key(app)}.json"
+    )
+    try:
+        content: bytes = path.read_bytes()
+        app.openapi_schema = json.loads(content)
+        logger.info("OpenAPI document loaded from %s", path)
+    except (OSError, ValueError):
+        content = json.dumps(
+            app.openapi(), separators=(",", ":"), ensure_ascii=False
+        ).encode()
+        try:
+            _write_atomically(path, content)
+            logger.info("OpenAPI document written to %s", path)
+        except OSError as exc:
+            logger.warning("OpenAPI document could not be cached: %s", exc)
+    return OpenAPIDocument.from_content(content)
+
+
+async def openapi_endpoint(request: Request) -> Response:
+    """
+    Serve the pre-encoded OpenAPI document with ETag and gzip support
+    :param request: The incoming request
+    :type request: Request
+    :return: The OpenAPI document or a not modified response
+    :rtype: Response
+    """
+    document: OpenAPIDocument | None = getattr(
+        request.app.state, "openapi_document", None
+    )
+    if document is None:
+        init_settings = request.app.state.init_settings
+        document = load_openapi_document(
+            request.app, init_settings.OPENAPI_CACHE_DIRECTORY
+        )
+        request.app.state.openapi_document = document
+    use_gzip: bool = "gzip" in accepted_encodings(
+        request.headers.get("accept-encoding", "")
+    )
+    etag: str = document.gzip_etag if use_gzip else document.etag
+    headers: dict[str, str] = {
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            document.gzip_content,
+            media_type="application/json",
+            headers=headers,
+        )
+    return Response(
+        document.content, media_type="application/json", headers=headers
+    )
+
+
+def mount_openapi_cache(app: FastAPI) -> None:
+    """
+    Replace the default OpenAPI route of the application with the cached
+     endpoint
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :return: None
+    :rtype: NoneType
+    """
+    if not app.openapi_url:
+        return
+    cached_route: Route = Route(
+        app.openapi_url,
+        openapi_endpoint,
+        include_in_schema=False,
+        name="openapi",
+    )
+    for index, route in enumerate(app.router.routes):
+        if isinstance(route, Route) and route.path == app.openapi_url:
+            app.router.routes[index] = cached_route
+            return
+    app.router.routes.append(cached_route)
+
+
+def main() -> None:
+    """
+    Generate the OpenAPI document into the disk cache at build time
+    :return: None
+    :rtype: NoneType
+    """
+    from app.config.init_settings import get_init_settings
+    from app.config.settings import get_settings
+    from app.main import app
+
+    app.state.settings = get_settings()
+    app.state.init_settings = get_init_settings()
+    load_openapi_document(app, app.state.init_settings.OPENAPI_CACHE_DIRECTORY)
+
+
+if __name__ == "__main__":
+    main()
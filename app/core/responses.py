@@ -0,0 +1,26 @@
+"""
+A module for responses in the app-core package.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response serialized by pydantic-core straight to bytes.
+    Validated models are encoded by their compiled serializer without the
+     intermediate dictionary built by jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the content to JSON bytes
+        :param content: A pydantic model or any JSON compatible data
+        :type content: Any
+        :return: The JSON encoded content
+        :rtype: bytes
+        """
+        return to_json(content)
@@ -0,0 +1,334 @@
+"""
+A module for static files in the app-core package.
+"""
+
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import NonNegativeInt, PositiveInt
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.config.init_settings import InitSettings, get_init_settings
+from app.config.settings import Settings, get_settings
+from app.core.middleware import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+PRECOMPRESSED_SUFFIXES: tuple[tuple[str, str], ...] = (
+    ("br", ".br"),
+    ("gzip", ".gz"),
+)
+FINGERPRINT_LENGTH: int = 12
+REVALIDATE_CACHE_CONTROL: str = "no-cache"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Static files application that serves a `.br` or `.gz` sibling of the
+     requested file when the client accepts that encoding.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """
+        Get the response for a static file, preferring a pre-compressed
+         variant
+        :param path: The requested path relative to the directory
+        :type path: str
+        :param scope: The ASGI scope of the request
+        :type scope: Scope
+        :return: The file response
+        :rtype: Response
+        """
+        encodings: set[str] = accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            if encoding not in encodings:
+                continue
+            try:
+                response: Response = await super().get_response(
+                    f"{path}{suffix}", scope
+                )
+            except HTTPException:
+                continue
+            media_type, _ = mimetypes.guess_type(path)
+            response.headers["Content-Type"] = (
+                media_type or "application/octet-stream"
+            )
+            response.headers["Content-Encoding"] = encoding
+            response.headers["Vary"] = "Accept-Encoding"
+            return response
+        return await super().get_response(path, scope)
+
+
+def fingerprint_name(path: Path, content: bytes) -> str:
+    """
+    Build the content-addressed name of a file, e.g. `logo.<hash>.png`
+    :param path: The path of the file
+    :type path: Path
+    :param content: The content of the file
+    :type content: bytes
+    :return: The fingerprinted file name
+    :rtype: str
+    """
+    digest: str = hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+@dataclass(frozen=True, slots=True)
+class _MemoryAsset:
+    """
+    A static file kept in memory, valid while its stat result matches
+    """
+
+    mtime_ns: int
+    size: int
+    content: bytes
+
+
+class CachedStaticFiles(PrecompressedStaticFiles):
+    """
+    Static files application serving content-hash fingerprinted names with
+     an immutable cache policy, revalidating the plain names with 304
+     responses and keeping small files in memory to skip disk reads.
+    The fingerprint manifest is computed once per process, so assets are
+     expected to change only between deployments.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str,
+        max_age: PositiveInt,
+        memory_max_file_size: NonNegativeInt,
+        memory_max_total_size: NonNegativeInt,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.immutable_cache_control: str = (
+            f"public, max-age={max_age}, immutable"
+        )
+        self.memory_max_file_size: NonNegativeInt = memory_max_file_size
+        self.memory_max_total_size: NonNegativeInt = memory_max_total_size
+        self._memory: dict[str, _MemoryAsset] = {}
+        self._memory_size: int = 0
+
+    @cached_property
+    def fingerprints(self) -> dict[str, str]:
+        """
+        Map each file relative to the directory to its fingerprinted path
+        :return: The original to fingerprinted path mapping
+        :rtype: dict[str, str]
+        """
+        root: Path = Path(str(self.directory))
+        suffixes: tuple[str, ...] = tuple(
+            suffix for _, suffix in PRECOMPRESSED_SUFFIXES
+        )
+        fingerprints: dict[str, str] = {}
+        for path in sorted(root.rglob("*")):
+            if not path.is_file() or path.suffix in suffixes:
+                continue
+            relative: Path = path.relative_to(root)
+            fingerprints[str(relative)] = str(
+                relative.with_name(fingerprint_name(path, path.read_bytes()))
+            )
+        return fingerprints
+
+    @cached_property
+    def _originals(self) -> dict[str, str]:
+        return {
+            fingerprint: original
+            for original, fingerprint in self.fingerprints.items()
+        }
+
+    def url_path(self, path: str) -> str:
+        """
+        Get the fingerprinted path of a file to build long-lived URLs
+        :param path: The file path relative to the directory
+        :type path: str
+        :return: The fingerprinted path, or the path if it is unknown
+        :rtype: str
+        """
+        return self.fingerprints.get(path, path).replace(os.sep, "/")
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """
+        Get the response for a static file, resolving fingerprinted names
+         and setting the cache policy
+        :param path: The requested path relative to the directory
+        :type path: str
+        :param scope: The ASGI scope of the request
+        :type scope: Scope
+        :return: The file response
+        :rtype: Response
+        """
+        original: str | None = self._originals.get(path)
+        response: Response = await super().get_response(original or path, scope)
+        response.headers["Cache-Control"] = (
+            self.immutable_cache_control
+            if original
+            else REVALIDATE_CACHE_CONTROL
+        )
+        return response
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """
+        Build the response of a file, serving small files from memory
+        :param full_path: The path of the file on disk
+        :type full_path: str | os.PathLike[str]
+        :param stat_result: The stat result of the file
+        :type stat_result: os.stat_result
+        :param scope: The ASGI scope of the request
+        :type scope: Scope
+        :param status_code: The status code of the response
+        :type status_code: int
+        :return: The file, in-memory or not modified response
+        :rtype: Response
+        """
+        response: Response = super().file_response(
+            full_path, stat_result, scope, status_code
+        )
+        if (
+            not isinstance(response, FileResponse)
+            or stat_result.st_size > self.memory_max_file_size
+            or "range" in Headers(scope=scope)
+        ):
+            return response
+        return Response(
+            self._read(str(full_path), stat_result),
+            status_code=status_code,
+            headers=response.headers,
+        )
+
+    def _read(self, full_path: str, stat_result: os.stat_result) -> bytes:
+        asset: _MemoryAsset | None = self._memory.get(full_path)
+        if (
+            asset is not None
+            and asset.mtime_ns == stat_result.st_mtime_ns
+            and asset.size == stat_result.st_size
+        ):
+            return asset.content
+        content: bytes = Path(full_path).read_bytes()
+        if asset is not None:
+            self._memory_size -= asset.size
+            del self._memory[full_path]
+        if self._memory_size + len(content) <= self.memory_max_total_size:
+            self._memory[full_path] = _MemoryAsset(
+                stat_result.st_mtime_ns, len(content), content
+            )
+            self._memory_size += len(content)
+        return content
+
+
+@lru_cache
+def get_images_app() -> CachedStaticFiles:
+    """
+    Get the process-wide static files application of the images, shared by
+     the mounted route and the URLs built for the API documentation
+    :return: The images static files application
+    :rtype: CachedStaticFiles
+    """
+    settings: Settings = get_settings()
+    return CachedStaticFiles(
+        directory=get_init_settings().IMAGES_DIRECTORY,
+        max_age=settings.STATIC_MAX_AGE,
+        memory_max_file_size=settings.STATIC_MEMORY_MAX_FILE_SIZE,
+        memory_max_total_size=settings.STATIC_MEMORY_MAX_TOTAL_SIZE,
+    )
+
+
+def get_image_url(image_path: str) -> str:
+    """
+    Get the fingerprinted URL path of an image, cached by clients for as
+     long as its content does not change
+    :param image_path: Path to the image file inside the images directory
+    :type image_path: str
+    :return: The absolute URL path of the image
+    :rtype: str
+    """
+    init_settings: InitSettings = get_init_settings()
+    relative: Path = Path(image_path).relative_to(
+        init_settings.IMAGES_DIRECTORY
+    )
+    return (
+        f"{init_settings.IMAGES_PATH}/"
+        f"{get_images_app().url_path(str(relative))}"
+    )
+
+
+def precompress_directory(
+    directory: str, minimum_size: NonNegativeInt = 0
+) -> list[Path]:
+    """
+    Write `.gz` (and `.br` when brotli is installed) variants next to the
+     files of a directory, keeping only those smaller than the original
+    :param directory: The directory with the static files
+    :type directory: str
+    :param minimum_size: The minimum file size to compress in bytes
+    :type minimum_size: NonNegativeInt
+    :return: The written variant files
+    :rtype: list[Path]
+    """
+    written: list[Path] = []
+    suffixes: tuple[str, ...] = tuple(
+        suffix for _, suffix in PRECOMPRESSED_SUFFIXES
+    )
+    for path in sorted(Path(directory).rglob("*")):
+        if not path.is_file() or path.suffix in suffixes:
+            continue
+        content: bytes = path.read_bytes()
+        if len(content) < minimum_size:
+            continue
+        variants: dict[str, bytes] = {
+            ".gz": gzip.compress(content, compresslevel=9, mtime=0)
+        }
+        if brotli is not None:
+            variants[".br"] = brotli.compress(content)
+        for suffix, compressed in variants.items():
+            target: Path = path.with_name(f"{path.name}{suffix}")
+            if len(compressed) < len(content):
+                target.write_bytes(compressed)
+                written.append(target)
+            else:
+                target.unlink(missing_ok=True)
+    return written
+
+
+def main() -> None:
+    """
+    The main function to pre-compress a directory of static files
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Write the compressed variants of static files"
+    )
+    parser.add_argument("directory", nargs="?", default="assets/images")
+    parser.add_argument("--minimum-size", type=int, default=0)
+    args: argparse.Namespace = parser.parse_args()
+    for variant in precompress_directory(args.directory, args.minimum_size):
+        print(variant)
+
+
+if __name__ == "__main__":
+    main()
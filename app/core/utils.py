@@ -3,6 +3,7 @@ A module for openapi utils in the app.config package.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 import phonenumbers
@@ -11,9 +12,13 @@ from fastapi.openapi.utils import get_openapi
 from fastapi.routing import APIRoute
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
-from app.config.settings import setting
+from app.config.init_settings import init_setting
 from app.core.exceptions import ServiceException
 
+PASSWORD_PATTERN: re.Pattern[str] = re.compile(
+    init_setting.PASSWORD_REGEX, re.DOTALL
+)
+
 
 def remove_tag_from_operation_id(tag: str, operation_id: str) -> str:
     """
@@ -101,6 +106,7 @@ def custom_openapi(app: FastAPI) -> dict[str, Any]:
         summary=app.state.init_settings.SUMMARY,
         description=app.state.init_settings.DESCRIPTION,
         routes=app.routes,
+        tags=app.state.init_settings.TAGS_METADATA,
         servers=[
             {
                 "url": app.state.settings.SERVER_URL,
@@ -125,17 +131,30 @@ def validate_password(password: str | None) -> str:
     """
     if not password:
         raise ServiceException("Password cannot be empty or None")
-    if not (
-        re.search("[A-Z]", password)
-        and re.search("[a-z]", password)
-        and re.search("[0-9]", password)
-        and re.search(setting.DB_USER_PASSWORD_CONSTRAINT, password)
-        and 8 <= len(password) <= 14
-    ):
+    if not PASSWORD_PATTERN.fullmatch(password):
         raise ValueError("Password validation failed")
     return password
 
 
+@lru_cache(maxsize=init_setting.PHONE_NUMBER_CACHE_SIZE)
+def get_phone_number_error(phone_number: str) -> str | None:
+    """
+    Parse and validate a phone number, memoizing the outcome so repeated
+     numbers skip the phonenumbers metadata lookups
+    :param phone_number: The phone number to check
+    :type phone_number: str
+    :return: The validation error message, or None if it is valid
+    :rtype: Optional[str]
+    """
+    try:
+        parsed_number = phonenumbers.parse(phone_number, None)
+    except phonenumbers.phonenumberutil.NumberParseException as exc:
+        return str(exc)
+    if not phonenumbers.is_valid_number(parsed_number):
+        return "Invalid phone number"
+    return None
+
+
 def validate_phone_number(
     phone_number: PhoneNumber | None,
 ) -> PhoneNumber | None:
@@ -148,10 +167,6 @@ def validate_phone_number(
     """
     if phone_number is None:
         return None
-    try:
-        parsed_number = phonenumbers.parse(str(phone_number), None)
-    except phonenumbers.phonenumberutil.NumberParseException as exc:
-        raise ValueError from exc
-    if not phonenumbers.is_valid_number(parsed_number):
-        raise ValueError("Invalid phone number")
+    if error := get_phone_number_error(str(phone_number)):
+        raise ValueError(error)
     return phone_number
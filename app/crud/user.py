@@ -5,20 +5,39 @@ This script handles CRUD (Create, Read, Update, Delete) operations for
 
 import logging
 from datetime import UTC, datetime
-from typing import Any, Sequence
+from functools import lru_cache
+from typing import Any, Iterator, Sequence
 
 from pydantic import NonNegativeInt, PositiveInt
-from sqlalchemy import Row, RowMapping, select
+from sqlalchemy import Row, RowMapping, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.engine import ScalarResult
-from sqlalchemy.exc import NoResultFound, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, NoResultFound, SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import Select
 
-from app.core.exceptions import DatabaseException
+from app.config.settings import Settings, get_settings
+from app.core.cache import (
+    CacheBackend,
+    ReadThroughCache,
+    RedisCacheBackend,
+    TTLLRUCache,
+)
+from app.core.etag import make_etag, parse_etag, split_etags
+from app.core.exceptions import (
+    DatabaseException,
+    NotFoundException,
+    PreconditionFailedException,
+)
 from app.db.session import get_session
 from app.models.user import User
 from app.schemas.user import User as UserSchema
-from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.user import (
+    UserBulkError,
+    UserCreate,
+    UserUpdate,
+    UsersBulkResponse,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -32,8 +51,18 @@ class UserRepository:
     def __init__(
         self,
         session: Session,
+        cache: ReadThroughCache | None = None,
     ):
         self.session: Session = session
+        self.cache: ReadThroughCache | None = cache
+
+    @staticmethod
+    def _cache_key(_id: PositiveInt) -> str:
+        return f"user:v4:{_id}"
+
+    def _invalidate(self, _id: PositiveInt) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_key(_id))
 
     def read_by_id(self, _id: PositiveInt) -> User:
         """
@@ -57,6 +86,76 @@ class UserRepository:
                 raise DatabaseException(str(sa_exc)) from sa_exc
             return db_obj
 
+    @staticmethod
+    def etag(db_user: User) -> str:
+        """
+        Get the ETag of a user from its id and version counter
+        :param db_user: The user from the database
+        :type db_user: User
+        :return: The ETag of the user
+        :rtype: str
+        """
+        return make_etag(db_user.id, db_user.version)
+
+    def read_version(self, _id: PositiveInt) -> str:
+        """
+        Probe the current ETag of a user without loading the full row
+        :param _id: The id of the user
+        :type _id: PositiveInt
+        :return: The ETag of the user
+        :rtype: str
+        """
+        stmt: Select[tuple[int]] = select(User.version).where(User.id == _id)
+        with self.session as session:
+            try:
+                version: int | None = session.scalar(stmt)
+            except SQLAlchemyError as sa_exc:
+                logger.error(sa_exc)
+                raise DatabaseException(str(sa_exc)) from sa_exc
+        if version is None:
+            raise NotFoundException(f"User with id {_id} not found.")
+        return make_etag(_id, version)
+
+    def _load_entry(self, _id: PositiveInt) -> bytes:
+        db_user: User = self.read_by_id(_id)
+        return b"\n".join(
+            (
+                self.etag(db_user).encode(),
+                UserSchema.model_validate(db_user).model_dump_json().encode(),
+            )
+        )
+
+    def read_cached_entry(self, _id: PositiveInt) -> tuple[str, bytes]:
+        """
+        Retrieve the ETag and JSON body of a user through the read-through
+         cache, so conditional requests are answered without decoding it
+        :param _id: The id of the user
+        :type _id: PositiveInt
+        :return: The ETag and the JSON encoded user
+        :rtype: tuple[str, bytes]
+        """
+        entry: bytes = (
+            self._load_entry(_id)
+            if self.cache is None
+            else self.cache.get_or_load(
+                self._cache_key(_id), lambda: self._load_entry(_id)
+            )
+        )
+        etag, _, content = entry.partition(b"\n")
+        return etag.decode(), content
+
+    def read_cached_by_id(self, _id: PositiveInt) -> UserSchema:
+        """
+        Retrieve a user by its id through the read-through cache, falling
+         back to the database on a miss
+        :param _id: The id of the user
+        :type _id: PositiveInt
+        :return: The user with the specified id
+        :rtype: UserSchema
+        """
+        _, content = self.read_cached_entry(_id)
+        return UserSchema.model_validate_json(content)
+
     def read_users(
         self,
         offset: NonNegativeInt,
@@ -85,6 +184,28 @@ class UserRepository:
                 raise DatabaseException(str(sa_exc)) from sa_exc
             return [UserSchema.model_validate(user) for user in users]
 
+    def stream_users(self, batch_size: PositiveInt) -> Iterator[UserSchema]:
+        """
+        Stream every user from the database through a server-side cursor,
+         fetching rows in batches so memory stays constant
+        :param batch_size: The number of rows fetched per round trip
+        :type batch_size: PositiveInt
+        :return: An iterator over all the users ordered by id
+        :rtype: Iterator[UserSchema]
+        """
+        stmt: Select[Any] = (
+            select(*User.__table__.columns)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        with self.session as session:
+            try:
+                for row in session.execute(stmt).mappings():
+                    yield UserSchema.model_validate(row)
+            except SQLAlchemyError as sa_exc:
+                logger.error(sa_exc)
+                raise DatabaseException(str(sa_exc)) from sa_exc
+
     def create_user(
         self,
         user: UserCreate,
@@ -112,7 +233,211 @@ class UserRepository:
             else:
                 raise DatabaseException("User could not be created")
 
-    def update_user(self, _id: PositiveInt, user: UserUpdate) -> User | None:
+    def create_users(
+        self,
+        users: list[UserCreate],
+        chunk_size: PositiveInt,
+    ) -> UsersBulkResponse:
+        """
+        Create many users in the database with one multi-row
+         INSERT ... RETURNING per chunk, all in a single transaction. Users
+         violating a unique or check constraint are reported as errors
+         instead of failing the batch, while any other database error
+         rolls back every chunk.
+        :param users: The users to create
+        :type users: list[UserCreate]
+        :param chunk_size: The maximum number of users per INSERT
+        :type chunk_size: PositiveInt
+        :return: The created users and the errors of the rejected ones
+        :rtype: UsersBulkResponse
+        """
+        created: list[UserSchema] = []
+        errors: list[UserBulkError] = []
+        seen_usernames: set[str] = set()
+        seen_emails: set[str] = set()
+        with self.session as session:
+            for start in range(0, len(users), chunk_size):
+                chunk: list[tuple[int, UserCreate]] = list(
+                    enumerate(users[start : start + chunk_size], start)
+                )
+                try:
+                    candidates: list[tuple[int, UserCreate]] = (
+                        self._reject_duplicates(
+                            session, chunk, seen_usernames, seen_emails, errors
+                        )
+                    )
+                    if candidates:
+                        created.extend(
+                            self._insert_chunk(session, candidates, errors)
+                        )
+                except SQLAlchemyError as sa_exc:
+                    logger.error(sa_exc)
+                    session.rollback()
+                    raise DatabaseException(str(sa_exc)) from sa_exc
+            try:
+                session.commit()
+            except SQLAlchemyError as sa_exc:
+                logger.error(sa_exc)
+                session.rollback()
+                raise DatabaseException(str(sa_exc)) from sa_exc
+        errors.sort(key=lambda error: error.index)
+        return UsersBulkResponse(users=created, errors=errors)
+
+    @staticmethod
+    def _reject_duplicates(
+        session: Session,
+        chunk: list[tuple[int, UserCreate]],
+        seen_usernames: set[str],
+        seen_emails: set[str],
+        errors: list[UserBulkError],
+    ) -> list[tuple[int, UserCreate]]:
+        """
+        Filter out users whose username or email already exists in the
+         database or earlier in the batch, using one query per chunk
+        :param session: The database session
+        :type session: Session
+        :param chunk: The indexed users of the chunk
+        :type chunk: list[tuple[int, UserCreate]]
+        :param seen_usernames: Usernames accepted so far in the batch
+        :type seen_usernames: set[str]
+        :param seen_emails: Emails accepted so far in the batch
+        :type seen_emails: set[str]
+        :param errors: The list collecting the rejected users
+        :type errors: list[UserBulkError]
+        :return: The indexed users that can be inserted
+        :rtype: list[tuple[int, UserCreate]]
+        """
+        usernames: list[str] = [user.username for _, user in chunk]
+        emails: list[str] = [str(user.email) for _, user in chunk]
+        stmt: Select[tuple[str, str]] = select(User.username, User.email).where(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        )
+        existing: Sequence[Row[tuple[str, str]]] = session.execute(stmt).all()
+        existing_usernames: set[str] = {row.username for row in existing}
+        existing_emails: set[str] = {row.email for row in existing}
+        candidates: list[tuple[int, UserCreate]] = []
+        for index, user in chunk:
+            detail: str | None = None
+            if user.username in existing_usernames:
+                detail = "Username already exists"
+            elif user.email in existing_emails:
+                detail = "Email already exists"
+            elif user.username in seen_usernames:
+                detail = "Username is duplicated in the batch"
+            elif user.email in seen_emails:
+                detail = "Email is duplicated in the batch"
+            if detail:
+                errors.append(
+                    UserBulkError(
+                        index=index,
+                        username=user.username,
+                        email=user.email,
+                        detail=detail,
+                    )
+                )
+                continue
+            seen_usernames.add(user.username)
+            seen_emails.add(str(user.email))
+            candidates.append((index, user))
+        return candidates
+
+    def _insert_chunk(
+        self,
+        session: Session,
+        candidates: list[tuple[int, UserCreate]],
+        errors: list[UserBulkError],
+    ) -> list[UserSchema]:
+        """
+        Insert a chunk of users with a single multi-row statement inside a
+         savepoint, falling back to one savepoint per user when a check
+         constraint fails, without committing the transaction
+        :param session: The database session
+        :type session: Session
+        :param candidates: The indexed users to insert
+        :type candidates: list[tuple[int, UserCreate]]
+        :param errors: The list collecting the rejected users
+        :type errors: list[UserBulkError]
+        :return: The created users
+        :rtype: list[UserSchema]
+        """
+        stmt = (
+            insert(User)
+            .values([user.model_dump() for _, user in candidates])
+            .on_conflict_do_nothing()
+            .returning(User)
+        )
+        try:
+            with session.begin_nested():
+                inserted: Sequence[User] = session.scalars(stmt).all()
+        except IntegrityError as exc:
+            logger.warning("Bulk insert failed, retrying per user: %s", exc)
+            return self._insert_one_by_one(session, candidates, errors)
+        inserted_by_username: dict[str, User] = {
+            db_user.username: db_user for db_user in inserted
+        }
+        created: list[UserSchema] = []
+        for index, user in candidates:
+            if db_user := inserted_by_username.get(user.username):
+                created.append(UserSchema.model_validate(db_user))
+            else:
+                errors.append(
+                    UserBulkError(
+                        index=index,
+                        username=user.username,
+                        email=user.email,
+                        detail="Username or email already exists",
+                    )
+                )
+        return created
+
+    @staticmethod
+    def _insert_one_by_one(
+        session: Session,
+        candidates: list[tuple[int, UserCreate]],
+        errors: list[UserBulkError],
+    ) -> list[UserSchema]:
+        """
+        Insert the users of a chunk individually inside savepoints to find
+         the ones violating a constraint
+        :param session: The database session
+        :type session: Session
+        :param candidates: The indexed users to insert
+        :type candidates: list[tuple[int, UserCreate]]
+        :param errors: The list collecting the rejected users
+        :type errors: list[UserBulkError]
+        :return: The created users
+        :rtype: list[UserSchema]
+        """
+        created: list[UserSchema] = []
+        for index, user in candidates:
+            try:
+                with session.begin_nested():
+                    db_user: User = session.scalars(
+                        insert(User).values(user.model_dump()).returning(User)
+                    ).one()
+            except IntegrityError as exc:
+                constraint: str | None = getattr(
+                    getattr(exc.orig, "diag", None), "constraint_name", None
+                )
+                errors.append(
+                    UserBulkError(
+                        index=index,
+                        username=user.username,
+                        email=user.email,
+                        detail=(
+                            f"Constraint {constraint} violated"
+                            if constraint
+                            else "Integrity constraint violated"
+                        ),
+                    )
+                )
+                continue
+            created.append(UserSchema.model_validate(db_user))
+        return created
+
+    def update_user(
+        self, _id: PositiveInt, user: UserUpdate, if_match: str | None = None
+    ) -> User | None:
         """
         Update the information of a user in the database
         :param _id: The id of the user to update
@@ -120,9 +445,14 @@ class UserRepository:
         :param user: An object containing the new information of the
          user
         :type user: UserUpdate
+        :param if_match: The If-Match header value for optimistic
+         concurrency
+        :type if_match: Optional[str]
         :return: The updated user, or None if no such user exists
         :rtype: Optional[User]
         """
+        if if_match is not None:
+            return self._update_if_match(_id, user, if_match)
         with self.session as session:
             try:
                 found_user: User | None = self.read_by_id(_id)
@@ -138,8 +468,10 @@ class UserRepository:
                 if value is not None:
                     setattr(found_user, field, value)
             found_user.updated_at = datetime.now(UTC)
+            found_user.version = User.version + 1
             session.add(found_user)
             session.commit()
+            self._invalidate(_id)
             try:
                 updated_user: User | None = self.read_by_id(_id)
             except DatabaseException as db_exc:
@@ -147,6 +479,58 @@ class UserRepository:
                 raise DatabaseException(str(db_exc)) from db_exc
             return updated_user
 
+    def _update_if_match(
+        self, _id: PositiveInt, user: UserUpdate, if_match: str
+    ) -> User:
+        """
+        Update a user with a single compare-and-set UPDATE ... RETURNING
+         that only applies when its current version matches one of the
+         If-Match entity tags
+        :param _id: The id of the user to update
+        :type _id: PositiveInt
+        :param user: An object containing the new information of the
+         user
+        :type user: UserUpdate
+        :param if_match: The If-Match header value
+        :type if_match: str
+        :return: The updated user
+        :rtype: User
+        """
+        values: dict[str, Any] = {
+            field: value
+            for field, value in user.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        values["updated_at"] = datetime.now(UTC)
+        values["version"] = User.version + 1
+        stmt = update(User).where(User.id == _id).values(values)
+        etags: list[str] = split_etags(if_match)
+        if "*" not in etags:
+            versions: list[int] = [
+                version
+                for etag_id, version in filter(None, map(parse_etag, etags))
+                if etag_id == _id
+            ]
+            stmt = stmt.where(User.version.in_(versions))
+        with self.session as session:
+            try:
+                updated_user: User | None = session.scalars(
+                    stmt.returning(User)
+                ).one_or_none()
+                session.commit()
+            except SQLAlchemyError as sa_exc:
+                logger.error(sa_exc)
+                session.rollback()
+                raise DatabaseException(str(sa_exc)) from sa_exc
+        if updated_user is None:
+            current_etag: str = self.read_version(_id)
+            raise PreconditionFailedException(
+                f"User with id {_id} was modified, current ETag is"
+                f" {current_etag}"
+            )
+        self._invalidate(_id)
+        return updated_user
+
     def delete_user(self, _id: PositiveInt) -> dict[str, Any]:
         """
         Delete a user from the database
@@ -166,6 +550,7 @@ class UserRepository:
                     session.query(User).filter(User.id == _id).delete()
                 )
                 session.commit()
+                self._invalidate(_id)
                 if delete_query == 0:
                     raise NoResultFound(
                         f"No user found with ID: {_id} to delete"
@@ -183,6 +568,34 @@ class UserRepository:
         return {"ok": deleted, "deleted_at": deleted_at}
 
 
+@lru_cache
+def get_user_cache() -> ReadThroughCache | None:
+    """
+    Get the process-wide read-through cache for users based on settings.
+    Invalidations only reach the local tier of the current process, so the
+     local tier uses a short TTL when Redis is configured or several
+     workers serve the application, and updates made by other workers
+     become visible quickly.
+    :return: The user cache, or None if disabled
+    :rtype: Optional[ReadThroughCache]
+    """
+    settings: Settings = get_settings()
+    if not settings.USER_CACHE_ENABLED:
+        return None
+    remote: CacheBackend | None = None
+    local_ttl: PositiveInt = settings.USER_CACHE_TTL
+    if settings.USER_CACHE_REDIS_URL:
+        remote = RedisCacheBackend.from_url(
+            settings.USER_CACHE_REDIS_URL, settings.USER_CACHE_TTL
+        )
+        local_ttl = settings.USER_CACHE_LOCAL_TTL
+    elif settings.SERVER_WORKERS > 1:
+        local_ttl = settings.USER_CACHE_LOCAL_TTL
+    return ReadThroughCache(
+        TTLLRUCache(settings.USER_CACHE_MAXSIZE, local_ttl), remote
+    )
+
+
 def get_user_repository() -> UserRepository:
     """
     Create a UserRepository with a database session, an index
@@ -192,4 +605,5 @@ def get_user_repository() -> UserRepository:
     """
     return UserRepository(
         get_session(),
+        get_user_cache(),
     )
@@ -2,13 +2,26 @@
 Database session script
 """
 
+from functools import lru_cache
+
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session
 
-from app.config.settings import setting
+from app.config.settings import Settings, get_settings
+
 
-url: str = f"{setting.SQLALCHEMY_DATABASE_URI}"
-engine: Engine = create_engine(url, pool_pre_ping=True, future=True, echo=True)
+@lru_cache
+def get_engine() -> Engine:
+    """
+    Get the database engine, created on first use and cached afterward
+    :return: The SQLAlchemy engine for the configured database
+    :rtype: Engine
+    """
+    settings: Settings = get_settings()
+    url: str = f"{settings.SQLALCHEMY_DATABASE_URI}"
+    return create_engine(
+        url, pool_pre_ping=True, future=True, echo=settings.SQLALCHEMY_ECHO
+    )
 
 
 def get_session() -> Session:
@@ -17,5 +30,5 @@ def get_session() -> Session:
     :return session: Session for database connection
     :rtype session: Session
     """
-    with Session(bind=engine, expire_on_commit=False) as session:
+    with Session(bind=get_engine(), expire_on_commit=False) as session:
         return session
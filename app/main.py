@@ -5,30 +5,41 @@ This module sets up the application configuration including database
 """
 
 from functools import partial
+from typing import Any
 
 import uvicorn
 from fastapi import FastAPI, status
 from fastapi.responses import JSONResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
 
 from app.api.api_v1.api import api_router
 from app.config.init_settings import init_setting
 from app.config.settings import setting
 from app.core.lifecycle import lifespan
+from app.core.middleware import CompressionMiddleware
+from app.core.openapi import mount_openapi_cache
+from app.core.responses import PydanticJSONResponse
+from app.core.static import get_images_app
 from app.core.utils import custom_generate_unique_id, custom_openapi
+from app.crud.user import get_user_cache
 
 app: FastAPI = FastAPI(
-    debug=True,
+    debug=setting.SERVER_DEBUG,
     openapi_url=f"{setting.API_V1_STR}{init_setting.OPENAPI_FILE_PATH}",
-    openapi_tags=init_setting.TAGS_METADATA,
     lifespan=lifespan,
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=PydanticJSONResponse,
 )
 app.openapi = partial(custom_openapi, app)  # type: ignore
+mount_openapi_cache(app)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=setting.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=setting.COMPRESSION_LEVEL,
+    brotli_quality=setting.COMPRESSION_BROTLI_QUALITY,
+    content_types=setting.COMPRESSION_CONTENT_TYPES,
+)
 app.mount(
-    init_setting.IMAGES_PATH,
-    StaticFiles(directory=init_setting.IMAGES_DIRECTORY),
-    name=init_setting.IMAGES_APP,
+    init_setting.IMAGES_PATH, get_images_app(), name=init_setting.IMAGES_APP
 )
 app.include_router(api_router, prefix=setting.API_V1_STR)
 
@@ -56,7 +67,10 @@ async def check_health() -> JSONResponse:
     - `return:` **The JSON response**
     - `rtype:` **JSONResponse**
     """
-    return JSONResponse({"status": "healthy"})
+    health: dict[str, Any] = {"status": "healthy"}
+    if user_cache := get_user_cache():
+        health["user_cache"] = user_cache.metrics.snapshot()
+    return JSONResponse(health)
 
 
 if __name__ == "__main__":
@@ -69,6 +69,14 @@ class User(Base):  # type: ignore
         comment="Time the User was updated",
     )
 
+    version: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        default=1,
+        nullable=False,
+        server_default=text("1"),
+        comment="Version of the User, incremented on every update",
+    )
+
     __table_args__ = (
         CheckConstraint(
             "char_length(username) >= 4", name="users_username_length"
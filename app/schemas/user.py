@@ -9,6 +9,7 @@ from pydantic import (
     ConfigDict,
     EmailStr,
     Field,
+    NonNegativeInt,
     PastDate,
     field_validator,
 )
@@ -123,6 +124,20 @@ class User(UserBase):
         max_length=60,
     )
 
+    @field_validator("password", mode="before")
+    def validate_password(cls, v: str | None) -> str:
+        """
+        Keeps the hashed password as stored, since the password policy
+         applies to the plain text submitted by clients only
+        :param v: The hashed password
+        :type v: Optional[str]
+        :return: The hashed password
+        :rtype: str
+        """
+        if v is None:
+            raise ValueError("Hashed password cannot be None")
+        return v
+
 
 class UsersResponse(BaseModel):
     """
@@ -130,3 +145,33 @@ class UsersResponse(BaseModel):
     """
 
     users: list[User]
+
+
+class UserBulkError(BaseModel):
+    """
+    Class representation for a user that could not be created in bulk
+    """
+
+    index: NonNegativeInt = Field(
+        ...,
+        title="Index",
+        description="Position of the user in the submitted list",
+    )
+    username: str = Field(
+        ..., title="Username", description="Username of the rejected user"
+    )
+    email: EmailStr = Field(
+        ..., title="Email", description="E-mail address of the rejected user"
+    )
+    detail: str = Field(
+        ..., title="Detail", description="Reason why the user was rejected"
+    )
+
+
+class UsersBulkResponse(BaseModel):
+    """
+    Class representation for the result of a bulk user creation
+    """
+
+    users: list[User]
+    errors: list[UserBulkError]
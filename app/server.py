@@ -0,0 +1,52 @@
+"""
+A module for server in the app package.
+It launches the application for production with multiple uvicorn worker
+ processes sized from the available CPUs and tuned from the settings.
+Usage:
+    python -m app.server
+"""
+
+import logging
+
+import uvicorn
+from pydantic import PositiveInt
+
+from app.config.settings import Settings, get_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def run(settings: Settings) -> None:
+    """
+    Run the application with uvicorn worker processes. The event loop
+     and HTTP parser resolve to uvloop and httptools when installed.
+    Workers finish in-flight requests within the graceful shutdown timeout
+     and dispose their database pools on the lifespan shutdown.
+    :param settings: The application settings
+    :type settings: Settings
+    :return: None
+    :rtype: NoneType
+    """
+    workers: PositiveInt = settings.SERVER_WORKERS
+    logger.info("Starting %s workers", workers)
+    uvicorn.run(
+        "app.main:app",
+        host=f"{settings.SERVER_HOST}",
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        limit_max_requests=settings.SERVER_LIMIT_MAX_REQUESTS,
+        log_level=settings.SERVER_LOG_LEVEL,
+        access_log=settings.SERVER_ACCESS_LOG,
+        proxy_headers=True,
+        server_header=False,
+    )
+
+
+if __name__ == "__main__":
+    run(get_settings())
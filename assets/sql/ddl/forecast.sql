@@ -0,0 +1,164 @@
+CREATE TABLE forecast (
+    id SERIAL PRIMARY KEY,
+    location VARCHAR(50) NOT NULL,
+    issued_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    lat FLOAT,
+    lon FLOAT,
+    timezone VARCHAR(50),
+    created_by VARCHAR(50) NOT NULL DEFAULT current_user,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
+    updated_by VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT forecast_location_issued_at_key UNIQUE (location, issued_at),
+    CONSTRAINT forecast_created_by_check CHECK (created_at <= CURRENT_TIMESTAMP),
+    CONSTRAINT forecast_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
+);
+
+CREATE INDEX ix_forecast_location ON forecast (location);
+
+COMMENT ON TABLE forecast IS 'Table storing one row per forecast response of a location';
+COMMENT ON COLUMN forecast.id IS 'ID of the table';
+COMMENT ON COLUMN forecast.location IS 'Weather station the forecast was requested for';
+COMMENT ON COLUMN forecast.issued_at IS 'Time of the current conditions of the response';
+COMMENT ON COLUMN forecast.lat IS 'Latitude of the forecast';
+COMMENT ON COLUMN forecast.lon IS 'Longitude of the forecast';
+COMMENT ON COLUMN forecast.timezone IS 'Timezone name of the location';
+COMMENT ON COLUMN forecast.created_by IS 'User that created the record';
+COMMENT ON COLUMN forecast.created_at IS 'Datetime when the record was created';
+COMMENT ON COLUMN forecast.updated_by IS 'Last user that updated the record';
+COMMENT ON COLUMN forecast.updated_at IS 'Last timestamp when the record was updated';
+
+CREATE TABLE forecast_minutely (
+    id SERIAL PRIMARY KEY,
+    forecast_id INTEGER NOT NULL REFERENCES forecast (id) ON DELETE CASCADE,
+    dt TIMESTAMP WITH TIME ZONE NOT NULL,
+    precipitation FLOAT,
+    created_by VARCHAR(50) NOT NULL DEFAULT current_user,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
+    updated_by VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT forecast_minutely_forecast_id_dt_key UNIQUE (forecast_id, dt),
+    CONSTRAINT forecast_minutely_created_by_check CHECK (created_at <= CURRENT_TIMESTAMP),
+    CONSTRAINT forecast_minutely_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
+);
+
+COMMENT ON TABLE forecast_minutely IS 'Table storing the minute forecast for the next hour';
+COMMENT ON COLUMN forecast_minutely.forecast_id IS 'Forecast the row belongs to';
+COMMENT ON COLUMN forecast_minutely.dt IS 'Time of the forecasted minute';
+COMMENT ON COLUMN forecast_minutely.precipitation IS 'Precipitation in millimeters per hour';
+
+CREATE TABLE forecast_hourly (
+    id SERIAL PRIMARY KEY,
+    forecast_id INTEGER NOT NULL REFERENCES forecast (id) ON DELETE CASCADE,
+    dt TIMESTAMP WITH TIME ZONE NOT NULL,
+    temp FLOAT,
+    feels_like FLOAT,
+    pressure INTEGER,
+    humidity INTEGER,
+    dew_point FLOAT,
+    uvi FLOAT,
+    clouds INTEGER,
+    visibility INTEGER,
+    wind_speed FLOAT,
+    wind_deg INTEGER,
+    wind_gust FLOAT,
+    pop FLOAT,
+    weather_description VARCHAR,
+    created_by VARCHAR(50) NOT NULL DEFAULT current_user,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
+    updated_by VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT forecast_hourly_forecast_id_dt_key UNIQUE (forecast_id, dt),
+    CONSTRAINT forecast_hourly_created_by_check CHECK (created_at <= CURRENT_TIMESTAMP),
+    CONSTRAINT forecast_hourly_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
+);
+
+COMMENT ON TABLE forecast_hourly IS 'Table storing the hourly forecast for the next 48 hours';
+COMMENT ON COLUMN forecast_hourly.forecast_id IS 'Forecast the row belongs to';
+COMMENT ON COLUMN forecast_hourly.dt IS 'Time of the forecasted hour';
+COMMENT ON COLUMN forecast_hourly.temp IS 'Temperature';
+COMMENT ON COLUMN forecast_hourly.feels_like IS 'Temperature accounting for the human perception';
+COMMENT ON COLUMN forecast_hourly.pressure IS 'Atmospheric pressure on the sea level in hPa';
+COMMENT ON COLUMN forecast_hourly.humidity IS 'Humidity percentage';
+COMMENT ON COLUMN forecast_hourly.dew_point IS 'Dew point temperature';
+COMMENT ON COLUMN forecast_hourly.uvi IS 'UV index';
+COMMENT ON COLUMN forecast_hourly.clouds IS 'Cloudiness percentage';
+COMMENT ON COLUMN forecast_hourly.visibility IS 'Average visibility in meters';
+COMMENT ON COLUMN forecast_hourly.wind_speed IS 'Wind speed';
+COMMENT ON COLUMN forecast_hourly.wind_deg IS 'Wind direction in meteorological degrees';
+COMMENT ON COLUMN forecast_hourly.wind_gust IS 'Wind gust';
+COMMENT ON COLUMN forecast_hourly.pop IS 'Probability of precipitation';
+COMMENT ON COLUMN forecast_hourly.weather_description IS 'Weather condition description';
+
+CREATE TABLE forecast_daily (
+    id SERIAL PRIMARY KEY,
+    forecast_id INTEGER NOT NULL REFERENCES forecast (id) ON DELETE CASCADE,
+    dt TIMESTAMP WITH TIME ZONE NOT NULL,
+    summary TEXT,
+    temp_min FLOAT,
+    temp_max FLOAT,
+    temp_day FLOAT,
+    temp_night FLOAT,
+    pressure INTEGER,
+    humidity INTEGER,
+    wind_speed FLOAT,
+    wind_deg INTEGER,
+    clouds INTEGER,
+    pop FLOAT,
+    rain FLOAT,
+    uvi FLOAT,
+    weather_description VARCHAR,
+    created_by VARCHAR(50) NOT NULL DEFAULT current_user,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
+    updated_by VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT forecast_daily_forecast_id_dt_key UNIQUE (forecast_id, dt),
+    CONSTRAINT forecast_daily_created_by_check CHECK (created_at <= CURRENT_TIMESTAMP),
+    CONSTRAINT forecast_daily_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
+);
+
+COMMENT ON TABLE forecast_daily IS 'Table storing the daily forecast for the next 8 days';
+COMMENT ON COLUMN forecast_daily.forecast_id IS 'Forecast the row belongs to';
+COMMENT ON COLUMN forecast_daily.dt IS 'Time of the forecasted day';
+COMMENT ON COLUMN forecast_daily.summary IS 'Human-readable description of the day';
+COMMENT ON COLUMN forecast_daily.temp_min IS 'Minimum daily temperature';
+COMMENT ON COLUMN forecast_daily.temp_max IS 'Maximum daily temperature';
+COMMENT ON COLUMN forecast_daily.temp_day IS 'Day temperature';
+COMMENT ON COLUMN forecast_daily.temp_night IS 'Night temperature';
+COMMENT ON COLUMN forecast_daily.pressure IS 'Atmospheric pressure on the sea level in hPa';
+COMMENT ON COLUMN forecast_daily.humidity IS 'Humidity percentage';
+COMMENT ON COLUMN forecast_daily.wind_speed IS 'Wind speed';
+COMMENT ON COLUMN forecast_daily.wind_deg IS 'Wind direction in meteorological degrees';
+COMMENT ON COLUMN forecast_daily.clouds IS 'Cloudiness percentage';
+COMMENT ON COLUMN forecast_daily.pop IS 'Probability of precipitation';
+COMMENT ON COLUMN forecast_daily.rain IS 'Precipitation volume in millimeters';
+COMMENT ON COLUMN forecast_daily.uvi IS 'Maximum UV index of the day';
+COMMENT ON COLUMN forecast_daily.weather_description IS 'Weather condition description';
+
+CREATE TABLE forecast_alert (
+    id SERIAL PRIMARY KEY,
+    forecast_id INTEGER NOT NULL REFERENCES forecast (id) ON DELETE CASCADE,
+    sender_name VARCHAR,
+    event VARCHAR,
+    starts_at TIMESTAMP WITH TIME ZONE,
+    ends_at TIMESTAMP WITH TIME ZONE,
+    description TEXT,
+    tags VARCHAR[],
+    created_by VARCHAR(50) NOT NULL DEFAULT current_user,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
+    updated_by VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT forecast_alert_created_by_check CHECK (created_at <= CURRENT_TIMESTAMP),
+    CONSTRAINT forecast_alert_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
+);
+
+CREATE INDEX ix_forecast_alert_forecast_id ON forecast_alert (forecast_id);
+
+COMMENT ON TABLE forecast_alert IS 'Table storing the national weather alerts of a forecast';
+COMMENT ON COLUMN forecast_alert.forecast_id IS 'Forecast the row belongs to';
+COMMENT ON COLUMN forecast_alert.sender_name IS 'Name of the alert source';
+COMMENT ON COLUMN forecast_alert.event IS 'Alert event name';
+COMMENT ON COLUMN forecast_alert.starts_at IS 'Start of the alert';
+COMMENT ON COLUMN forecast_alert.ends_at IS 'End of the alert';
+COMMENT ON COLUMN forecast_alert.description IS 'Description of the alert';
+COMMENT ON COLUMN forecast_alert.tags IS 'Types of severe weather';
@@ -1,6 +1,7 @@
 CREATE TABLE weather (
     id SERIAL PRIMARY KEY,
-    date DATE NOT NULL UNIQUE,
+    date DATE NOT NULL,
+    location VARCHAR(50) NOT NULL,
     min_temp FLOAT,
     max_temp FLOAT,
     rainfall FLOAT,
@@ -15,6 +16,7 @@ CREATE TABLE weather (
     created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT current_timestamp,
     updated_by VARCHAR(50),
     updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT weather_date_location_key UNIQUE (date, location),
 	CONSTRAINT weather_date_check CHECK (date <= CURRENT_DATE),
     CONSTRAINT weather_min_max_temp_check CHECK (min_temp <= max_temp),
     CONSTRAINT weather_temp_9am_range_check CHECK (temp_9am BETWEEN -273.15 AND 100.0),
@@ -27,9 +29,13 @@ CREATE TABLE weather (
     CONSTRAINT weather_updated_by_check CHECK (updated_at IS NULL OR updated_at <= CURRENT_TIMESTAMP)
 );
 
+CREATE INDEX ix_weather_date ON weather (date);
+CREATE INDEX ix_weather_location ON weather (location);
+
 COMMENT ON TABLE weather IS 'Table storing weather data including historical and current weather details';
 COMMENT ON COLUMN weather.id IS 'ID of the table';
 COMMENT ON COLUMN weather.date IS 'Date for the record about the weather';
+COMMENT ON COLUMN weather.location IS 'Weather station of the record';
 COMMENT ON COLUMN weather.min_temp IS 'Minimum temperature of the day';
 COMMENT ON COLUMN weather.max_temp IS 'Maximum temperature of the day';
 COMMENT ON COLUMN weather.rainfall IS 'Rainfall in millimeters';
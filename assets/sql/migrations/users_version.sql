@@ -0,0 +1,12 @@
+-- Migrate a users table created before updates were versioned: add the
+-- version counter the ETags and If-Match compare-and-set updates use.
+BEGIN;
+
+-- Existing rows start at the first version.
+ALTER TABLE users
+    ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+COMMENT ON COLUMN users.version IS
+    'Version of the User, incremented on every update';
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- Migrate a weather table created before records were keyed by station:
+-- add the location column, move uniqueness from date to (date, location)
+-- and index the location.
+BEGIN;
+
+ALTER TABLE weather ADD COLUMN IF NOT EXISTS location VARCHAR(50);
+
+-- Rows loaded before this change carry no station. They are marked for
+-- review, as upserts keyed on (date, location) no longer match them.
+UPDATE weather SET location = 'Unknown' WHERE location IS NULL;
+ALTER TABLE weather ALTER COLUMN location SET NOT NULL;
+
+ALTER TABLE weather DROP CONSTRAINT IF EXISTS weather_date_key;
+ALTER TABLE weather DROP CONSTRAINT IF EXISTS weather_date_location_key;
+ALTER TABLE weather
+    ADD CONSTRAINT weather_date_location_key UNIQUE (date, location);
+
+CREATE INDEX IF NOT EXISTS ix_weather_date ON weather (date);
+CREATE INDEX IF NOT EXISTS ix_weather_location ON weather (location);
+
+COMMENT ON COLUMN weather.location IS 'Weather station of the record';
+
+COMMIT;
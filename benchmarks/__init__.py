@@ -0,0 +1,3 @@
+"""
+Package benchmarks initialization.
+"""
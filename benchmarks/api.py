@@ -0,0 +1,378 @@
+"""
+A module for api in the benchmarks package.
+It load-tests the user API in-process through its ASGI interface against
+ the configured PostgreSQL database, reporting throughput and latency
+ percentiles per scenario and flagging regressions against a baseline.
+Point the POSTGRES_* settings to a scratch database: the benchmark
+ creates the users table if needed and removes the rows it inserts.
+Usage:
+    python -m benchmarks.api --requests 500 --concurrency 16 \
+        --output cache/benchmarks/api.json --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+import httpx
+from pydantic import NonNegativeInt, PositiveInt
+from sqlalchemy import Engine, delete, insert, select
+
+from app.config.settings import setting
+from app.db.base import Base
+from app.db.session import get_engine
+from app.main import app
+from app.models.user import User
+
+USER_PATH: str = f"{setting.API_V1_STR}/user"
+PREFIX: str = "bench"
+SCENARIOS: tuple[str, ...] = ("list", "get", "create", "update", "delete")
+SEED: int = 42
+PASSWORD: str = "Hk7pH9*35Fu&3U"
+HASHED_PASSWORD: str = "$2b$12$" + "x" * 53
+
+RequestFactory = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measurements of a single benchmark scenario
+    """
+
+    requests: NonNegativeInt
+    errors: NonNegativeInt
+    throughput_rps: float
+    latency_ms: dict[str, float]
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+
+def seed_users(engine: Engine, count: PositiveInt) -> list[PositiveInt]:
+    """
+    Insert the users the read, update and delete scenarios work on
+    :param engine: The database engine
+    :type engine: Engine
+    :param count: The number of users to insert
+    :type count: PositiveInt
+    :return: The ids of the inserted users
+    :rtype: list[PositiveInt]
+    """
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    rows: list[dict[str, Any]] = [
+        {
+            "username": f"{PREFIX}{index:07d}",
+            "email": f"{PREFIX}{index:07d}@example.com",
+            "password": HASHED_PASSWORD,
+        }
+        for index in range(count)
+    ]
+    with engine.begin() as connection:
+        connection.execute(delete(User).where(User.username.startswith(PREFIX)))
+        connection.execute(insert(User), rows)
+        return list(
+            connection.scalars(
+                select(User.id)
+                .where(User.username.startswith(PREFIX))
+                .order_by(User.id)
+            )
+        )
+
+
+def remove_users(engine: Engine) -> None:
+    """
+    Remove every user inserted by the benchmark
+    :param engine: The database engine
+    :type engine: Engine
+    :return: None
+    :rtype: NoneType
+    """
+    with engine.begin() as connection:
+        connection.execute(delete(User).where(User.username.startswith(PREFIX)))
+
+
+def _list_users(
+    skip: NonNegativeInt, client: httpx.AsyncClient
+) -> Awaitable[httpx.Response]:
+    return client.get(USER_PATH, params={"skip": skip, "limit": 100})
+
+
+def _get_user(
+    user_id: PositiveInt, client: httpx.AsyncClient
+) -> Awaitable[httpx.Response]:
+    return client.get(f"{USER_PATH}/{user_id}")
+
+
+def _create_user(
+    username: str, client: httpx.AsyncClient
+) -> Awaitable[httpx.Response]:
+    return client.post(
+        USER_PATH,
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": PASSWORD,
+        },
+    )
+
+
+def _update_user(
+    user_id: PositiveInt, client: httpx.AsyncClient
+) -> Awaitable[httpx.Response]:
+    return client.put(
+        f"{USER_PATH}/{user_id}", json={"birthdate": "2000-01-01"}
+    )
+
+
+def _delete_user(
+    user_id: PositiveInt, client: httpx.AsyncClient
+) -> Awaitable[httpx.Response]:
+    return client.delete(f"{USER_PATH}/{user_id}")
+
+
+def build_requests(
+    scenario: str, user_ids: list[PositiveInt], count: PositiveInt
+) -> Iterator[RequestFactory]:
+    """
+    Build the requests of a scenario
+    :param scenario: The name of the scenario
+    :type scenario: str
+    :param user_ids: The ids of the seeded users
+    :type user_ids: list[PositiveInt]
+    :param count: The number of requests
+    :type count: PositiveInt
+    :return: The request factories
+    :rtype: Iterator[RequestFactory]
+    """
+    randomizer: random.Random = random.Random(SEED)
+    for index in range(count):
+        user_id: PositiveInt = randomizer.choice(user_ids)
+        if scenario == "list":
+            skip: int = randomizer.randrange(max(len(user_ids) - 100, 1))
+            yield partial(_list_users, skip)
+        elif scenario == "get":
+            yield partial(_get_user, user_id)
+        elif scenario == "create":
+            yield partial(_create_user, f"{PREFIX}n{index:07d}")
+        elif scenario == "update":
+            yield partial(_update_user, user_id)
+        else:
+            yield partial(_delete_user, user_ids[index])
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    factories: Iterator[RequestFactory],
+    concurrency: PositiveInt,
+) -> ScenarioResult:
+    """
+    Send the requests of a scenario with a fixed number of concurrent
+     clients and measure them
+    :param client: The HTTP client bound to the application
+    :type client: httpx.AsyncClient
+    :param factories: The request factories of the scenario
+    :type factories: Iterator[RequestFactory]
+    :param concurrency: The number of concurrent clients
+    :type concurrency: PositiveInt
+    :return: The measurements of the scenario
+    :rtype: ScenarioResult
+    """
+    latencies: list[float] = []
+    status_codes: Counter[str] = Counter()
+
+    async def worker() -> None:
+        for factory in factories:
+            start: float = time.perf_counter()
+            try:
+                status_code: str = str((await factory(client)).status_code)
+            except httpx.HTTPError as exc:
+                status_code = type(exc).__name__
+            latencies.append((time.perf_counter() - start) * 1000)
+            status_codes[status_code] += 1
+
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed: float = time.perf_counter() - started
+    percentiles: list[float] = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else latencies * 99
+    )
+    return ScenarioResult(
+        requests=len(latencies),
+        errors=sum(
+            count
+            for status_code, count in status_codes.items()
+            if not status_code.startswith("2")
+        ),
+        throughput_rps=round(len(latencies) / elapsed, 2),
+        latency_ms={
+            "mean": round(statistics.fmean(latencies), 3),
+            "p50": round(percentiles[49], 3),
+            "p95": round(percentiles[94], 3),
+            "p99": round(percentiles[98], 3),
+            "max": round(max(latencies), 3),
+        },
+        status_codes=dict(sorted(status_codes.items())),
+    )
+
+
+async def run_benchmark(
+    scenarios: list[str],
+    requests: PositiveInt,
+    concurrency: PositiveInt,
+    user_ids: list[PositiveInt],
+) -> dict[str, ScenarioResult]:
+    """
+    Run the scenarios in order inside the application lifespan
+    :param scenarios: The names of the scenarios to run, deletes last
+    :type scenarios: list[str]
+    :param requests: The number of requests per scenario
+    :type requests: PositiveInt
+    :param concurrency: The number of concurrent clients
+    :type concurrency: PositiveInt
+    :param user_ids: The ids of the seeded users
+    :type user_ids: list[PositiveInt]
+    :return: The measurements per scenario
+    :rtype: dict[str, ScenarioResult]
+    """
+    results: dict[str, ScenarioResult] = {}
+    transport: httpx.ASGITransport = httpx.ASGITransport(
+        app=app, raise_app_exceptions=False
+    )
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for scenario in scenarios:
+                results[scenario] = await run_scenario(
+                    client,
+                    build_requests(scenario, user_ids, requests),
+                    concurrency,
+                )
+    return results
+
+
+def find_regressions(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Compare the results with a baseline run
+    :param results: The scenarios of the current run
+    :type results: dict[str, Any]
+    :param baseline: The scenarios of the baseline run
+    :type baseline: dict[str, Any]
+    :param tolerance: The allowed relative degradation, e.g. 0.1
+    :type tolerance: float
+    :return: The description of every regression found
+    :rtype: list[str]
+    """
+    regressions: list[str] = []
+    for scenario, current in results.items():
+        if not (previous := baseline.get(scenario)):
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (
+            1 - tolerance
+        ):
+            regressions.append(
+                f"{scenario}: throughput {current['throughput_rps']} rps"
+                f" < baseline {previous['throughput_rps']} rps"
+            )
+        for percentile in ("p50", "p95", "p99"):
+            if current["latency_ms"][percentile] > previous["latency_ms"][
+                percentile
+            ] * (1 + tolerance):
+                regressions.append(
+                    f"{scenario}: {percentile}"
+                    f" {current['latency_ms'][percentile]} ms > baseline"
+                    f" {previous['latency_ms'][percentile]} ms"
+                )
+        if current["errors"] / max(current["requests"], 1) > previous[
+            "errors"
+        ] / max(previous["requests"], 1):
+            regressions.append(
+                f"{scenario}: error rate increased to"
+                f" {current['errors']}/{current['requests']}"
+            )
+    return regressions
+
+
+def main() -> None:
+    """
+    The main function to run the user API benchmark
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark the user API against the configured database"
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", help="Path to write the JSON results")
+    parser.add_argument("--baseline", help="Path of a previous JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args: argparse.Namespace = parser.parse_args()
+    engine: Engine = get_engine()
+    engine.echo = False
+    user_ids: list[PositiveInt] = seed_users(engine, max(args.requests, 100))
+    try:
+        scenarios: dict[str, ScenarioResult] = asyncio.run(
+            run_benchmark(
+                [name for name in SCENARIOS if name in args.scenarios],
+                args.requests,
+                args.concurrency,
+                user_ids,
+            )
+        )
+    finally:
+        remove_users(engine)
+    report: dict[str, Any] = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "scenarios": {
+            name: asdict(result) for name, result in scenarios.items()
+        },
+    }
+    print(
+        f"{'scenario':<10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}"
+    )
+    for name, result in scenarios.items():
+        print(
+            f"{name:<10}{result.throughput_rps:>10.1f}"
+            f"{result.latency_ms['p50']:>10.2f}"
+            f"{result.latency_ms['p95']:>10.2f}"
+            f"{result.latency_ms['p99']:>10.2f}{result.errors:>8}"
+        )
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(
+            json.dumps(report, indent=2), encoding="utf-8"
+        )
+    if args.baseline:
+        baseline: dict[str, Any] = json.loads(
+            Path(args.baseline).read_text(encoding="utf-8")
+        )
+        if regressions := find_regressions(
+            report["scenarios"], baseline["scenarios"], args.tolerance
+        ):
+            sys.exit("Regressions found:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+A module for etl in the benchmarks package.
+It times the pipeline stages (`extract_csv_data`, `transform_batch` and
+ `load_batch`) on synthetic weatherAUS files of several sizes, reporting
+ rows per second and the peak resident memory of each run. Every size
+ runs in a fresh process so peak memory is not shared between sizes.
+The extraction is timed twice against an empty temporary CSV cache: cold,
+ parsing and validating the file and writing the cache, then warm,
+ reading the rows back from the cache.
+The load stage writes to the configured PostgreSQL database and is capped
+ with --load-rows.
+Usage:
+    python -m benchmarks.etl --sizes 10000 1000000 10000000 \
+        --output cache/benchmarks/etl.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, TypeVar, cast
+
+from pydantic import NonNegativeInt
+
+from benchmarks.weather_data import (
+    LOCATIONS,
+    SEED,
+    build_onecall_payload,
+    write_weather_csv,
+)
+
+R = TypeVar("R")
+
+
+def get_peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of the current process
+    :return: The peak memory in megabytes
+    :rtype: float
+    """
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024**2 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(
+    stage: str, rows: NonNegativeInt, func: Callable[[], R]
+) -> tuple[R, dict[str, Any]]:
+    """
+    Run a stage and measure its duration and the peak memory so far
+    :param stage: The name of the stage
+    :type stage: str
+    :param rows: The number of rows the stage processes
+    :type rows: NonNegativeInt
+    :param func: The stage to run
+    :type func: Callable[[], R]
+    :return: The result of the stage and its measurements
+    :rtype: tuple[R, dict[str, Any]]
+    """
+    start: float = time.perf_counter()
+    result: R = func()
+    elapsed: float = time.perf_counter() - start
+    return result, {
+        "stage": stage,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        "peak_rss_mb": get_peak_rss_mb(),
+    }
+
+
+def count_rows(path: str) -> NonNegativeInt:
+    """
+    Count the data rows of a CSV file, excluding the header
+    :param path: The path of the CSV file
+    :type path: str
+    :return: The number of data rows
+    :rtype: NonNegativeInt
+    """
+    with open(path, "rb") as file:
+        return sum(1 for _ in file) - 1
+
+
+def run_stages(
+    path: str, load_rows: NonNegativeInt, seed: int
+) -> list[dict[str, Any]]:
+    """
+    Run the pipeline stages on a CSV file. It is executed in a child
+     process, so the pipeline modules are imported there.
+    :param path: The path of the CSV file
+    :type path: str
+    :param load_rows: The number of transformed rows to load
+    :type load_rows: NonNegativeInt
+    :param seed: The seed of the API payload generator
+    :type seed: int
+    :return: The measurements of every stage
+    :rtype: list[dict[str, Any]]
+    """
+    from sqlalchemy import Table
+
+    from pipeline.config.init_settings import InitSettings, init_settings
+    from pipeline.config.settings import settings
+    from pipeline.db.session import engine, get_db
+    from pipeline.engineering.extraction import (
+        extract_csv_data,
+        extract_stations,
+    )
+    from pipeline.engineering.loading import load_batch
+    from pipeline.engineering.transformation import transform_batch
+    from pipeline.models.base.base import Base
+    from pipeline.models.weather import Weather
+    from pipeline.schemas.api.weather import APIWeather
+    from pipeline.schemas.files.weather import CSVWeather
+
+    results: list[dict[str, Any]] = []
+    csv_weather: list[CSVWeather] = []
+    rows: NonNegativeInt = count_rows(path)
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        open(os.devnull, "w", encoding="utf-8") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        cache_settings: InitSettings = init_settings.model_copy(
+            update={"CSV_CACHE_ENABLED": True, "CSV_CACHE_DIR": cache_dir}
+        )
+        for stage in ("extract_csv_data_cold", "extract_csv_data_warm"):
+            csv_weather, result = measure(
+                stage,
+                rows,
+                lambda: extract_csv_data(Path(path), cache_settings),
+            )
+            result["valid_rows"] = len(csv_weather)
+            results.append(result)
+    api_weather: dict[str, APIWeather] = {
+        location: APIWeather.model_validate(
+            build_onecall_payload(
+                random.Random(f"{seed}:{location}"), station.lat, station.lon
+            )
+        )
+        for location, station in extract_stations(
+            Path("pipeline") / init_settings.STATIONS_FILE, init_settings
+        ).items()
+    }
+    weather: list[Weather]
+    weather, result = measure(
+        "transform_batch",
+        len(csv_weather),
+        lambda: transform_batch(csv_weather, api_weather),
+    )
+    results.append(result)
+    if load_rows:
+        engine.echo = False
+        Base.metadata.create_all(
+            engine, tables=[cast(Table, Weather.__table__)]
+        )
+
+        def load() -> int:
+            with get_db() as session:
+                loaded: int = load_batch(
+                    session, weather[:load_rows], settings.LOAD_BATCH_SIZE
+                )
+            return loaded
+
+        _, result = measure("load_batch", min(load_rows, len(weather)), load)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """
+    The main function to run the pipeline benchmark
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark the pipeline stages on synthetic data"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000])
+    parser.add_argument("--locations", type=int, default=len(LOCATIONS))
+    parser.add_argument("--malformed-ratio", type=float, default=0.01)
+    parser.add_argument("--load-rows", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--data-dir", default="cache/benchmarks/data")
+    parser.add_argument("--output", help="Path to write the JSON results")
+    args: argparse.Namespace = parser.parse_args()
+    report: dict[str, Any] = {
+        "locations": args.locations,
+        "malformed_ratio": args.malformed_ratio,
+        "seed": args.seed,
+        "sizes": {},
+    }
+    print(
+        f"{'rows':>10} {'stage':<24}{'seconds':>10}{'rows/s':>12}"
+        f"{'peak MB':>10}"
+    )
+    for size in args.sizes:
+        path: Path = (
+            Path(args.data_dir)
+            / f"weatherAUS-{size}-{args.locations}-{args.malformed_ratio}"
+            f"-{args.seed}.csv"
+        )
+        if not path.exists():
+            write_weather_csv(
+                path, size, args.locations, args.malformed_ratio, args.seed
+            )
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as executor:
+            stages: list[dict[str, Any]] = executor.submit(
+                run_stages, str(path), args.load_rows, args.seed
+            ).result()
+        report["sizes"][str(size)] = stages
+        for stage in stages:
+            print(
+                f"{size:>10} {stage['stage']:<24}{stage['seconds']:>10.2f}"
+                f"{stage['rows_per_second'] or 0:>12.0f}"
+                f"{stage['peak_rss_mb']:>10.1f}"
+            )
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(
+            json.dumps(report, indent=2), encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+A module for import time in the benchmarks package.
+It runs `python -X importtime` on a module in a fresh interpreter, reports
+ the slowest imports and fails when the cold start exceeds a fixed budget.
+Usage:
+    python -m benchmarks.import_time app.main --budget-ms 2000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+
+from pydantic import NonNegativeInt, PositiveInt
+
+DEFAULT_MODULE: str = "app.main"
+DEFAULT_BUDGET_MS: PositiveInt = 2000
+IMPORT_TIME_PREFIX: str = "import time:"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """
+    Timing of a single imported module as reported by the interpreter
+    """
+
+    module: str
+    self_us: NonNegativeInt
+    cumulative_us: NonNegativeInt
+
+
+def parse_import_times(stderr: str) -> list[ImportTiming]:
+    """
+    Parse the output of `python -X importtime`
+    :param stderr: The standard error output of the interpreter
+    :type stderr: str
+    :return: The timings of every imported module
+    :rtype: list[ImportTiming]
+    """
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line.removeprefix(
+            IMPORT_TIME_PREFIX
+        ).split("|")
+        if not self_us.strip().isdigit():
+            continue
+        timings.append(
+            ImportTiming(
+                module=module.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return timings
+
+
+def measure_import_time(module: str) -> list[ImportTiming]:
+    """
+    Import a module in a fresh interpreter and collect its import times
+    :param module: The dotted name of the module to import
+    :type module: str
+    :return: The timings of every imported module
+    :rtype: list[ImportTiming]
+    """
+    completed: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Importing {module} failed:\n{completed.stderr[-2000:]}"
+        )
+    return parse_import_times(completed.stderr)
+
+
+def build_report(
+    module: str,
+    timings: list[ImportTiming],
+    budget_ms: PositiveInt,
+    top: PositiveInt,
+) -> dict[str, object]:
+    """
+    Build the import time budget report for a module
+    :param module: The dotted name of the measured module
+    :type module: str
+    :param timings: The timings of every imported module
+    :type timings: list[ImportTiming]
+    :param budget_ms: The maximum cold start time allowed in milliseconds
+    :type budget_ms: PositiveInt
+    :param top: The number of slowest modules to include
+    :type top: PositiveInt
+    :return: The report as a JSON serializable dictionary
+    :rtype: dict[str, object]
+    """
+    total_us: int = next(
+        (t.cumulative_us for t in timings if t.module == module),
+        sum(t.self_us for t in timings),
+    )
+    slowest: list[ImportTiming] = sorted(
+        timings, key=lambda t: t.self_us, reverse=True
+    )[:top]
+    return {
+        "module": module,
+        "total_ms": round(total_us / 1000, 2),
+        "budget_ms": budget_ms,
+        "within_budget": total_us / 1000 <= budget_ms,
+        "modules_imported": len(timings),
+        "slowest": [asdict(timing) for timing in slowest],
+    }
+
+
+def main() -> None:
+    """
+    The main function to report the import time budget
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Report the cold import time of a module"
+    )
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=int, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="Path to write the JSON report")
+    args: argparse.Namespace = parser.parse_args()
+    report: dict[str, object] = build_report(
+        args.module,
+        measure_import_time(args.module),
+        args.budget_ms,
+        args.top,
+    )
+    serialized: str = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(serialized)
+    print(serialized)
+    if not report["within_budget"]:
+        sys.exit(
+            f"Import of {args.module} took {report['total_ms']} ms, over the"
+            f" {args.budget_ms} ms budget"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+A module for openweather stub in the benchmarks package.
+It serves OpenWeather One Call 3.0 compatible payloads from a local HTTP
+ server with configurable latency, latency tail, payload size and 429/5xx
+ injection, so `WeatherApiService`, its retry adapter, rate limiter and
+ circuit breaker can be exercised offline and deterministically.
+Usage:
+    python -m benchmarks.openweather_stub --port 8089 --latency-ms 50 \
+        --rate-limit-ratio 0.05 --server-error-ratio 0.02
+    python -m benchmarks.openweather_stub --benchmark 200
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import NonNegativeInt, PositiveInt
+
+from benchmarks.weather_data import SEED, build_onecall_payload
+
+ONECALL_PATH: str = "/data/3.0/onecall"
+SERVER_ERRORS: tuple[HTTPStatus, ...] = (
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """
+    Behaviour of the OpenWeather stand-in server
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    slow_ratio: float = 0.0
+    slow_ms: float = 0.0
+    rate_limit_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    hourly: NonNegativeInt = 48
+    daily: NonNegativeInt = 8
+    minutely: NonNegativeInt = 60
+    alerts: NonNegativeInt = 1
+    seed: int = SEED
+
+
+@lru_cache(maxsize=1024)
+def get_payload(
+    config: StubConfig, lat: str, lon: str, exclude: str = ""
+) -> bytes:
+    """
+    Get the encoded One Call payload of a location, generated once per
+     location so responses are deterministic and cheap to serve
+    :param config: The stub configuration
+    :type config: StubConfig
+    :param lat: The latitude query parameter
+    :type lat: str
+    :param lon: The longitude query parameter
+    :type lon: str
+    :param exclude: The comma-separated parts to leave out of the payload
+    :type exclude: str
+    :return: The JSON encoded payload
+    :rtype: bytes
+    """
+    payload: dict[str, Any] = build_onecall_payload(
+        random.Random(f"{config.seed}:{lat}:{lon}"),
+        float(lat),
+        float(lon),
+        hourly=config.hourly,
+        daily=config.daily,
+        minutely=config.minutely,
+        alerts=config.alerts,
+    )
+    for part in filter(None, exclude.split(",")):
+        payload.pop(part.strip(), None)
+    return json.dumps(payload).encode()
+
+
+class OpenWeatherStubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the One Call endpoint
+    """
+
+    server: "OpenWeatherStubServer"
+    protocol_version: str = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """
+        Silence the default access log on standard error
+        """
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        """
+        Serve a One Call payload, or an injected error response
+        :return: None
+        :rtype: NoneType
+        """
+        config: StubConfig = self.server.config
+        url = urlsplit(self.path)
+        query: dict[str, list[str]] = parse_qs(url.query)
+        if url.path != ONECALL_PATH or not {"lat", "lon", "appid"} <= set(
+            query
+        ):
+            self._send(
+                HTTPStatus.BAD_REQUEST,
+                b'{"cod":"400","message":"Nothing to geocode"}',
+            )
+            return
+        draw, delay = self.server.draw()
+        time.sleep(delay)
+        if draw < config.rate_limit_ratio:
+            self._send(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                b'{"cod":429,"message":"Too many requests"}',
+                {"Retry-After": "1"},
+            )
+        elif draw < config.rate_limit_ratio + config.server_error_ratio:
+            status: HTTPStatus = SERVER_ERRORS[
+                int(draw * 1000) % len(SERVER_ERRORS)
+            ]
+            self._send(
+                status, json.dumps({"cod": status, "message": ""}).encode()
+            )
+        else:
+            self._send(
+                HTTPStatus.OK,
+                get_payload(
+                    config,
+                    query["lat"][0],
+                    query["lon"][0],
+                    query.get("exclude", [""])[0],
+                ),
+            )
+
+
+class OpenWeatherStubServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server of the OpenWeather stand-in
+    """
+
+    daemon_threads: bool = True
+
+    def __init__(self, address: tuple[str, int], config: StubConfig):
+        super().__init__(address, OpenWeatherStubHandler)
+        self.config: StubConfig = config
+        self._randomizer: random.Random = random.Random(config.seed)
+        self._lock: threading.Lock = threading.Lock()
+
+    def draw(self) -> tuple[float, float]:
+        """
+        Draw the fault injection value and the latency of a request from
+         the seeded generator, a share of the requests being slowed down to
+         produce a latency tail
+        :return: The uniform draw and the delay in seconds
+        :rtype: tuple[float, float]
+        """
+        with self._lock:
+            draw: float = self._randomizer.random()
+            jitter: float = self._randomizer.uniform(
+                -self.config.jitter_ms, self.config.jitter_ms
+            )
+            if (
+                self.config.slow_ratio
+                and self._randomizer.random() < self.config.slow_ratio
+            ):
+                jitter += self.config.slow_ms
+        return draw, max(self.config.latency_ms + jitter, 0.0) / 1000
+
+    @property
+    def api_url(self) -> str:
+        """
+        The API_URL setting pointing to this server
+        :return: The One Call URL prefix expecting the latitude
+        :rtype: str
+        """
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}{ONECALL_PATH}?lat="
+
+
+@contextlib.contextmanager
+def serve_openweather(
+    config: StubConfig, host: str = "127.0.0.1", port: int = 0
+) -> Iterator[OpenWeatherStubServer]:
+    """
+    Run the stand-in server in a background thread
+    :param config: The stub configuration
+    :type config: StubConfig
+    :param host: The host to bind
+    :type host: str
+    :param port: The port to bind, 0 for a free one
+    :type port: int
+    :return: The running server
+    :rtype: Iterator[OpenWeatherStubServer]
+    """
+    server: OpenWeatherStubServer = OpenWeatherStubServer((host, port), config)
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever, daemon=True
+    )
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def run_benchmark(
+    server: OpenWeatherStubServer,
+    requests: PositiveInt,
+    rate_limit_threshold: PositiveInt,
+) -> dict[str, Any]:
+    """
+    Fetch the weather sequentially through `WeatherApiService` against
+     the stand-in server, including its retries and rate limiter
+    :param server: The running stand-in server
+    :type server: OpenWeatherStubServer
+    :param requests: The number of weather requests
+    :type requests: PositiveInt
+    :param rate_limit_threshold: The client requests allowed per window
+    :type rate_limit_threshold: PositiveInt
+    :return: The throughput, latencies and outcomes
+    :rtype: dict[str, Any]
+    """
+    from pipeline.config.settings import Settings, settings
+    from pipeline.services.external.api.weather import WeatherApiService
+
+    stub_settings: Settings = settings.model_copy(
+        update={
+            "API_URL": server.api_url,
+            "PREFIX": "http://",
+            "RATE_LIMIT_THRESHOLD": rate_limit_threshold,
+        }
+    )
+    service: WeatherApiService = WeatherApiService(stub_settings)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    started: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(requests):
+            start: float = time.perf_counter()
+            try:
+                service.get_weather_data()
+                outcomes["ok"] += 1
+            except Exception as exc:
+                outcomes[type(exc).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+    elapsed: float = time.perf_counter() - started
+    percentiles: list[float] = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else latencies * 99
+    )
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 2),
+        "latency_ms": {
+            "p50": round(percentiles[49], 3),
+            "p95": round(percentiles[94], 3),
+            "p99": round(percentiles[98], 3),
+        },
+        "outcomes": dict(outcomes),
+    }
+
+
+def main() -> None:
+    """
+    The main function to run the OpenWeather stand-in server
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Serve OpenWeather One Call payloads locally"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--slow-ratio", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--server-error-ratio", type=float, default=0.0)
+    parser.add_argument("--hourly", type=int, default=48)
+    parser.add_argument("--daily", type=int, default=8)
+    parser.add_argument("--minutely", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        default=0,
+        help="Run this many WeatherApiService requests and exit",
+    )
+    parser.add_argument("--rate-limit-threshold", type=int, default=120)
+    args: argparse.Namespace = parser.parse_args()
+    config: StubConfig = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_ratio=args.slow_ratio,
+        slow_ms=args.slow_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        server_error_ratio=args.server_error_ratio,
+        hourly=args.hourly,
+        daily=args.daily,
+        minutely=args.minutely,
+        seed=args.seed,
+    )
+    if args.benchmark:
+        with serve_openweather(config, args.host, 0) as server:
+            print(
+                json.dumps(
+                    run_benchmark(
+                        server, args.benchmark, args.rate_limit_threshold
+                    ),
+                    indent=2,
+                )
+            )
+        return
+    with serve_openweather(config, args.host, args.port) as server:
+        print(f"API_URL={server.api_url}\nPREFIX=http://")
+        with contextlib.suppress(KeyboardInterrupt):
+            threading.Event().wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+A module for serialization in the benchmarks package.
+It compares the throughput of FastAPI's default JSON rendering of a
+ 100-user page with the pydantic-core response class.
+Usage:
+    python -m benchmarks.serialization --page-size 100 --number 500
+"""
+
+import argparse
+import timeit
+from datetime import date
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import PositiveInt
+from pydantic_extra_types.phone_numbers import PhoneNumber
+
+from app.core.responses import PydanticJSONResponse
+from app.schemas.user import User, UsersResponse
+
+
+def build_page(page_size: PositiveInt) -> UsersResponse:
+    """
+    Build a page of users without running the field validators
+    :param page_size: The number of users in the page
+    :type page_size: PositiveInt
+    :return: The users response
+    :rtype: UsersResponse
+    """
+    return UsersResponse.model_construct(
+        users=[
+            User.model_construct(
+                username=f"user{index:05d}",
+                email=f"user{index}@example.com",
+                password="$2b$12$" + "x" * 53,
+                birthdate=date(2000, 1, 1 + index % 28),
+                phone_number=PhoneNumber("+593987654321"),
+            )
+            for index in range(page_size)
+        ]
+    )
+
+
+def default_render(page: UsersResponse) -> bytes:
+    """
+    Render the page like FastAPI's default path: encode to a dictionary
+     with jsonable_encoder and dump it with the standard json module
+    :param page: The users response
+    :type page: UsersResponse
+    :return: The JSON body
+    :rtype: bytes
+    """
+    return bytes(JSONResponse(jsonable_encoder(page)).body)
+
+
+def pydantic_render(page: UsersResponse) -> bytes:
+    """
+    Render the page with the pydantic-core response class
+    :param page: The users response
+    :type page: UsersResponse
+    :return: The JSON body
+    :rtype: bytes
+    """
+    return bytes(PydanticJSONResponse(page).body)
+
+
+def main() -> None:
+    """
+    The main function to run the serialization benchmark
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Compare JSON rendering of user pages"
+    )
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=500)
+    args: argparse.Namespace = parser.parse_args()
+    page: UsersResponse = build_page(args.page_size)
+    renderers: dict[str, Callable[[UsersResponse], bytes]] = {
+        "jsonable_encoder": default_render,
+        "pydantic_core": pydantic_render,
+    }
+    throughputs: dict[str, float] = {}
+    for name, render in renderers.items():
+        elapsed: float = timeit.timeit(lambda: render(page), number=args.number)
+        throughputs[name] = args.number / elapsed
+        print(
+            f"{name:<18}{throughputs[name]:>10.0f} pages/s"
+            f"{len(render(page)):>10} bytes"
+        )
+    speedup: float = (
+        throughputs["pydantic_core"] / throughputs["jsonable_encoder"]
+    )
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
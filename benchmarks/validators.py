@@ -0,0 +1,150 @@
+"""
+A module for validators in the benchmarks package.
+It compares the user password and phone number validators against the
+ previous implementations with timeit.
+Usage:
+    python -m benchmarks.validators --number 20000
+"""
+
+import argparse
+import re
+import timeit
+from typing import Any, Callable
+
+import phonenumbers
+from pydantic import PositiveInt
+
+from app.core.utils import validate_password, validate_phone_number
+
+PASSWORDS: list[str] = [
+    "Hk7pH9*35Fu&3U",
+    "Password123",
+    "aB3#efgh",
+    "short1!",
+    "NoSpecials1234",
+]
+PHONE_NUMBERS: list[str] = [
+    "+593987654321",
+    "+14155552671",
+    "+442071838750",
+    "+5939876a4321",
+    "+61291234567",
+]
+
+
+def legacy_validate_password(password: str) -> bool:
+    """
+    The previous password validator with four uncompiled searches
+    :param password: The password to validate
+    :type password: str
+    :return: True if the password is valid
+    :rtype: bool
+    """
+    return bool(
+        re.search("[A-Z]", password)
+        and re.search("[a-z]", password)
+        and re.search("[0-9]", password)
+        and re.search("[#?!@$%^&*-]", password)
+        and 8 <= len(password) <= 14
+    )
+
+
+def legacy_validate_phone_number(phone_number: str) -> bool:
+    """
+    The previous phone number validator parsing on every call
+    :param phone_number: The phone number to validate
+    :type phone_number: str
+    :return: True if the phone number is valid
+    :rtype: bool
+    """
+    try:
+        parsed_number = phonenumbers.parse(phone_number, None)
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return False
+    return bool(phonenumbers.is_valid_number(parsed_number))
+
+
+def _swallow(validator: Callable[[Any], Any]) -> Callable[[str], bool]:
+    """
+    Adapt a raising validator to return whether the value is valid
+    :param validator: The validator that raises on invalid values
+    :type validator: Callable[[Any], Any]
+    :return: A function returning True for valid values
+    :rtype: Callable[[str], bool]
+    """
+
+    def check(value: str) -> bool:
+        try:
+            validator(value)
+        except ValueError:
+            return False
+        return True
+
+    return check
+
+
+def measure(
+    validator: Callable[[str], bool], values: list[str], number: PositiveInt
+) -> float:
+    """
+    Measure the time per call of a validator over a set of values
+    :param validator: The validator to measure
+    :type validator: Callable[[str], bool]
+    :param values: The values validated on each round
+    :type values: list[str]
+    :param number: The number of rounds
+    :type number: PositiveInt
+    :return: The time per call in microseconds
+    :rtype: float
+    """
+    elapsed: float = timeit.timeit(
+        lambda: [validator(value) for value in values], number=number
+    )
+    return elapsed / (number * len(values)) * 1_000_000
+
+
+def main() -> None:
+    """
+    The main function to run the validators micro-benchmark
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Compare the user validators with the legacy ones"
+    )
+    parser.add_argument("--number", type=int, default=20000)
+    args: argparse.Namespace = parser.parse_args()
+    cases: list[
+        tuple[str, Callable[[str], bool], Callable[[str], bool], list[str]]
+    ] = [
+        (
+            "password",
+            legacy_validate_password,
+            _swallow(validate_password),
+            PASSWORDS,
+        ),
+        (
+            "phone_number",
+            legacy_validate_phone_number,
+            _swallow(validate_phone_number),
+            PHONE_NUMBERS,
+        ),
+    ]
+    print(
+        f"{'validator':<14}{'legacy us':>12}{'current us':>12}{'speedup':>10}"
+    )
+    for name, legacy, current, values in cases:
+        if [legacy(value) for value in values] != [
+            current(value) for value in values
+        ]:
+            raise SystemExit(f"{name} validators disagree on the sample")
+        legacy_us: float = measure(legacy, values, args.number)
+        current_us: float = measure(current, values, args.number)
+        print(
+            f"{name:<14}{legacy_us:>12.3f}{current_us:>12.3f}"
+            f"{legacy_us / current_us:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+"""
+A module for weather data in the benchmarks package.
+It generates reproducible synthetic weatherAUS-shaped CSV files, with a
+ configurable share of malformed rows, and OpenWeather One Call payloads
+ that validate against `APIWeather`.
+Usage:
+    python -m benchmarks.weather_data --rows 10000 --locations 49 \
+        --malformed-ratio 0.01 --output-dir cache/benchmarks/data
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import NonNegativeInt, PositiveInt
+
+SEED: int = 42
+CSV_COLUMNS: tuple[str, ...] = (
+    "Date",
+    "Location",
+    "MinTemp",
+    "MaxTemp",
+    "Rainfall",
+    "Evaporation",
+    "Sunshine",
+    "WindGustDir",
+    "WindGustSpeed",
+    "WindDir9am",
+    "WindDir3pm",
+    "WindSpeed9am",
+    "WindSpeed3pm",
+    "Humidity9am",
+    "Humidity3pm",
+    "Pressure9am",
+    "Pressure3pm",
+    "Cloud9am",
+    "Cloud3pm",
+    "Temp9am",
+    "Temp3pm",
+    "RainToday",
+    "RainTomorrow",
+)
+LOCATIONS: tuple[str, ...] = (
+    "Albury",
+    "BadgerysCreek",
+    "Cobar",
+    "CoffsHarbour",
+    "Moree",
+    "Newcastle",
+    "NorahHead",
+    "NorfolkIsland",
+    "Penrith",
+    "Richmond",
+    "Sydney",
+    "SydneyAirport",
+    "WaggaWagga",
+    "Williamtown",
+    "Wollongong",
+    "Canberra",
+    "Tuggeranong",
+    "MountGinini",
+    "Ballarat",
+    "Bendigo",
+    "Sale",
+    "MelbourneAirport",
+    "Melbourne",
+    "Mildura",
+    "Nhil",
+    "Portland",
+    "Watsonia",
+    "Dartmoor",
+    "Brisbane",
+    "Cairns",
+    "GoldCoast",
+    "Townsville",
+    "Adelaide",
+    "MountGambier",
+    "Nuriootpa",
+    "Woomera",
+    "Albany",
+    "Witchcliffe",
+    "PearceRAAF",
+    "PerthAirport",
+    "Perth",
+    "SalmonGums",
+    "Walpole",
+    "Hobart",
+    "Launceston",
+    "AliceSprings",
+    "Darwin",
+    "Katherine",
+    "Uluru",
+)
+DIRECTIONS: tuple[str, ...] = (
+    "N",
+    "NNE",
+    "NE",
+    "ENE",
+    "E",
+    "ESE",
+    "SE",
+    "SSE",
+    "S",
+    "SSW",
+    "SW",
+    "WSW",
+    "W",
+    "WNW",
+    "NW",
+    "NNW",
+)
+MALFORMED_VALUES: dict[str, tuple[str, ...]] = {
+    "Date": ("NA", "2008-13-45", "2999-01-01"),
+    "MinTemp": ("NA", "-300.0", "abc"),
+    "Humidity9am": ("NA", "140", "-5"),
+    "Pressure3pm": ("NA", "12.5"),
+    "WindGustSpeed": ("NA", "0", "999"),
+    "Cloud3pm": ("NA", "12"),
+}
+CONDITIONS: tuple[tuple[int, str, str, str], ...] = (
+    (800, "Clear", "clear sky", "01d"),
+    (801, "Clouds", "few clouds", "02d"),
+    (803, "Clouds", "broken clouds", "04d"),
+    (500, "Rain", "light rain", "10d"),
+    (211, "Thunderstorm", "thunderstorm", "11d"),
+)
+
+
+def get_locations(count: PositiveInt) -> list[str]:
+    """
+    Get the names of the weather stations, numbering repeated names when
+     more than the real weatherAUS stations are requested
+    :param count: The number of locations
+    :type count: PositiveInt
+    :return: The location names
+    :rtype: list[str]
+    """
+    return [
+        LOCATIONS[index % len(LOCATIONS)]
+        + (str(index // len(LOCATIONS)) if index >= len(LOCATIONS) else "")
+        for index in range(count)
+    ]
+
+
+def build_csv_row(
+    randomizer: random.Random, day: date, location: str
+) -> dict[str, str]:
+    """
+    Build a valid weatherAUS row
+    :param randomizer: The seeded random generator
+    :type randomizer: random.Random
+    :param day: The date of the record
+    :type day: date
+    :param location: The name of the weather station
+    :type location: str
+    :return: The row as CSV strings by column
+    :rtype: dict[str, str]
+    """
+    min_temp: float = round(randomizer.uniform(-5.0, 25.0), 1)
+    max_temp: float = round(min_temp + randomizer.uniform(2.0, 18.0), 1)
+    rainfall: float = round(randomizer.expovariate(0.5), 1)
+    rain_today: str = "Yes" if rainfall > 1.0 else "No"
+    return {
+        "Date": day.isoformat(),
+        "Location": location,
+        "MinTemp": str(min_temp),
+        "MaxTemp": str(max_temp),
+        "Rainfall": str(rainfall),
+        "Evaporation": str(round(randomizer.uniform(0.0, 14.0), 1)),
+        "Sunshine": str(round(randomizer.uniform(0.0, 13.5), 1)),
+        "WindGustDir": randomizer.choice(DIRECTIONS),
+        "WindGustSpeed": str(randomizer.randint(6, 120)),
+        "WindDir9am": randomizer.choice(DIRECTIONS),
+        "WindDir3pm": randomizer.choice(DIRECTIONS),
+        "WindSpeed9am": str(randomizer.randint(0, 60)),
+        "WindSpeed3pm": str(randomizer.randint(0, 70)),
+        "Humidity9am": str(randomizer.randint(10, 100)),
+        "Humidity3pm": str(randomizer.randint(5, 100)),
+        "Pressure9am": str(round(randomizer.uniform(985.0, 1040.0), 1)),
+        "Pressure3pm": str(round(randomizer.uniform(983.0, 1038.0), 1)),
+        "Cloud9am": str(randomizer.randint(0, 8)),
+        "Cloud3pm": str(randomizer.randint(0, 8)),
+        "Temp9am": str(round(min_temp + randomizer.uniform(0.0, 6.0), 1)),
+        "Temp3pm": str(round(max_temp - randomizer.uniform(0.0, 3.0), 1)),
+        "RainToday": rain_today,
+        "RainTomorrow": randomizer.choice(("Yes", "No")),
+    }
+
+
+def iter_csv_rows(
+    rows: PositiveInt,
+    locations: PositiveInt,
+    malformed_ratio: float,
+    seed: int = SEED,
+) -> Iterator[dict[str, str]]:
+    """
+    Generate weatherAUS rows day by day, one per location, ending
+     yesterday so every date is in the past
+    :param rows: The number of rows
+    :type rows: PositiveInt
+    :param locations: The number of weather stations
+    :type locations: PositiveInt
+    :param malformed_ratio: The share of rows with an invalid value
+    :type malformed_ratio: float
+    :param seed: The seed of the random generator
+    :type seed: int
+    :return: The rows as CSV strings by column
+    :rtype: Iterator[dict[str, str]]
+    """
+    randomizer: random.Random = random.Random(seed)
+    names: list[str] = get_locations(locations)
+    start: date = date.today() - timedelta(days=math.ceil(rows / locations))
+    malformed_columns: list[str] = list(MALFORMED_VALUES)
+    for index in range(rows):
+        day: date = start + timedelta(days=index // locations)
+        row: dict[str, str] = build_csv_row(
+            randomizer, day, names[index % locations]
+        )
+        if randomizer.random() < malformed_ratio:
+            column: str = randomizer.choice(malformed_columns)
+            row[column] = randomizer.choice(MALFORMED_VALUES[column])
+        yield row
+
+
+def write_weather_csv(
+    path: Path,
+    rows: PositiveInt,
+    locations: PositiveInt,
+    malformed_ratio: float,
+    seed: int = SEED,
+) -> Path:
+    """
+    Write a synthetic weatherAUS CSV file
+    :param path: The path of the CSV file
+    :type path: Path
+    :param rows: The number of rows
+    :type rows: PositiveInt
+    :param locations: The number of weather stations
+    :type locations: PositiveInt
+    :param malformed_ratio: The share of rows with an invalid value
+    :type malformed_ratio: float
+    :param seed: The seed of the random generator
+    :type seed: int
+    :return: The path of the written file
+    :rtype: Path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer: csv.DictWriter[str] = csv.DictWriter(file, CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(iter_csv_rows(rows, locations, malformed_ratio, seed))
+    return path
+
+
+def _build_conditions(randomizer: random.Random) -> list[dict[str, Any]]:
+    weather_id, main, description, icon = randomizer.choice(CONDITIONS)
+    return [
+        {
+            "id": weather_id,
+            "main": main,
+            "description": description,
+            "icon": icon,
+        }
+    ]
+
+
+def _build_current(
+    randomizer: random.Random, timestamp: NonNegativeInt
+) -> dict[str, Any]:
+    temp: float = round(randomizer.uniform(5.0, 35.0), 2)
+    current: dict[str, Any] = {
+        "dt": timestamp,
+        "sunrise": timestamp - 21600,
+        "sunset": timestamp + 21600,
+        "temp": temp,
+        "feels_like": round(temp + randomizer.uniform(-2.0, 2.0), 2),
+        "pressure": randomizer.randint(990, 1035),
+        "humidity": randomizer.randint(10, 100),
+        "dew_point": round(randomizer.uniform(1.0, temp), 2),
+        "uvi": round(randomizer.uniform(0.0, 11.0), 2),
+        "clouds": randomizer.randint(0, 100),
+        "visibility": 10000,
+        "wind_speed": round(randomizer.uniform(0.0, 15.0), 2),
+        "wind_deg": randomizer.randint(0, 360),
+        "wind_gust": round(randomizer.uniform(0.0, 25.0), 2),
+        "weather": _build_conditions(randomizer),
+    }
+    if current["weather"][0]["main"] == "Rain":
+        current["rain"] = {"1h": round(randomizer.uniform(0.1, 5.0), 2)}
+    return current
+
+
+def _build_daily(
+    randomizer: random.Random, timestamp: NonNegativeInt
+) -> dict[str, Any]:
+    low: float = round(randomizer.uniform(3.0, 18.0), 2)
+    high: float = round(low + randomizer.uniform(4.0, 15.0), 2)
+    temps: dict[str, float] = {
+        "morn": round(low + 1.0, 2),
+        "day": high,
+        "eve": round(high - 2.0, 2),
+        "night": round(low + 0.5, 2),
+    }
+    return {
+        "dt": timestamp,
+        "sunrise": timestamp - 21600,
+        "sunset": timestamp + 21600,
+        "moonrise": timestamp - 3600,
+        "moonset": timestamp + 30000,
+        "moon_phase": round(randomizer.random(), 2),
+        "summary": "Expect a day of partly cloudy with rain",
+        "temp": {**temps, "min": low, "max": high},
+        "feels_like": temps,
+        "pressure": randomizer.randint(990, 1035),
+        "humidity": randomizer.randint(10, 100),
+        "dew_point": round(randomizer.uniform(1.0, low), 2),
+        "wind_speed": round(randomizer.uniform(0.0, 15.0), 2),
+        "wind_deg": randomizer.randint(0, 360),
+        "wind_gust": round(randomizer.uniform(0.0, 25.0), 2),
+        "weather": _build_conditions(randomizer),
+        "clouds": randomizer.randint(0, 100),
+        "pop": round(randomizer.random(), 2),
+        "rain": round(randomizer.uniform(0.0, 10.0), 2),
+        "uvi": round(randomizer.uniform(0.0, 11.0), 2),
+    }
+
+
+def build_onecall_payload(
+    randomizer: random.Random,
+    lat: float,
+    lon: float,
+    timestamp: NonNegativeInt = 1735689600,
+    hourly: NonNegativeInt = 48,
+    daily: NonNegativeInt = 8,
+    minutely: NonNegativeInt = 60,
+    alerts: NonNegativeInt = 1,
+) -> dict[str, Any]:
+    """
+    Build an OpenWeather One Call 3.0 payload that validates against
+     `APIWeather`
+    :param randomizer: The seeded random generator
+    :type randomizer: random.Random
+    :param lat: The latitude of the location
+    :type lat: float
+    :param lon: The longitude of the location
+    :type lon: float
+    :param timestamp: The Unix time of the current weather
+    :type timestamp: NonNegativeInt
+    :param hourly: The number of hourly forecasts
+    :type hourly: NonNegativeInt
+    :param daily: The number of daily forecasts
+    :type daily: NonNegativeInt
+    :param minutely: The number of minutely forecasts
+    :type minutely: NonNegativeInt
+    :param alerts: The number of weather alerts
+    :type alerts: NonNegativeInt
+    :return: The payload as a JSON compatible dictionary
+    :rtype: dict[str, Any]
+    """
+    return {
+        "lat": lat,
+        "lon": lon,
+        "timezone": "Australia/Sydney",
+        "timezone_offset": 39600,
+        "current": _build_current(randomizer, timestamp),
+        "minutely": [
+            {
+                "dt": timestamp + 60 * minute,
+                "precipitation": round(randomizer.uniform(0.0, 2.0), 2),
+            }
+            for minute in range(minutely)
+        ],
+        "hourly": [
+            {
+                **_build_current(randomizer, timestamp + 3600 * hour),
+                "pop": round(randomizer.random(), 2),
+            }
+            for hour in range(hourly)
+        ],
+        "daily": [
+            _build_daily(randomizer, timestamp + 86400 * day)
+            for day in range(daily)
+        ],
+        "alerts": [
+            {
+                "sender_name": "Australian Bureau of Meteorology",
+                "event": "Severe Thunderstorm Warning",
+                "start": timestamp,
+                "end": timestamp + 10800,
+                "description": "Damaging winds are likely.",
+                "tags": ["Thunderstorm"],
+            }
+            for _ in range(alerts)
+        ],
+    }
+
+
+def write_onecall_fixtures(
+    directory: Path, locations: PositiveInt, seed: int = SEED
+) -> list[Path]:
+    """
+    Write one One Call payload per location as JSON fixtures
+    :param directory: The directory of the fixtures
+    :type directory: Path
+    :param locations: The number of locations
+    :type locations: PositiveInt
+    :param seed: The seed of the random generator
+    :type seed: int
+    :return: The paths of the written fixtures
+    :rtype: list[Path]
+    """
+    randomizer: random.Random = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for name in get_locations(locations):
+        path: Path = directory / f"{name}.json"
+        payload: dict[str, Any] = build_onecall_payload(
+            randomizer,
+            round(randomizer.uniform(-43.0, -12.0), 6),
+            round(randomizer.uniform(113.0, 153.0), 6),
+        )
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """
+    The main function to generate the synthetic weather data
+    :return: None
+    :rtype: NoneType
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Generate synthetic weatherAUS CSV and API fixtures"
+    )
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--locations", type=int, default=len(LOCATIONS))
+    parser.add_argument("--malformed-ratio", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output-dir", default="cache/benchmarks/data")
+    args: argparse.Namespace = parser.parse_args()
+    output_dir: Path = Path(args.output_dir)
+    csv_path: Path = write_weather_csv(
+        output_dir / f"weatherAUS-{args.rows}.csv",
+        args.rows,
+        args.locations,
+        args.malformed_ratio,
+        args.seed,
+    )
+    fixtures: list[Path] = write_onecall_fixtures(
+        output_dir / "onecall", args.locations, args.seed
+    )
+    print(f"{csv_path}\n{len(fixtures)} fixtures in {output_dir / 'onecall'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ A module for init settings in the pipeline.config package.
 
 from functools import lru_cache
 
+from pydantic import Field, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +23,19 @@ class InitSettings(BaseSettings):
     DATE_FORMAT: str = "%Y-%m-%d"
     DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     FILE_DATE_FORMAT: str = "%d-%b-%Y-%H-%M-%S"
+    WEATHER_FILES: str = "data/raw/*.csv*"  # glob, compressed files allowed
+    STATIONS_FILE: str = "data/reference/stations.csv"
+    CSV_CACHE_ENABLED: bool = True
+    CSV_CACHE_DIR: str = "cache/csv"
+    CSV_TRUSTED_MODE: bool = False  # skip validation of verified cache files
+    TRUSTED_SAMPLE_RATE: float = Field(default=0.01, ge=0, le=1)
+    DEAD_LETTER_DIR: str = "cache/dead_letter"
+    DEAD_LETTER_BATCH_SIZE: PositiveInt = 1000  # rejected rows per write
+    MAX_INVALID_ROW_RATIO: float = Field(default=1.0, ge=0, le=1)  # 1: off
+    LANDING_ENABLED: bool = True  # keep the raw API responses
+    LANDING_DIR: str = "data/landing"
+    LANDING_COMPRESSION_LEVEL: int = Field(default=3, ge=1, le=22)
+    CSV_MAX_WORKERS: PositiveInt | None = None  # defaults to usable CPUs
     LOG_FORMAT: str = (
         "[%(name)s][%(asctime)s][%(levelname)s][%(module)s]"
         "[%(funcName)s][%(lineno)d]: %(message)s"
@@ -6,6 +6,7 @@ from functools import lru_cache
 
 from pydantic import (
     AnyHttpUrl,
+    Field,
     NegativeFloat,
     NonNegativeInt,
     PositiveFloat,
@@ -46,6 +47,22 @@ class Settings(BaseSettings):
     POOL_MAXSIZE: PositiveInt = 20  # max connections to cache in the pool
     RETRY_BACKOFF_FACTOR: PositiveFloat = 0.5  # delay between retries [seconds]
     BACKOFF_MAX: PositiveInt = 60  # maximum delay between retries [seconds]
+    CONNECT_TIMEOUT: PositiveFloat = 3.05  # per request attempt [seconds]
+    READ_TIMEOUT: PositiveFloat = 10.0  # per request attempt [seconds]
+    CIRCUIT_FAILURE_RATE: float = Field(  # failure rate opening the circuit
+        default=0.5, gt=0, le=1
+    )
+    CIRCUIT_WINDOW_SIZE: PositiveInt = 20  # latest calls in the failure rate
+    CIRCUIT_MINIMUM_CALLS: PositiveInt = 10  # calls before it can open
+    CIRCUIT_OPEN_TIMEOUT: PositiveFloat = 30.0  # time open [seconds]
+    CIRCUIT_HALF_OPEN_CALLS: PositiveInt = 3  # trial calls closing it
+    HEDGE_REQUESTS: bool = False  # duplicate GET requests slower than p95
+    HEDGE_MIN_SAMPLES: PositiveInt = 20  # latencies needed before hedging
+    HEDGE_MIN_DELAY: PositiveFloat = 0.05  # lowest hedging delay [seconds]
+    LATENCY_WINDOW_SIZE: PositiveInt = 200  # latest latencies for the p95
+    API_EXCLUDE: list[str] = [  # response parts not requested
+        "minutely",
+    ]
     RETRY_STATUS_FORCE_LIST: list[PositiveInt] = [
         429,
         502,
@@ -60,6 +77,7 @@ class Settings(BaseSettings):
     POSTGRES_PORT: PositiveInt
     POSTGRES_DB: str
     SQLALCHEMY_DATABASE_URI: PostgresDsn | None = None
+    LOAD_BATCH_SIZE: PositiveInt = 4000  # rows per executemany batch
 
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     def assemble_postgresql_connection(
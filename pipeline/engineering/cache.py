@@ -0,0 +1,213 @@
+"""
+A module for cache in the pipeline-engineering package.
+It persists validated file records as Arrow IPC files keyed by the content
+ hash of the source file and the hash of the model schema, so unchanged
+ files are loaded through a memory map instead of being parsed again.
+Next to each cache file, a JSON manifest records the schema and the
+ checksum of the validated run; cache files matching it can be trusted and
+ restored without validation.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Sequence, Type
+
+import pyarrow as pa
+from pydantic import FilePath, TypeAdapter, ValidationError
+
+from pipeline.core.decorators import benchmark, with_logging
+from pipeline.schemas.api.weather import T
+
+logger: logging.Logger = logging.getLogger(__name__)
+CACHE_FORMAT_VERSION: int = 1
+DIGEST_LENGTH: int = 16
+
+
+def file_digest(filepath: FilePath) -> str:
+    """
+    Compute the SHA-256 digest of a file content
+    :param filepath: The path to the file
+    :type filepath: FilePath
+    :return: The hexadecimal digest
+    :rtype: str
+    """
+    with open(filepath, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def get_manifest_path(path: Path) -> Path:
+    """
+    Get the manifest of a cache file
+    :param path: The path of the cache file
+    :type path: Path
+    :return: The path of the JSON manifest
+    :rtype: Path
+    """
+    return path.with_name(f"{path.name}.json")
+
+
+def schema_digest(model: Type[T]) -> str:
+    """
+    Compute the digest of a model JSON schema. It includes the field
+     constraints, so changing a bound in the settings invalidates the cache.
+    :param model: The model the records are validated with
+    :type model: Type[T]
+    :return: The hexadecimal digest
+    :rtype: str
+    """
+    schema: str = json.dumps(
+        [CACHE_FORMAT_VERSION, model.model_json_schema()], sort_keys=True
+    )
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def get_cache_path(
+    cache_dir: str | Path, filepath: FilePath, model: Type[T]
+) -> Path:
+    """
+    Get the cache file of a source file validated with a model
+    :param cache_dir: The directory of the cache files
+    :type cache_dir: str | Path
+    :param filepath: The path to the source file
+    :type filepath: FilePath
+    :param model: The model the records are validated with
+    :type model: Type[T]
+    :return: The path of the Arrow IPC cache file
+    :rtype: Path
+    """
+    return Path(cache_dir) / (
+        f"{Path(filepath).name}-{file_digest(filepath)[:DIGEST_LENGTH]}"
+        f"-{schema_digest(model)[:DIGEST_LENGTH]}.arrow"
+    )
+
+
+@with_logging
+@benchmark
+def write_records(path: Path, records: Sequence[T], model: Type[T]) -> None:
+    """
+    Write validated records as an Arrow IPC file, one column per field, and
+     its manifest. The files are written under a temporary name and renamed,
+     so concurrent readers never see a partial cache.
+    :param path: The path of the cache file
+    :type path: Path
+    :param records: The validated records
+    :type records: Sequence[T]
+    :param model: The model of the records
+    :type model: Type[T]
+    :return: None
+    :rtype: NoneType
+    """
+    table: pa.Table = pa.table(
+        {
+            name: [getattr(record, name) for record in records]
+            for name in model.model_fields
+        }
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(temporary), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    manifest: dict[str, Any] = {
+        "rows": len(records),
+        "schema_sha256": schema_digest(model),
+        "cache_sha256": file_digest(temporary),
+        "validated_at": datetime.now(UTC).isoformat(),
+    }
+    os.replace(temporary, path)
+    temporary.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(temporary, get_manifest_path(path))
+
+
+def is_trusted(path: Path, model: Type[T]) -> bool:
+    """
+    Check whether a cache file is the unaltered output of a validated run
+     with the current schema of the model
+    :param path: The path of the cache file
+    :type path: Path
+    :param model: The model of the records
+    :type model: Type[T]
+    :return: True if the manifest matches the schema and the checksum
+    :rtype: bool
+    """
+    try:
+        manifest: dict[str, Any] = json.loads(
+            get_manifest_path(path).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return False
+    return manifest.get("schema_sha256") == schema_digest(
+        model
+    ) and manifest.get("cache_sha256") == file_digest(path)
+
+
+@with_logging
+@benchmark
+def read_records(path: Path, model: Type[T], trusted: bool) -> list[T]:
+    """
+    Read the records of an Arrow IPC cache file through a memory map.
+    Trusted records are not validated again: their state is set directly,
+     which is several times faster than `model_construct`.
+    :param path: The path of the cache file
+    :type path: Path
+    :param model: The model of the records
+    :type model: Type[T]
+    :param trusted: Whether to skip the validation of the records
+    :type trusted: bool
+    :return: The cached records
+    :rtype: list[T]
+    """
+    with pa.memory_map(str(path)) as source:
+        table: pa.Table = pa.ipc.open_file(source).read_all()
+    if not trusted:
+        return TypeAdapter(list[model]).validate_python(  # type: ignore
+            table.to_pylist()
+        )
+    fields_set: frozenset[str] = frozenset(model.model_fields)
+    return [_restore(model, values, fields_set) for values in table.to_pylist()]
+
+
+def _restore(
+    model: Type[T], values: dict[str, Any], fields_set: frozenset[str]
+) -> T:
+    instance: T = model.__new__(model)
+    instance.__setstate__(
+        {
+            "__dict__": values,
+            "__pydantic_fields_set__": set(fields_set),
+            "__pydantic_extra__": None,
+            "__pydantic_private__": None,
+        }
+    )
+    return instance
+
+
+@benchmark
+def spot_check(
+    records: Sequence[T], model: Type[T], sample_rate: float
+) -> bool:
+    """
+    Validate a random sample of records restored without validation
+    :param records: The trusted records
+    :type records: Sequence[T]
+    :param model: The model of the records
+    :type model: Type[T]
+    :param sample_rate: The fraction of records to validate
+    :type sample_rate: float
+    :return: True if every sampled record is valid
+    :rtype: bool
+    """
+    size: int = min(len(records), math.ceil(len(records) * sample_rate))
+    try:
+        for record in random.sample(records, size):
+            model.model_validate(record.__dict__)
+    except ValidationError as exc:
+        logger.warning("Spot check of %s failed: %s", model.__name__, exc)
+        return False
+    return True
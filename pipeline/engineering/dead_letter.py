@@ -0,0 +1,178 @@
+"""
+A module for dead letter in the pipeline-engineering package.
+"""
+
+import hashlib
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self
+
+from pydantic import NonNegativeInt, PositiveInt, ValidationError
+
+from pipeline.exceptions.exceptions import DataQualityException
+
+logger: logging.Logger = logging.getLogger(__name__)
+SOURCE_DIGEST_LENGTH: int = 12
+
+
+def dead_letter_path(directory: str | Path, source: str | Path) -> Path:
+    """
+    Build the dead letter file path of a source, named after it with a
+     digest of its absolute path, so same-named files from different
+     directories get distinct dead letter files
+    :param directory: The directory of the dead letter files
+    :type directory: str | Path
+    :param source: The source file or the name of the checked table
+    :type source: str | Path
+    :return: The path of the dead letter file
+    :rtype: Path
+    """
+    source_path: Path = Path(source).absolute()
+    digest: str = hashlib.sha256(str(source_path).encode()).hexdigest()
+    return (
+        Path(directory)
+        / f"{source_path.name}.{digest[:SOURCE_DIGEST_LENGTH]}.rejected.jsonl"
+    )
+
+
+class DeadLetterSink:
+    """
+    Sink of the rows rejected by validation. Each rejected row is written
+     as a compact JSON line with its position (a line number or the key
+     of the row), error codes and raw values; lines are buffered and
+     written in batches, and the errors are counted per field and
+     constraint. Entering the sink removes the file of a previous run, so
+     the file only exists if rows were rejected.
+    """
+
+    def __init__(self, path: Path, batch_size: PositiveInt) -> None:
+        self.path: Path = path
+        self.batch_size: PositiveInt = batch_size
+        self.rejected: NonNegativeInt = 0
+        self.error_counts: Counter[str] = Counter()
+        self._buffer: list[str] = []
+        self._file: IO[str] | None = None
+
+    def __enter__(self) -> Self:
+        self.path.unlink(missing_ok=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def reject(
+        self, line_number: NonNegativeInt, row: dict[str, Any], exc: Exception
+    ) -> None:
+        """
+        Record a rejected row
+        :param line_number: The line number of the row in the source file
+        :type line_number: NonNegativeInt
+        :param row: The raw values of the row
+        :type row: dict[str, Any]
+        :param exc: The exception raised while processing the row
+        :type exc: Exception
+        :return: None
+        :rtype: NoneType
+        """
+        errors: list[str] = (
+            [
+                f"{'.'.join(map(str, error['loc'])) or 'row'}:{error['type']}"
+                for error in exc.errors(include_url=False, include_input=False)
+            ]
+            if isinstance(exc, ValidationError)
+            else [f"row:{type(exc).__name__}"]
+        )
+        self.reject_errors({"line": line_number}, row, errors)
+
+    def reject_errors(
+        self,
+        position: dict[str, Any],
+        row: dict[str, Any],
+        errors: list[str],
+    ) -> None:
+        """
+        Record a rejected row with its error codes
+        :param position: The fields locating the row in the source, e.g.
+         its line number or the columns of its unique key
+        :type position: dict[str, Any]
+        :param row: The raw values of the row
+        :type row: dict[str, Any]
+        :param errors: The error codes, e.g. `MinTemp:float_parsing`
+        :type errors: list[str]
+        :return: None
+        :rtype: NoneType
+        """
+        self.rejected += 1
+        self.error_counts.update(errors)
+        self._buffer.append(
+            json.dumps(
+                {**position, "errors": errors, "values": row},
+                separators=(",", ":"),
+                default=str,
+            )
+        )
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered rows to the dead letter file
+        :return: None
+        :rtype: NoneType
+        """
+        if not self._buffer:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """
+        Flush the remaining rows and close the dead letter file
+        :return: None
+        :rtype: NoneType
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def raise_for_ratio(
+        self, total: NonNegativeInt, max_ratio: float, source: str
+    ) -> None:
+        """
+        Log the aggregated errors and abort if too many rows were rejected
+        :param total: The number of rows processed, rejected ones included
+        :type total: NonNegativeInt
+        :param max_ratio: The highest ratio of rejected rows allowed
+        :type max_ratio: float
+        :param source: The name of the source, for the messages
+        :type source: str
+        :return: None
+        :rtype: NoneType
+        """
+        if not self.rejected:
+            return
+        logger.warning(
+            "Rejected %s of %s rows of %s into %s: %s",
+            self.rejected,
+            total,
+            source,
+            self.path,
+            dict(self.error_counts.most_common()),
+        )
+        if self.rejected > total * max_ratio:
+            raise DataQualityException(
+                f"{self.rejected} of {total} rows of {source} are invalid,"
+                f" above the {max_ratio:.2%} threshold"
+            )
@@ -4,17 +4,36 @@ A module for extraction in the pipeline-engineering package.
 
 import csv
 import json
-from typing import Any
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable
 
 from pydantic import FilePath
 
 from pipeline.config.init_settings import InitSettings
 from pipeline.config.settings import Settings
 from pipeline.core.decorators import benchmark, with_logging
+from pipeline.engineering.cache import (
+    get_cache_path,
+    is_trusted,
+    read_records,
+    spot_check,
+    write_records,
+)
+from pipeline.engineering.dead_letter import DeadLetterSink, dead_letter_path
+from pipeline.engineering.files import expand_pattern, open_lines
+from pipeline.engineering.landing import LandingStore
+from pipeline.engineering.stations import StationRegistry, get_station_registry
 from pipeline.schemas.api.weather import APIWeather
 from pipeline.schemas.files.weather import CSVWeather
 from pipeline.services.external.api.weather import WeatherApiService
 
+logger: logging.Logger = logging.getLogger(__name__)
+ONECALL_SOURCE: str = "onecall"
+
 
 @with_logging
 @benchmark
@@ -31,6 +50,139 @@ def extract_api_data(settings: Settings) -> APIWeather:
     return api_weather
 
 
+@with_logging
+@benchmark
+def extract_api_data_by_location(
+    settings: Settings,
+    stations: StationRegistry,
+    locations: Iterable[str],
+    landing_store: LandingStore | None = None,
+) -> dict[str, APIWeather]:
+    """
+    Extract the weather data from the OpenWeather API once per distinct
+     location, using the coordinates of its weather station
+    :param settings: The project settings to handle the service
+    :type settings: Settings
+    :param stations: The registry of the weather stations
+    :type stations: StationRegistry
+    :param locations: The locations to fetch, repetitions allowed
+    :type locations: Iterable[str]
+    :param landing_store: The store to keep the raw responses in
+    :type landing_store: Optional[LandingStore]
+    :return: The weather data by location
+    :rtype: dict[str, APIWeather]
+    """
+    weather_api_service: WeatherApiService = WeatherApiService(settings)
+    api_weather: dict[str, APIWeather] = {}
+    for location in dict.fromkeys(locations):
+        if (station := stations.get(location)) is None:
+            logger.warning("No coordinates for location %s", location)
+            continue
+        content: bytes = weather_api_service.get_weather_content(
+            station.lat, station.lon
+        )
+        if landing_store is not None:
+            landing_store.write(ONECALL_SOURCE, location, content)
+        weather: APIWeather = APIWeather.model_validate_json(content)
+        if (nearest := stations.nearest(weather.lat, weather.lon)) != station:
+            logger.warning(
+                "Response for %s is nearest to %s", location, nearest.location
+            )
+        api_weather[location] = weather
+    return api_weather
+
+
+@with_logging
+@benchmark
+def extract_landed_api_data(
+    landing_store: LandingStore,
+    locations: Iterable[str],
+    day: date | None = None,
+) -> dict[str, APIWeather]:
+    """
+    Rebuild the weather data of each location from its latest raw response
+     in the landing store, without calling the API
+    :param landing_store: The store with the raw responses
+    :type landing_store: LandingStore
+    :param locations: The locations to read, repetitions allowed
+    :type locations: Iterable[str]
+    :param day: The date partition to replay, all dates by default
+    :type day: Optional[date]
+    :return: The weather data by location
+    :rtype: dict[str, APIWeather]
+    """
+    wanted: dict[str, None] = dict.fromkeys(locations)
+    entries: dict[str, dict[str, Any]] = landing_store.latest(
+        ONECALL_SOURCE, day, wanted
+    )
+    for location in wanted.keys() - entries.keys():
+        logger.warning("No landed response for location %s", location)
+    return {
+        location: APIWeather.model_validate_json(landing_store.read(entry))
+        for location, entry in entries.items()
+    }
+
+
+@with_logging
+def extract_stations(
+    filepath: FilePath, init_settings: InitSettings
+) -> StationRegistry:
+    """
+    Reads the weather stations reference CSV file into a registry, loaded
+     once per file
+    :param filepath: The path to the CSV file.
+    :type filepath: FilePath
+    :param init_settings: The initial settings
+    :type init_settings: InitSettings
+    :return: The registry of the weather stations
+    :rtype: StationRegistry
+    """
+    return get_station_registry(str(filepath), init_settings.ENCODING)
+
+
+@with_logging
+@benchmark
+def extract_csv_files(
+    pattern: str, init_settings: InitSettings
+) -> list[CSVWeather]:
+    """
+    Reads every CSV file matching a glob pattern, e.g. `data/raw/*.csv*`,
+     with several files processed concurrently in worker processes
+    :param pattern: The path or glob pattern of the CSV files.
+    :type pattern: str
+    :param init_settings: The initial settings
+    :type init_settings: InitSettings
+    :return: The CSVWeather instances of all files, in file order
+    :rtype: list[CSVWeather]
+    """
+    filepaths: list[Path] = expand_pattern(pattern)
+    max_workers: int = min(
+        len(filepaths),
+        init_settings.CSV_MAX_WORKERS
+        or (
+            len(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else os.cpu_count() or 1
+        ),
+    )
+    if max_workers == 1:
+        return [
+            csv_weather
+            for filepath in filepaths
+            for csv_weather in extract_csv_data(filepath, init_settings)
+        ]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return [
+            csv_weather
+            for file_data in executor.map(
+                extract_csv_data,
+                filepaths,
+                [init_settings] * len(filepaths),
+            )
+            for csv_weather in file_data
+        ]
+
+
 @with_logging
 @benchmark
 def extract_csv_data(
@@ -38,6 +190,13 @@ def extract_csv_data(
 ) -> list[CSVWeather]:
     """
     Reads a CSV file and converts it into a list of CSVWeatherModel instances.
+    gzip, bz2 and zstd compressed files are decompressed while streaming.
+    Invalid rows are written to a dead letter file in DEAD_LETTER_DIR, and
+     the extraction aborts above MAX_INVALID_ROW_RATIO invalid rows.
+    The validated rows are cached by file content and schema in
+     CSV_CACHE_DIR, so an unchanged file is loaded from the cache instead.
+    In CSV_TRUSTED_MODE, cached rows whose manifest matches are restored
+     without validation, except for a TRUSTED_SAMPLE_RATE spot check.
     :param filepath: The path to the CSV file.
     :type filepath: FilePath
     :param init_settings: The initial settings
@@ -46,11 +205,46 @@ def extract_csv_data(
      CSV.
     :rtype: list[CSVWeatherModel]
     """
+    if not init_settings.CSV_CACHE_ENABLED:
+        return _read_csv(filepath, init_settings)
+    cache_path: Path = get_cache_path(
+        init_settings.CSV_CACHE_DIR, filepath, CSVWeather
+    )
+    if cache_path.is_file():
+        logger.info("Loading %s from cache %s", filepath, cache_path)
+        if not init_settings.CSV_TRUSTED_MODE:
+            cached_data: list[CSVWeather] = read_records(
+                cache_path, CSVWeather, trusted=False
+            )
+            return cached_data
+        if is_trusted(cache_path, CSVWeather):
+            trusted_data: list[CSVWeather] = read_records(
+                cache_path, CSVWeather, trusted=True
+            )
+            if spot_check(
+                trusted_data, CSVWeather, init_settings.TRUSTED_SAMPLE_RATE
+            ):
+                return trusted_data
+        logger.warning(
+            "Untrusted cache %s, validating %s", cache_path, filepath
+        )
+    data: list[CSVWeather] = _read_csv(filepath, init_settings)
+    write_records(cache_path, data, CSVWeather)
+    return data
+
+
+def _read_csv(
+    filepath: FilePath, init_settings: InitSettings
+) -> list[CSVWeather]:
     data: list[CSVWeather] = []
-    with open(
-        filepath, encoding=init_settings.ENCODING, newline=""
-    ) as text_io_wrapper:
-        dict_reader: csv.DictReader[Any] = csv.DictReader(text_io_wrapper)
+    with (
+        open_lines(filepath, init_settings.ENCODING) as lines,
+        DeadLetterSink(
+            dead_letter_path(init_settings.DEAD_LETTER_DIR, filepath),
+            init_settings.DEAD_LETTER_BATCH_SIZE,
+        ) as dead_letter_sink,
+    ):
+        dict_reader: csv.DictReader[Any] = csv.DictReader(lines)
         for row in dict_reader:
             try:
                 parsed_row: dict[str, Any] = {
@@ -59,6 +253,11 @@ def extract_csv_data(
                 }
                 csv_weather: CSVWeather = CSVWeather(**parsed_row)
                 data.append(csv_weather)
-            except Exception as e:
-                print(f"Error processing row {row}: {e}")
+            except Exception as exc:
+                dead_letter_sink.reject(dict_reader.line_num, row, exc)
+    dead_letter_sink.raise_for_ratio(
+        len(data) + dead_letter_sink.rejected,
+        init_settings.MAX_INVALID_ROW_RATIO,
+        str(filepath),
+    )
     return data
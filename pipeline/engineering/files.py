@@ -0,0 +1,84 @@
+"""
+A module for files in the pipeline-engineering package.
+"""
+
+import bz2
+import contextlib
+import glob
+import gzip
+import io
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from pydantic import FilePath
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None  # type: ignore[assignment]
+
+COMPRESSED_SUFFIXES: frozenset[str] = frozenset({".gz", ".bz2", ".zst"})
+
+
+def expand_pattern(pattern: str) -> list[Path]:
+    """
+    Expand a glob pattern, e.g. `data/raw/*.csv*`, into the matching files
+    :param pattern: The path or glob pattern of the files
+    :type pattern: str
+    :return: The matching files in sorted order
+    :rtype: list[Path]
+    """
+    paths: list[Path] = [
+        Path(path)
+        for path in sorted(glob.glob(pattern, recursive=True))
+        if Path(path).is_file()
+    ]
+    if not paths:
+        raise FileNotFoundError(f"No files match {pattern}")
+    return paths
+
+
+def _open_compressed(
+    filepath: FilePath,
+) -> gzip.GzipFile | bz2.BZ2File | BinaryIO:
+    suffix: str = Path(filepath).suffix
+    if suffix == ".gz":
+        return gzip.open(filepath, "rb")
+    if suffix == ".bz2":
+        return bz2.open(filepath, "rb")
+    if zstandard is None:
+        raise RuntimeError(f"zstandard is required to read {filepath}")
+    return zstandard.ZstdDecompressor().stream_reader(
+        open(filepath, "rb"), closefd=True
+    )
+
+
+@contextlib.contextmanager
+def open_lines(filepath: FilePath, encoding: str) -> Iterator[Iterator[str]]:
+    """
+    Open a text file as an iterator of lines with their line endings, as
+     expected by `csv.reader`. gzip, bz2 and zstd files are decompressed
+     while streaming; uncompressed files are read through a memory map, so
+     their content is not copied into Python file buffers.
+    :param filepath: The path to the file
+    :type filepath: FilePath
+    :param encoding: The encoding of the file
+    :type encoding: str
+    :return: The lines of the file
+    :rtype: Iterator[Iterator[str]]
+    """
+    if Path(filepath).suffix in COMPRESSED_SUFFIXES:
+        with io.TextIOWrapper(
+            _open_compressed(filepath), encoding=encoding, newline=""
+        ) as text_io_wrapper:
+            yield text_io_wrapper
+        return
+    with open(filepath, "rb") as file:
+        if not Path(filepath).stat().st_size:
+            yield iter(())
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield (line.decode(encoding) for line in iter(mapped.readline, b""))
@@ -0,0 +1,168 @@
+"""
+A module for landing in the pipeline-engineering package.
+It keeps every raw API response as an append-only, zstd compressed file
+ partitioned by date and location, e.g.
+ `date=2025-01-31/location=Sydney/onecall-093015123456-<sha>.json.zst`, and
+ records each file as a line of `index.jsonl` at the root of the store.
+Locations and sources are percent-encoded in the paths, so a value with
+ `/` or `..` cannot leave its partition.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from urllib.parse import quote
+
+import zstandard
+
+logger: logging.Logger = logging.getLogger(__name__)
+INDEX_FILE: str = "index.jsonl"
+
+
+def _path_component(value: str) -> str:
+    """
+    Escape a value to use it within a single path component, percent-encoding
+     path separators, dots and other reserved characters
+    :param value: The raw value, e.g. a location name
+    :type value: str
+    :return: The escaped value
+    :rtype: str
+    """
+    return quote(value, safe=" ").replace(".", "%2E")
+
+
+class LandingStore:
+    """
+    Append-only store of raw API responses
+    """
+
+    def __init__(self, root: str | Path, compression_level: int = 3) -> None:
+        self.root: Path = Path(root)
+        self.index_path: Path = self.root / INDEX_FILE
+        self._compressor: zstandard.ZstdCompressor = zstandard.ZstdCompressor(
+            level=compression_level
+        )
+        self._decompressor: zstandard.ZstdDecompressor = (
+            zstandard.ZstdDecompressor()
+        )
+
+    def write(
+        self,
+        source: str,
+        location: str,
+        content: bytes,
+        fetched_at: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Store a raw response and append it to the index. Files are never
+         overwritten; the index line is written with a single append.
+        :param source: The name of the source, e.g. onecall
+        :type source: str
+        :param location: The location the response belongs to
+        :type location: str
+        :param content: The raw response body
+        :type content: bytes
+        :param fetched_at: When the response was received, now by default
+        :type fetched_at: Optional[datetime]
+        :return: The index entry of the stored response
+        :rtype: dict[str, Any]
+        """
+        fetched_at = fetched_at or datetime.now(UTC)
+        digest: str = hashlib.sha256(content).hexdigest()
+        relative: Path = (
+            Path(f"date={fetched_at:%Y-%m-%d}")
+            / f"location={_path_component(location)}"
+            / f"{_path_component(source)}-{fetched_at:%H%M%S%f}"
+            f"-{digest[:12]}.json.zst"
+        )
+        path: Path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(self._compressor.compress(content))
+        os.replace(temporary, path)
+        entry: dict[str, Any] = {
+            "path": relative.as_posix(),
+            "source": source,
+            "location": location,
+            "date": f"{fetched_at:%Y-%m-%d}",
+            "fetched_at": fetched_at.isoformat(),
+            "size": len(content),
+            "sha256": digest,
+        }
+        with open(self.index_path, "a", encoding="utf-8") as index:
+            index.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        return entry
+
+    def entries(
+        self,
+        source: str | None = None,
+        day: date | None = None,
+        locations: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the index entries matching the filters, oldest first
+        :param source: The source to keep, all by default
+        :type source: Optional[str]
+        :param day: The date partition to keep, all by default
+        :type day: Optional[date]
+        :param locations: The locations to keep, all by default
+        :type locations: Optional[Iterable[str]]
+        :return: The index entries
+        :rtype: Iterator[dict[str, Any]]
+        """
+        if not self.index_path.is_file():
+            return
+        wanted: set[str] | None = None if locations is None else set(locations)
+        with open(self.index_path, encoding="utf-8") as index:
+            for line in index:
+                entry: dict[str, Any] = json.loads(line)
+                if (
+                    (source is None or entry["source"] == source)
+                    and (day is None or entry["date"] == day.isoformat())
+                    and (wanted is None or entry["location"] in wanted)
+                ):
+                    yield entry
+
+    def latest(
+        self,
+        source: str,
+        day: date | None = None,
+        locations: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the most recent entry of every location
+        :param source: The source of the responses
+        :type source: str
+        :param day: The date partition to read, all by default
+        :type day: Optional[date]
+        :param locations: The locations to keep, all by default
+        :type locations: Optional[Iterable[str]]
+        :return: The latest index entry by location
+        :rtype: dict[str, dict[str, Any]]
+        """
+        latest: dict[str, dict[str, Any]] = {}
+        for entry in self.entries(source, day, locations):
+            if (
+                entry["location"] not in latest
+                or entry["fetched_at"]
+                >= latest[entry["location"]]["fetched_at"]
+            ):
+                latest[entry["location"]] = entry
+        return latest
+
+    def read(self, entry: dict[str, Any]) -> bytes:
+        """
+        Read the raw response of an index entry
+        :param entry: The index entry
+        :type entry: dict[str, Any]
+        :return: The raw response body
+        :rtype: bytes
+        """
+        return self._decompressor.decompress(
+            (self.root / entry["path"]).read_bytes(),
+            max_output_size=entry["size"],
+        )
@@ -2,10 +2,15 @@
 A module for loading in the pipeline-engineering package.
 """
 
+from typing import Sequence
+
+from pydantic import PositiveInt
 from sqlalchemy.orm import Session
 
-from pipeline.core.decorators import with_logging
-from pipeline.models.weather import Weather
+from pipeline.core.decorators import benchmark, with_logging
+from pipeline.models.forecast import ForecastRecord
+from pipeline.models.weather import Weather, WeatherRecord
+from pipeline.repository.forecast import ForecastRepository
 from pipeline.repository.weather import WeatherRepository
 
 
@@ -20,3 +25,46 @@ def load_data(session: Session, weather: Weather) -> None:
     """
     weather_repository: WeatherRepository = WeatherRepository(session)
     weather_repository.handle_weather(weather)
+
+
+@with_logging
+@benchmark
+def load_batch(
+    session: Session,
+    weather: Sequence[Weather | WeatherRecord],
+    batch_size: PositiveInt,
+) -> int:
+    """
+    Load many weather records into the database table in batches.
+    :param session: The database session to handle CRUD operations
+    :type session: Session
+    :param weather: The weather data as SQLAlchemy model instances or
+     records
+    :type weather: Sequence[Weather | WeatherRecord]
+    :param batch_size: The number of rows per execution
+    :type batch_size: PositiveInt
+    :return: The number of rows written
+    :rtype: int
+    """
+    weather_repository: WeatherRepository = WeatherRepository(session)
+    rows: int = weather_repository.upsert_many(weather, batch_size)
+    return rows
+
+
+@with_logging
+@benchmark
+def load_forecasts(
+    session: Session, forecasts: Sequence[ForecastRecord]
+) -> dict[str, int]:
+    """
+    Load the flattened forecasts into the forecast tables with bulk copies.
+    :param session: The database session to handle CRUD operations
+    :type session: Session
+    :param forecasts: The flattened forecasts
+    :type forecasts: Sequence[ForecastRecord]
+    :return: The number of rows written by table
+    :rtype: dict[str, int]
+    """
+    forecast_repository: ForecastRepository = ForecastRepository(session)
+    counts: dict[str, int] = forecast_repository.bulk_load(forecasts)
+    return counts
@@ -0,0 +1,126 @@
+"""
+A module for quality in the pipeline-engineering package.
+It applies the constraints of the weather table to whole columns
+ with pyarrow compute kernels before loading, so rows that the database
+ would reject are split out instead of failing the bulk transaction.
+"""
+
+import dataclasses
+from datetime import date
+from functools import reduce
+from typing import Sequence, TypeVar
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from pipeline.config.init_settings import InitSettings
+from pipeline.core.decorators import benchmark, with_logging
+from pipeline.engineering.dead_letter import DeadLetterSink, dead_letter_path
+from pipeline.models.weather import (
+    WEATHER_RANGE_RULES,
+    RangeRule,
+    Weather,
+    WeatherRecord,
+)
+
+W = TypeVar("W", Weather, WeatherRecord)
+WEATHER_COLUMNS: tuple[str, ...] = tuple(
+    field.name for field in dataclasses.fields(WeatherRecord)
+)
+
+
+def _violations(array: pa.Array, rule: RangeRule) -> pa.BooleanArray:
+    conditions: list[pa.BooleanArray] = []
+    if rule.lowest is not None:
+        conditions.append(pc.less(array, rule.lowest))
+    if rule.highest is not None:
+        conditions.append(pc.greater(array, rule.highest))
+    return reduce(pc.or_, conditions)
+
+
+@with_logging
+@benchmark
+def check_weather(
+    weather: Sequence[W], init_settings: InitSettings, today: date | None = None
+) -> list[W]:
+    """
+    Split out the weather rows violating the not-null and check constraints
+     of the weather table. As in SQL, a null value passes the checks; it is
+     only rejected by the not-null constraints, reported as
+     `not_null:<column>`. Rejected rows are written to a dead letter file
+     with their date and location and the names of the failed constraints.
+    :param weather: The weather data as SQLAlchemy model instances or
+     records
+    :type weather: Sequence[Weather | WeatherRecord]
+    :param init_settings: The initial settings
+    :type init_settings: InitSettings
+    :param today: The latest date allowed, the current date by default
+    :type today: Optional[date]
+    :return: The rows passing every check, in their original order
+    :rtype: list[Weather | WeatherRecord]
+    """
+    if not weather:
+        return []
+    columns: dict[str, pa.Array] = {
+        column: pa.array(
+            [getattr(row, column) for row in weather], type=pa.float64()
+        )
+        for column in {rule.column for rule in WEATHER_RANGE_RULES}
+    }
+    violations: dict[str, pa.BooleanArray] = {
+        f"not_null:{column}": pc.is_null(
+            columns[column]
+            if column in columns
+            else pa.array([getattr(row, column) for row in weather])
+        )
+        for column in WEATHER_COLUMNS
+        if not Weather.__table__.c[column].nullable
+    }
+    violations.update(
+        (rule.name, _violations(columns[rule.column], rule))
+        for rule in WEATHER_RANGE_RULES
+    )
+    violations["weather_min_max_temp_check"] = pc.greater(
+        columns["min_temp"], columns["max_temp"]
+    )
+    violations["weather_date_check"] = pc.greater(
+        pa.array([row.date for row in weather], type=pa.date32()),
+        pa.scalar(today or date.today(), type=pa.date32()),
+    )
+    violations = {
+        name: pc.fill_null(violation, False)
+        for name, violation in violations.items()
+        if pc.any(violation).as_py()
+    }
+    with DeadLetterSink(
+        dead_letter_path(init_settings.DEAD_LETTER_DIR, Weather.__tablename__),
+        init_settings.DEAD_LETTER_BATCH_SIZE,
+    ) as dead_letter_sink:
+        if not violations:
+            return list(weather)
+        invalid: pa.BooleanArray = reduce(pc.or_, violations.values())
+        failed: dict[str, list[bool]] = {
+            name: violation.to_pylist()
+            for name, violation in violations.items()
+        }
+        for index in pc.indices_nonzero(invalid).to_pylist():
+            dead_letter_sink.reject_errors(
+                {
+                    "date": weather[index].date,
+                    "location": weather[index].location,
+                },
+                {
+                    column: getattr(weather[index], column)
+                    for column in WEATHER_COLUMNS
+                },
+                [name for name, flags in failed.items() if flags[index]],
+            )
+    dead_letter_sink.raise_for_ratio(
+        len(weather),
+        init_settings.MAX_INVALID_ROW_RATIO,
+        Weather.__tablename__,
+    )
+    return [
+        weather[index]
+        for index in pc.indices_nonzero(pc.invert(invalid)).to_pylist()
+    ]
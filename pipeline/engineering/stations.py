@@ -0,0 +1,168 @@
+"""
+A module for stations in the pipeline-engineering package.
+"""
+
+import csv
+import math
+from functools import lru_cache
+from typing import Iterable, Iterator, Mapping
+
+from pydantic import NonNegativeFloat
+from pydantic_extra_types.coordinate import Latitude, Longitude
+
+from pipeline.schemas.files.station import Station
+
+EARTH_RADIUS_KM: float = 6371.0088
+Point = tuple[float, float, float]
+
+
+def _to_point(lat: float, lon: float) -> Point:
+    phi: float = math.radians(lat)
+    lambda_: float = math.radians(lon)
+    return (
+        math.cos(phi) * math.cos(lambda_),
+        math.cos(phi) * math.sin(lambda_),
+        math.sin(phi),
+    )
+
+
+class StationRegistry(Mapping[str, Station]):
+    """
+    Registry of the weather stations by location name, with a KD-tree for
+     nearest station lookups. Coordinates are indexed as 3D unit vectors, so
+     the straight-line distance orders stations as the great-circle distance
+     does, without special cases at the poles or the antimeridian.
+    """
+
+    def __init__(self, stations: Iterable[Station]) -> None:
+        self._by_location: dict[str, Station] = {
+            station.location: station for station in stations
+        }
+        entries: list[tuple[Point, Station]] = [
+            (_to_point(station.lat, station.lon), station)
+            for station in self._by_location.values()
+        ]
+        self._build(entries, 0, len(entries), 0)
+        self._points: list[Point] = [point for point, _ in entries]
+        self._stations: list[Station] = [station for _, station in entries]
+
+    def __getitem__(self, location: str) -> Station:
+        return self._by_location[location]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_location)
+
+    def __len__(self) -> int:
+        return len(self._by_location)
+
+    def coordinates(self, location: str) -> tuple[Latitude, Longitude]:
+        """
+        Get the coordinates of a weather station
+        :param location: The name of the weather station
+        :type location: str
+        :return: The latitude and longitude of the station
+        :rtype: tuple[Latitude, Longitude]
+        """
+        station: Station = self._by_location[location]
+        return station.lat, station.lon
+
+    def nearest(self, lat: Latitude, lon: Longitude) -> Station:
+        """
+        Find the weather station nearest to some coordinates
+        :param lat: The latitude to look up
+        :type lat: Latitude
+        :param lon: The longitude to look up
+        :type lon: Longitude
+        :return: The nearest weather station
+        :rtype: Station
+        """
+        return self.nearest_with_distance(lat, lon)[0]
+
+    def nearest_with_distance(
+        self, lat: Latitude, lon: Longitude
+    ) -> tuple[Station, NonNegativeFloat]:
+        """
+        Find the weather station nearest to some coordinates and its
+         great-circle distance
+        :param lat: The latitude to look up
+        :type lat: Latitude
+        :param lon: The longitude to look up
+        :type lon: Longitude
+        :return: The nearest weather station and its distance in kilometers
+        :rtype: tuple[Station, NonNegativeFloat]
+        """
+        if not self._points:
+            raise LookupError("The station registry is empty")
+        squared_chord, index = self._search(
+            _to_point(lat, lon), 0, len(self._points), 0, (math.inf, -1)
+        )
+        angle: float = 2 * math.asin(min(math.sqrt(squared_chord) / 2, 1.0))
+        return self._stations[index], angle * EARTH_RADIUS_KM
+
+    @classmethod
+    def _build(
+        cls,
+        entries: list[tuple[Point, Station]],
+        start: int,
+        stop: int,
+        depth: int,
+    ) -> None:
+        # Sort in place into an implicit tree: the median of each slice is
+        # the node and the halves on either side are its subtrees.
+        if stop - start < 2:
+            return
+        axis: int = depth % 3
+        entries[start:stop] = sorted(
+            entries[start:stop], key=lambda entry: entry[0][axis]
+        )
+        middle: int = (start + stop) // 2
+        cls._build(entries, start, middle, depth + 1)
+        cls._build(entries, middle + 1, stop, depth + 1)
+
+    def _search(
+        self,
+        target: Point,
+        start: int,
+        stop: int,
+        depth: int,
+        best: tuple[float, int],
+    ) -> tuple[float, int]:
+        if start >= stop:
+            return best
+        middle: int = (start + stop) // 2
+        point: Point = self._points[middle]
+        distance: float = (
+            (target[0] - point[0]) ** 2
+            + (target[1] - point[1]) ** 2
+            + (target[2] - point[2]) ** 2
+        )
+        if distance < best[0]:
+            best = (distance, middle)
+        difference: float = target[depth % 3] - point[depth % 3]
+        near, far = (
+            ((start, middle), (middle + 1, stop))
+            if difference < 0
+            else ((middle + 1, stop), (start, middle))
+        )
+        best = self._search(target, *near, depth + 1, best)
+        if difference * difference < best[0]:
+            best = self._search(target, *far, depth + 1, best)
+        return best
+
+
+@lru_cache
+def get_station_registry(filepath: str, encoding: str) -> StationRegistry:
+    """
+    Get the registry of the weather stations of a reference CSV file,
+     loaded once per file
+    :param filepath: The path to the stations CSV file
+    :type filepath: str
+    :param encoding: The encoding of the file
+    :type encoding: str
+    :return: The station registry
+    :rtype: StationRegistry
+    """
+    with open(filepath, encoding=encoding, newline="") as text_io_wrapper:
+        return StationRegistry(
+            map(Station.model_validate, csv.DictReader(text_io_wrapper))
+        )
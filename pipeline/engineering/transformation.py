@@ -2,11 +2,27 @@
 A module for transformation in the pipeline-engineering package.
 """
 
+from datetime import UTC, datetime
+from typing import Any, Iterable, Type, TypeVar
+
 from pipeline.core.decorators import benchmark, with_logging
-from pipeline.models.weather import Weather
-from pipeline.schemas.api.weather import APIWeather, CurrentWeather
+from pipeline.models.forecast import (
+    DailyForecast,
+    ForecastAlert,
+    ForecastRecord,
+    HourlyForecast,
+    MinutelyForecast,
+)
+from pipeline.models.weather import Weather, WeatherRecord
+from pipeline.schemas.api.weather import (
+    APIWeather,
+    CurrentWeather,
+    WeatherDescription,
+)
 from pipeline.schemas.files.weather import CSVWeather
 
+W = TypeVar("W", Weather, WeatherRecord)
+
 
 @with_logging
 @benchmark
@@ -20,9 +36,73 @@ def transform_data(csv_weather: CSVWeather, api_weather: APIWeather) -> Weather:
     :return: Combined weather data
     :rtype: Weather
     """
+    return _build_weather(csv_weather, _current_fields(api_weather), Weather)
+
+
+@with_logging
+@benchmark
+def transform_batch(
+    csv_weather: Iterable[CSVWeather],
+    api_weather: dict[str, APIWeather],
+    trusted: bool = False,
+) -> list[Weather] | list[WeatherRecord]:
+    """
+    Transform every CSV row by joining it with the API data of its
+     location. The API side is the build side of a hash join: its fields are
+     prepared once per location and probed by each row. Rows without API data
+     for their location are skipped.
+    :param csv_weather: Weather data from the CSV.
+    :type csv_weather: Iterable[CSVWeather]
+    :param api_weather: Current weather data from the API by location.
+    :type api_weather: dict[str, APIWeather]
+    :param trusted: Whether to build lightweight records instead of ORM
+     instances, for data loaded in bulk
+    :type trusted: bool
+    :return: Combined weather data
+    :rtype: list[Weather] | list[WeatherRecord]
+    """
+    current_fields: dict[str, dict[str, Any]] = {
+        location: _current_fields(weather)
+        for location, weather in api_weather.items()
+    }
+    if trusted:
+        return _join_weather(csv_weather, current_fields, WeatherRecord)
+    return _join_weather(csv_weather, current_fields, Weather)
+
+
+def _current_fields(api_weather: APIWeather) -> dict[str, Any]:
     current_weather: CurrentWeather = api_weather.current
-    weather: Weather = Weather(
+    return {
+        "current_temp": current_weather.temp,
+        "current_humidity": current_weather.humidity,
+        "current_weather_description": (
+            current_weather.weather[0].description
+            if current_weather.weather
+            else "No description"
+        ),
+    }
+
+
+def _join_weather(
+    csv_weather: Iterable[CSVWeather],
+    current_fields: dict[str, dict[str, Any]],
+    factory: Type[W],
+) -> list[W]:
+    return [
+        _build_weather(row, fields, factory)
+        for row in csv_weather
+        if (fields := current_fields.get(row.location)) is not None
+    ]
+
+
+def _build_weather(
+    csv_weather: CSVWeather,
+    current_fields: dict[str, Any],
+    factory: Type[W],
+) -> W:
+    return factory(
         date=csv_weather.date,
+        location=csv_weather.location,
         min_temp=csv_weather.min_temp,
         max_temp=csv_weather.max_temp,
         rainfall=csv_weather.rainfall,
@@ -30,12 +110,100 @@ def transform_data(csv_weather: CSVWeather, api_weather: APIWeather) -> Weather:
         humidity_3pm=csv_weather.humidity_3pm,
         temp_9am=csv_weather.temp_9am,
         temp_3pm=csv_weather.temp_3pm,
-        current_temp=current_weather.temp,
-        current_humidity=current_weather.humidity,
-        current_weather_description=(
-            current_weather.weather[0].description
-            if current_weather.weather
-            else "No description"
-        ),
+        **current_fields,
     )
-    return weather
+
+
+@with_logging
+@benchmark
+def transform_forecasts(
+    api_weather: dict[str, APIWeather],
+) -> list[ForecastRecord]:
+    """
+    Flatten the minutely, hourly and daily forecasts and the alerts of
+     every location into rows of the forecast tables. Sections that were
+     excluded from the API response produce no rows.
+    :param api_weather: Weather data from the API by location.
+    :type api_weather: dict[str, APIWeather]
+    :return: The flattened forecasts
+    :rtype: list[ForecastRecord]
+    """
+    return [
+        ForecastRecord(
+            forecast={
+                "location": location,
+                "issued_at": _timestamp(weather.current.dt),
+                "lat": weather.lat,
+                "lon": weather.lon,
+                "timezone": weather.timezone,
+            },
+            children={
+                MinutelyForecast.__tablename__: [
+                    {
+                        "dt": _timestamp(minute.dt),
+                        "precipitation": minute.precipitation,
+                    }
+                    for minute in weather.minutely or ()
+                ],
+                HourlyForecast.__tablename__: [
+                    {
+                        "dt": _timestamp(hour.dt),
+                        "temp": hour.temp,
+                        "feels_like": hour.feels_like,
+                        "pressure": hour.pressure,
+                        "humidity": hour.humidity,
+                        "dew_point": hour.dew_point,
+                        "uvi": hour.uvi,
+                        "clouds": hour.clouds,
+                        "visibility": hour.visibility,
+                        "wind_speed": hour.wind_speed,
+                        "wind_deg": hour.wind_deg,
+                        "wind_gust": hour.wind_gust,
+                        "pop": hour.pop,
+                        "weather_description": _description(hour.weather),
+                    }
+                    for hour in weather.hourly or ()
+                ],
+                DailyForecast.__tablename__: [
+                    {
+                        "dt": _timestamp(day.dt),
+                        "summary": day.summary,
+                        "temp_min": day.temp.min,
+                        "temp_max": day.temp.max,
+                        "temp_day": day.temp.day,
+                        "temp_night": day.temp.night,
+                        "pressure": day.pressure,
+                        "humidity": day.humidity,
+                        "wind_speed": day.wind_speed,
+                        "wind_deg": day.wind_deg,
+                        "clouds": day.clouds,
+                        "pop": day.pop,
+                        "rain": day.rain,
+                        "uvi": day.uvi,
+                        "weather_description": _description(day.weather),
+                    }
+                    for day in weather.daily or ()
+                ],
+                ForecastAlert.__tablename__: [
+                    {
+                        "sender_name": alert.sender_name,
+                        "event": alert.event,
+                        "starts_at": _timestamp(alert.start),
+                        "ends_at": _timestamp(alert.end),
+                        "description": alert.description,
+                        "tags": alert.tags,
+                    }
+                    for alert in weather.alerts or ()
+                ],
+            },
+        )
+        for location, weather in api_weather.items()
+    ]
+
+
+def _timestamp(value: int) -> datetime:
+    return datetime.fromtimestamp(value, UTC)
+
+
+def _description(weather: list[WeatherDescription]) -> str | None:
+    return weather[0].description if weather else None
@@ -2,7 +2,9 @@
 A module for etl in the pipeline package.
 """
 
+import argparse
 import logging
+from datetime import date
 
 from pydantic import FilePath
 
@@ -11,10 +13,22 @@ from pipeline.config.settings import settings
 from pipeline.core.decorators import benchmark, with_logging
 from pipeline.core.logging_setup import setup_logging
 from pipeline.db.session import get_db
-from pipeline.engineering.extraction import extract_api_data, extract_csv_data
-from pipeline.engineering.loading import load_data
-from pipeline.engineering.transformation import transform_data
-from pipeline.models.weather import Weather
+from pipeline.engineering.extraction import (
+    extract_api_data_by_location,
+    extract_csv_files,
+    extract_landed_api_data,
+    extract_stations,
+)
+from pipeline.engineering.landing import LandingStore
+from pipeline.engineering.loading import load_batch, load_forecasts
+from pipeline.engineering.quality import check_weather
+from pipeline.engineering.stations import StationRegistry
+from pipeline.engineering.transformation import (
+    transform_batch,
+    transform_forecasts,
+)
+from pipeline.models.forecast import ForecastRecord
+from pipeline.models.weather import Weather, WeatherRecord
 from pipeline.schemas.api.weather import APIWeather
 from pipeline.schemas.files.weather import CSVWeather
 
@@ -24,26 +38,70 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 @with_logging
 @benchmark
-def main() -> None:
+def main(replay: bool = False, replay_date: date | None = None) -> None:
     """
     The main function to execute the pipeline
+    :param replay: Whether to rebuild the API data from the landing store
+     instead of calling the API
+    :type replay: bool
+    :param replay_date: The date partition to replay, the latest responses
+     of any date by default
+    :type replay_date: Optional[date]
     :return: None
     :rtype: NoneType
     """
     logger.info("Data extraction")
-    api_weather_data: APIWeather = extract_api_data(settings)
-    filepath: FilePath = FilePath("data/raw/weatherAUS.csv")
-    csv_weather_data: list[CSVWeather] = extract_csv_data(
-        filepath, init_settings
+    csv_weather_data: list[CSVWeather] = extract_csv_files(
+        init_settings.WEATHER_FILES, init_settings
     )
+    landing_store: LandingStore = LandingStore(
+        init_settings.LANDING_DIR, init_settings.LANDING_COMPRESSION_LEVEL
+    )
+    api_weather_data: dict[str, APIWeather]
+    if replay:
+        api_weather_data = extract_landed_api_data(
+            landing_store,
+            (row.location for row in csv_weather_data),
+            replay_date,
+        )
+    else:
+        stations: StationRegistry = extract_stations(
+            FilePath(init_settings.STATIONS_FILE), init_settings
+        )
+        api_weather_data = extract_api_data_by_location(
+            settings,
+            stations,
+            (row.location for row in csv_weather_data),
+            landing_store if init_settings.LANDING_ENABLED else None,
+        )
     logger.info("Data transformation")
-    weather: Weather = transform_data(csv_weather_data[0], api_weather_data)
+    weather: list[Weather] | list[WeatherRecord] = transform_batch(
+        csv_weather_data, api_weather_data, init_settings.CSV_TRUSTED_MODE
+    )
+    weather = check_weather(weather, init_settings)
+    forecasts: list[ForecastRecord] = transform_forecasts(api_weather_data)
     with get_db() as session:
-        load_data(session, weather)
-    logger.info("Loaded data")
+        loaded: int = load_batch(session, weather, settings.LOAD_BATCH_SIZE)
+        forecast_counts: dict[str, int] = load_forecasts(session, forecasts)
+    logger.info("Loaded %s rows", loaded)
+    logger.info("Loaded forecast rows by table: %s", forecast_counts)
 
 
 if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Run the weather pipeline"
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Rebuild the API data from the landing store, without network",
+    )
+    parser.add_argument(
+        "--replay-date",
+        type=date.fromisoformat,
+        help="Date partition to replay (YYYY-MM-DD), the latest by default",
+    )
+    args: argparse.Namespace = parser.parse_args()
     logger.info("Pipeline to be executed")
-    main()
+    main(args.replay, args.replay_date)
     logger.info("Pipeline finished")
@@ -55,3 +55,9 @@ class NoAPIResponseException(Exception):
     """Exception raised when no response is received from the API."""
 
     pass
+
+
+class CircuitOpenException(Exception):
+    """Exception raised when a call is rejected by an open circuit."""
+
+    pass
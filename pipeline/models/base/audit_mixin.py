@@ -55,7 +55,7 @@ class AuditMixin:
                 name=f"{table_name}_created_by_check",
             ),
             CheckConstraint(
-                "updated_by IS NULL OR" " updated_by <= CURRENT_TIMESTAMP",
+                "updated_at IS NULL OR" " updated_at <= CURRENT_TIMESTAMP",
                 name=f"{table_name}_updated_by_check",
             ),
         ]
@@ -0,0 +1,285 @@
+"""
+A module for forecast in the pipeline-models package.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    FLOAT,
+    INTEGER,
+    TEXT,
+    TIMESTAMP,
+    VARCHAR,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pipeline.models.base.audit_mixin import AuditMixin
+from pipeline.models.base.base_with_id import BaseWithID
+
+
+class Forecast(AuditMixin, BaseWithID):
+    __tablename__ = "forecast"
+
+    location: Mapped[str] = mapped_column(
+        VARCHAR(50),
+        index=True,
+        nullable=False,
+        comment="Weather station the forecast was requested for",
+    )
+    issued_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="Time of the current conditions of the response",
+    )
+    lat: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Latitude of the forecast",
+    )
+    lon: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Longitude of the forecast",
+    )
+    timezone: Mapped[str] = mapped_column(
+        VARCHAR(50),
+        comment="Timezone name of the location",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "location",
+            "issued_at",
+            name="forecast_location_issued_at_key",
+        ),
+    )
+
+
+class MinutelyForecast(AuditMixin, BaseWithID):
+    __tablename__ = "forecast_minutely"
+
+    forecast_id: Mapped[int] = mapped_column(
+        ForeignKey("forecast.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Forecast the row belongs to",
+    )
+    dt: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="Time of the forecasted minute",
+    )
+    precipitation: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Precipitation in millimeters per hour",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "forecast_id",
+            "dt",
+            name="forecast_minutely_forecast_id_dt_key",
+        ),
+    )
+
+
+class HourlyForecast(AuditMixin, BaseWithID):
+    __tablename__ = "forecast_hourly"
+
+    forecast_id: Mapped[int] = mapped_column(
+        ForeignKey("forecast.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Forecast the row belongs to",
+    )
+    dt: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="Time of the forecasted hour",
+    )
+    temp: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Temperature",
+    )
+    feels_like: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Temperature accounting for the human perception",
+    )
+    pressure: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Atmospheric pressure on the sea level in hPa",
+    )
+    humidity: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Humidity percentage",
+    )
+    dew_point: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Dew point temperature",
+    )
+    uvi: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="UV index",
+    )
+    clouds: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Cloudiness percentage",
+    )
+    visibility: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Average visibility in meters",
+    )
+    wind_speed: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Wind speed",
+    )
+    wind_deg: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Wind direction in meteorological degrees",
+    )
+    wind_gust: Mapped[float | None] = mapped_column(
+        FLOAT,
+        comment="Wind gust",
+    )
+    pop: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Probability of precipitation",
+    )
+    weather_description: Mapped[str | None] = mapped_column(
+        VARCHAR,
+        comment="Weather condition description",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "forecast_id",
+            "dt",
+            name="forecast_hourly_forecast_id_dt_key",
+        ),
+    )
+
+
+class DailyForecast(AuditMixin, BaseWithID):
+    __tablename__ = "forecast_daily"
+
+    forecast_id: Mapped[int] = mapped_column(
+        ForeignKey("forecast.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Forecast the row belongs to",
+    )
+    dt: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="Time of the forecasted day",
+    )
+    summary: Mapped[str | None] = mapped_column(
+        TEXT,
+        comment="Human-readable description of the day",
+    )
+    temp_min: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Minimum daily temperature",
+    )
+    temp_max: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Maximum daily temperature",
+    )
+    temp_day: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Day temperature",
+    )
+    temp_night: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Night temperature",
+    )
+    pressure: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Atmospheric pressure on the sea level in hPa",
+    )
+    humidity: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Humidity percentage",
+    )
+    wind_speed: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Wind speed",
+    )
+    wind_deg: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Wind direction in meteorological degrees",
+    )
+    clouds: Mapped[int] = mapped_column(
+        INTEGER,
+        comment="Cloudiness percentage",
+    )
+    pop: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Probability of precipitation",
+    )
+    rain: Mapped[float | None] = mapped_column(
+        FLOAT,
+        comment="Precipitation volume in millimeters",
+    )
+    uvi: Mapped[float] = mapped_column(
+        FLOAT,
+        comment="Maximum UV index of the day",
+    )
+    weather_description: Mapped[str | None] = mapped_column(
+        VARCHAR,
+        comment="Weather condition description",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "forecast_id",
+            "dt",
+            name="forecast_daily_forecast_id_dt_key",
+        ),
+    )
+
+
+class ForecastAlert(AuditMixin, BaseWithID):
+    __tablename__ = "forecast_alert"
+
+    forecast_id: Mapped[int] = mapped_column(
+        ForeignKey("forecast.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+        comment="Forecast the row belongs to",
+    )
+    sender_name: Mapped[str] = mapped_column(
+        VARCHAR,
+        comment="Name of the alert source",
+    )
+    event: Mapped[str] = mapped_column(
+        VARCHAR,
+        comment="Alert event name",
+    )
+    starts_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        comment="Start of the alert",
+    )
+    ends_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        comment="End of the alert",
+    )
+    description: Mapped[str] = mapped_column(
+        TEXT,
+        comment="Description of the alert",
+    )
+    tags: Mapped[list[str]] = mapped_column(
+        ARRAY(VARCHAR),
+        comment="Types of severe weather",
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastRecord:
+    """
+    Forecast of a location flattened into the rows of the forecast tables,
+     for bulk loads. Child rows are keyed by table name and get their
+     `forecast_id` when loaded.
+    """
+
+    forecast: dict[str, Any]
+    children: dict[str, list[dict[str, Any]]]
@@ -2,9 +2,10 @@
 A module for weather in the pipeline-models package.
 """
 
+from dataclasses import dataclass
 from datetime import date
 
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, UniqueConstraint
 from sqlalchemy.dialects.postgresql import DATE, FLOAT, INTEGER, VARCHAR
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,6 +14,89 @@ from pipeline.models.base.audit_mixin import AuditMixin
 from pipeline.models.base.base_with_id import BaseWithID
 
 
+@dataclass(frozen=True, slots=True)
+class RangeRule:
+    """
+    Inclusive bounds of a column, shared by the check constraint of the
+     table and the vectorized checks run before bulk loads
+    """
+
+    name: str
+    column: str
+    lowest: float | None = None
+    highest: float | None = None
+
+    @property
+    def condition(self) -> str:
+        """
+        The SQL condition of the check constraint
+        :return: The condition on the column
+        :rtype: str
+        """
+        if self.lowest is None:
+            return f"{self.column} <= {self.highest}"
+        if self.highest is None:
+            return f"{self.column} >= {self.lowest}"
+        return f"{self.column} BETWEEN {self.lowest} AND {self.highest}"
+
+
+WEATHER_RANGE_RULES: tuple[RangeRule, ...] = (
+    RangeRule(
+        "weather_min_temp_range_check",
+        "min_temp",
+        settings.LOWEST_TEMP,
+        settings.HIGHEST_TEMP,
+    ),
+    RangeRule(
+        "weather_max_temp_range_check",
+        "max_temp",
+        settings.LOWEST_TEMP,
+        settings.HIGHEST_TEMP,
+    ),
+    RangeRule(
+        "weather_max_rainfall_check",
+        "rainfall",
+        highest=settings.HIGHEST_RAIN_DEPTH,
+    ),
+    RangeRule(
+        "weather_humidity_9am_check",
+        "humidity_9am",
+        settings.LOWEST_HUMIDITY,
+        settings.HIGHEST_HUMIDITY,
+    ),
+    RangeRule(
+        "weather_humidity_3pm_check",
+        "humidity_3pm",
+        settings.LOWEST_HUMIDITY,
+        settings.HIGHEST_HUMIDITY,
+    ),
+    RangeRule(
+        "weather_current_humidity_check",
+        "current_humidity",
+        settings.LOWEST_HUMIDITY,
+        settings.HIGHEST_HUMIDITY,
+    ),
+    RangeRule(
+        "weather_temp_9am_range_check",
+        "temp_9am",
+        settings.LOWEST_TEMP,
+        settings.HIGHEST_TEMP,
+    ),
+    RangeRule(
+        "weather_temp_3pm_range_check",
+        "temp_3pm",
+        settings.LOWEST_TEMP,
+        settings.HIGHEST_TEMP,
+    ),
+    RangeRule(
+        "weather_current_temp_range_check",
+        "current_temp",
+        settings.LOWEST_TEMP,
+        settings.HIGHEST_TEMP,
+    ),
+)
+
+
 class Weather(AuditMixin, BaseWithID):
     __tablename__ = "weather"
 
@@ -20,9 +104,14 @@ class Weather(AuditMixin, BaseWithID):
         DATE,
         index=True,
         nullable=False,
-        unique=True,
         comment="Date for the record about the weather",
     )
+    location: Mapped[str] = mapped_column(
+        VARCHAR(50),
+        index=True,
+        nullable=False,
+        comment="Weather station of the record",
+    )
     min_temp: Mapped[float] = mapped_column(
         FLOAT,
         comment="Minimum temperature of the day",
@@ -65,55 +154,42 @@ class Weather(AuditMixin, BaseWithID):
     )
 
     __table_args__ = (
+        UniqueConstraint(
+            "date",
+            "location",
+            name="weather_date_location_key",
+        ),
         CheckConstraint(
             "date <= CURRENT_DATE",
             name="weather_date_check",
         ),
-        CheckConstraint(
-            f"min_temp BETWEEN {settings.LOWEST_TEMP} AND"
-            f" {settings.HIGHEST_TEMP}",
-            name="weather_min_temp_range_check",
-        ),
-        CheckConstraint(
-            f"max_temp BETWEEN {settings.LOWEST_TEMP} AND"
-            f" {settings.HIGHEST_TEMP}",
-            name="weather_max_temp_range_check",
-        ),
-        CheckConstraint(
-            f"rainfall <= {settings.HIGHEST_RAIN_DEPTH}",
-            name="weather_max_rainfall_check",
-        ),
-        CheckConstraint(
-            f"humidity_9am BETWEEN {settings.LOWEST_HUMIDITY} AND"
-            f" {settings.HIGHEST_HUMIDITY}",
-            name="weather_humidity_9am_check",
-        ),
-        CheckConstraint(
-            f"humidity_3pm BETWEEN {settings.LOWEST_HUMIDITY} AND"
-            f" {settings.HIGHEST_HUMIDITY}",
-            name="weather_humidity_3pm_check",
-        ),
-        CheckConstraint(
-            f"current_humidity BETWEEN {settings.LOWEST_HUMIDITY} AND"
-            f" {settings.HIGHEST_HUMIDITY}",
-            name="weather_current_humidity_check",
+        *(
+            CheckConstraint(rule.condition, name=rule.name)
+            for rule in WEATHER_RANGE_RULES
         ),
         CheckConstraint(
             "min_temp <= max_temp",
             name="weather_min_max_temp_check",
         ),
-        CheckConstraint(
-            f"temp_9am {settings.LOWEST_TEMP} AND {settings.HIGHEST_TEMP}",
-            name="weather_temp_9am_range_check",
-        ),
-        CheckConstraint(
-            f"temp_3pm BETWEEN {settings.LOWEST_TEMP} AND"
-            f" {settings.HIGHEST_TEMP}",
-            name="weather_temp_3pm_range_check",
-        ),
-        CheckConstraint(
-            f"current_temp BETWEEN {settings.LOWEST_TEMP} AND"
-            f" {settings.HIGHEST_TEMP}",
-            name="weather_current_temp_range_check",
-        ),
     )
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherRecord:
+    """
+    Row of the weather table built without the ORM instrumentation of
+     `Weather`, for bulk loads of trusted data
+    """
+
+    date: date
+    location: str
+    min_temp: float
+    max_temp: float
+    rainfall: float
+    humidity_9am: int
+    humidity_3pm: int
+    temp_9am: float
+    temp_3pm: float
+    current_temp: float
+    current_humidity: int
+    current_weather_description: str
@@ -0,0 +1,93 @@
+"""
+A module for forecast in the pipeline-repository package.
+"""
+
+import logging
+from typing import Any, Sequence
+
+from psycopg import sql
+from sqlalchemy import Row
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from pipeline.core.decorators import with_logging
+from pipeline.exceptions.exceptions import DataQualityException
+from pipeline.models.forecast import Forecast, ForecastRecord
+from pipeline.repository.base import BaseRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ForecastRepository(BaseRepository):
+    """
+    Repository class for Forecast-specific CRUD operations.
+    """
+
+    def __init__(self, session: Session):
+        super().__init__(session)
+
+    @with_logging
+    def bulk_load(self, forecasts: Sequence[ForecastRecord]) -> dict[str, int]:
+        """
+        Insert the forecasts and stream their child rows with `COPY`, one
+         statement per child table, committing once. Forecasts already
+         stored for the same location and time are skipped with their rows.
+        :param forecasts: The flattened forecasts
+        :type forecasts: Sequence[ForecastRecord]
+        :return: The number of rows written by table
+        :rtype: dict[str, int]
+        """
+        statement: Insert = insert(Forecast).on_conflict_do_nothing(
+            constraint="forecast_location_issued_at_key"
+        )
+        counts: dict[str, int] = {Forecast.__tablename__: 0}
+        if not forecasts:
+            return counts
+        try:
+            inserted: Sequence[Row[tuple[int, str]]] = self.session.execute(
+                statement.returning(Forecast.id, Forecast.location),
+                [forecast.forecast for forecast in forecasts],
+            ).all()
+            forecast_ids: dict[str, int] = {
+                location: forecast_id for forecast_id, location in inserted
+            }
+            counts[Forecast.__tablename__] = len(forecast_ids)
+            tables: dict[str, list[dict[str, Any]]] = {}
+            for forecast in forecasts:
+                forecast_id: int | None = forecast_ids.get(
+                    forecast.forecast["location"]
+                )
+                if forecast_id is None:
+                    continue
+                for table, rows in forecast.children.items():
+                    tables.setdefault(table, []).extend(
+                        {"forecast_id": forecast_id, **row} for row in rows
+                    )
+            for table, rows in tables.items():
+                counts[table] = self._copy_rows(table, rows)
+            self.session.commit()
+        except IntegrityError as exc:
+            self.session.rollback()
+            logger.error(f"Integrity error while loading forecasts: {exc}")
+            raise DataQualityException(
+                f"Data quality issue: {str(exc)}"
+            ) from exc
+        except SQLAlchemyError as exc:
+            self.handle_sql_exception("Failed to load forecasts: ", exc)
+        return counts
+
+    def _copy_rows(self, table: str, rows: list[dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        columns: list[str] = list(rows[0])
+        statement: sql.Composed = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(map(sql.Identifier, columns)),
+        )
+        connection: Any = self.session.connection().connection
+        with connection.driver_connection.cursor() as cursor:
+            with cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+        return len(rows)
@@ -3,7 +3,12 @@ A module for weather in the pipeline-repository package.
 """
 
 import logging
+from datetime import date
+from typing import Any, Sequence
 
+from pydantic import PositiveInt
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -12,7 +17,7 @@ from pipeline.exceptions.exceptions import (
     DataQualityException,
     DatabaseException,
 )
-from pipeline.models.weather import Weather
+from pipeline.models.weather import Weather, WeatherRecord
 from pipeline.repository.base import BaseRepository
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -37,7 +42,9 @@ class WeatherRepository(BaseRepository):
         """
         try:
             if existing_weather := (
-                self.session.query(Weather).filter_by(date=weather.date).first()
+                self.session.query(Weather)
+                .filter_by(date=weather.date, location=weather.location)
+                .first()
             ):
                 for key, value in weather.__dict__.items():
                     if key != "_sa_instance_state":
@@ -55,3 +62,69 @@ class WeatherRepository(BaseRepository):
             raise DatabaseException(
                 f"Database operation failed: {str(exc)}"
             ) from exc
+
+    @with_logging
+    def upsert_many(
+        self,
+        weather: Sequence[Weather | WeatherRecord],
+        batch_size: PositiveInt,
+    ) -> int:
+        """
+        Insert or update many Weather instances or records with batched
+         `INSERT ... ON CONFLICT (date, location) DO UPDATE` executions,
+         committing once.
+        :param weather: The Weather instances or records to be inserted or
+         updated.
+        :type weather: Sequence[Weather | WeatherRecord]
+        :param batch_size: The number of rows per execution
+        :type batch_size: PositiveInt
+        :return: The number of rows written
+        :rtype: int
+        """
+        columns: list[str] = [
+            column.key
+            for column in Weather.__table__.columns
+            if column.key
+            not in (
+                "id",
+                "created_by",
+                "created_at",
+                "updated_by",
+                "updated_at",
+            )
+        ]
+        rows: dict[tuple[date, str], dict[str, Any]] = {
+            (item.date, item.location): {
+                column: getattr(item, column) for column in columns
+            }
+            for item in weather
+        }
+        values: list[dict[str, Any]] = list(rows.values())
+        statement: Insert = insert(Weather)
+        statement = statement.on_conflict_do_update(
+            constraint="weather_date_location_key",
+            set_={
+                **{
+                    column: statement.excluded[column]
+                    for column in columns
+                    if column not in ("date", "location")
+                },
+                "updated_by": func.current_user(),
+                "updated_at": func.current_timestamp(),
+            },
+        )
+        try:
+            for start in range(0, len(values), batch_size):
+                self.session.execute(
+                    statement, values[start : start + batch_size]
+                )
+            self.session.commit()
+        except IntegrityError as exc:
+            self.session.rollback()
+            logger.error(f"Integrity error while upserting weather data: {exc}")
+            raise DataQualityException(
+                f"Data quality issue: {str(exc)}"
+            ) from exc
+        except SQLAlchemyError as exc:
+            self.handle_sql_exception("Failed to upsert weather data: ", exc)
+        return len(values)
@@ -0,0 +1,113 @@
+"""
+A module for lazy in the pipeline.schemas.api package.
+"""
+
+from types import GenericAlias
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    get_args,
+    overload,
+)
+
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class LazyList(Sequence[M], Generic[M]):
+    """
+    List of models validated on first access. Only the outer list is
+     checked while the parent model is validated; the items stay as decoded
+     JSON until they are read, so unused sections cost no validation.
+    A ValidationError is therefore raised on first access, not on parsing.
+    """
+
+    __slots__ = ("_raw", "_items", "_adapter")
+
+    def __init__(self, raw: list[Any], adapter: TypeAdapter[list[M]]) -> None:
+        self._raw: list[Any] | None = raw
+        self._items: list[M] | None = None
+        self._adapter: TypeAdapter[list[M]] = adapter
+
+    @property
+    def is_validated(self) -> bool:
+        """
+        Whether the items were already validated
+        :return: True if the items are models
+        :rtype: bool
+        """
+        return self._items is not None
+
+    @property
+    def items(self) -> list[M]:
+        """
+        The validated items, validated on the first call
+        :return: The items as models
+        :rtype: list[M]
+        """
+        if self._items is None:
+            self._items = self._adapter.validate_python(self._raw)
+            self._raw = None
+        return self._items
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | list[M]:
+        return self.items[index]
+
+    def __iter__(self) -> Iterator[M]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return len(self._raw or ())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyList):
+            return self.items == other.items
+        return self.items == other
+
+    def __repr__(self) -> str:
+        state: str = "validated" if self.is_validated else "pending"
+        return f"{type(self).__name__}[{state}]({len(self)} items)"
+
+    def dump(self, mode: Literal["json", "python"] = "python") -> list[Any]:
+        """
+        Serialize the items, returning the raw data if not validated yet
+        :param mode: The pydantic serialization mode
+        :type mode: Literal["json", "python"]
+        :return: The serialized items
+        :rtype: list[Any]
+        """
+        if self._items is None:
+            return list(self._raw or ())
+        dumped: list[Any] = self._adapter.dump_python(self._items, mode=mode)
+        return dumped
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        (item_type,) = get_args(source) or (Any,)
+        adapter: TypeAdapter[list[Any]] = TypeAdapter(
+            GenericAlias(list, (item_type,))
+        )
+        return core_schema.no_info_after_validator_function(
+            lambda raw: cls(raw, adapter),
+            core_schema.list_schema(core_schema.any_schema()),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value, info: value.dump(info.mode),
+                info_arg=True,
+            ),
+        )
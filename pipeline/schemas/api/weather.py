@@ -15,6 +15,7 @@ from pydantic import (
 from pydantic_extra_types.coordinate import Latitude, Longitude
 
 from pipeline.config.settings import settings
+from pipeline.schemas.api.lazy import LazyList
 
 T = TypeVar("T", bound="BaseModel")
 
@@ -174,7 +175,7 @@ class APIWeather(BaseModel):
     timezone: str
     timezone_offset: int
     current: CurrentWeather
-    minutely: Optional[list[MinutelyWeather]] = None
-    hourly: Optional[list[HourlyWeather]] = None
-    daily: Optional[list[DailyWeather]] = None
-    alerts: Optional[list[Alert]] = None
+    minutely: Optional[LazyList[MinutelyWeather]] = None
+    hourly: Optional[LazyList[HourlyWeather]] = None
+    daily: Optional[LazyList[DailyWeather]] = None
+    alerts: Optional[LazyList[Alert]] = None
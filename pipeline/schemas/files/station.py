@@ -0,0 +1,32 @@
+"""
+A module for station in the pipeline.schemas.files package.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_extra_types.coordinate import Latitude, Longitude
+
+
+class Station(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        frozen=True,
+    )
+
+    location: str = Field(
+        ...,
+        alias="Location",
+        title="Location",
+        description="Name of the weather station as used in weatherAUS",
+    )
+    lat: Latitude = Field(
+        ...,
+        alias="Latitude",
+        title="Latitude",
+        description="Latitude of the weather station",
+    )
+    lon: Longitude = Field(
+        ...,
+        alias="Longitude",
+        title="Longitude",
+        description="Longitude of the weather station",
+    )
@@ -114,16 +114,16 @@ class CSVWeather(BaseModel):
         alias="Humidity9am",
         title="Humidity at 9 AM",
         description="Humidity percentage at 9 AM",
-        le=settings.LOWEST_HUMIDITY,
-        ge=settings.HIGHEST_HUMIDITY,
+        ge=settings.LOWEST_HUMIDITY,
+        le=settings.HIGHEST_HUMIDITY,
     )
     humidity_3pm: NonNegativeInt = Field(
         ...,
         alias="Humidity3pm",
         title="Humidity at 3 PM",
         description="Humidity percentage at 3 PM",
-        le=settings.LOWEST_HUMIDITY,
-        ge=settings.HIGHEST_HUMIDITY,
+        ge=settings.LOWEST_HUMIDITY,
+        le=settings.HIGHEST_HUMIDITY,
     )
     pressure_9am: PositiveFloat = Field(
         ...,
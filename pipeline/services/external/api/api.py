@@ -4,7 +4,14 @@ A module for api in the pipeline.services.external.api package.
 
 import logging
 import time
-from typing import Any, Optional, Type, Union
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, Type, Union
 
 import requests
 from pydantic import NonNegativeInt, TypeAdapter
@@ -16,15 +23,33 @@ from pipeline.config.settings import Settings
 from pipeline.core.decorators import benchmark, with_logging
 from pipeline.exceptions.exceptions import (
     APIValidationError,
+    CircuitOpenException,
     ConnectionException,
     NoAPIResponseException,
     RateLimitExceededException,
 )
 from pipeline.schemas.api.weather import T
+from pipeline.services.external.api.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRetry,
+    LatencyTracker,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def get_type_adapter(response_model: Type[T]) -> TypeAdapter[T]:
+    """
+    Get the type adapter of a response model, built once per model
+    :param response_model: The model of the response
+    :type response_model: Type[T]
+    :return: The type adapter of the model
+    :rtype: TypeAdapter[T]
+    """
+    return TypeAdapter(response_model)
+
+
 class ApiService:
     """
     The class that provides the API service for interaction with its endpoints.
@@ -37,6 +62,16 @@ class ApiService:
         self.settings: Settings = settings
         self.last_request_time: float = time.time()
         self.request_count: NonNegativeInt = 0
+        self.circuit_breaker: CircuitBreaker = CircuitBreaker(
+            failure_rate_threshold=settings.CIRCUIT_FAILURE_RATE,
+            window_size=settings.CIRCUIT_WINDOW_SIZE,
+            minimum_calls=settings.CIRCUIT_MINIMUM_CALLS,
+            open_timeout=settings.CIRCUIT_OPEN_TIMEOUT,
+            half_open_calls=settings.CIRCUIT_HALF_OPEN_CALLS,
+        )
+        self.latency_tracker: LatencyTracker = LatencyTracker(
+            settings.LATENCY_WINDOW_SIZE
+        )
         self.session: requests.Session = self._initialize_session()
 
     @with_logging
@@ -58,13 +93,15 @@ class ApiService:
     ) -> HTTPAdapter:
         """
         Configures and returns a custom HTTP adapter for the session, based
-         on settings.
+         on settings. Every failed attempt is reported to the circuit
+         breaker.
         """
-        retries: Retry = Retry(
+        retries: Retry = CircuitBreakerRetry(
             total=self.settings.MAX_RETRIES,
             backoff_factor=self.settings.RETRY_BACKOFF_FACTOR,
             backoff_max=self.settings.BACKOFF_MAX,
             status_forcelist=self.settings.RETRY_STATUS_FORCE_LIST,
+            circuit_breaker=self.circuit_breaker,
         )
         adapter: HTTPAdapter = HTTPAdapter(
             pool_connections=self.settings.POOL_CONNECTIONS,
@@ -112,27 +149,160 @@ class ApiService:
         :rtype: dict[str, Union[dict[str,
          Union[dict[str, Any], list[dict[str, Any]]]], Any]]
         """
+        model_instance: T = get_type_adapter(response_model).validate_json(
+            self._api_request(endpoint, method, params, data, headers)
+        )
+        if hasattr(model_instance, "meta") and model_instance.meta is None:
+            logger.warning("Expected pagination data missing in response")
+        return model_instance
+
+    def _api_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[dict[str, Union[str, int]]] = None,
+        data: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> bytes:
+        """
+        Perform an API request with rate limit checking, without parsing
+         the response. Calls fail fast with CircuitOpenException while the
+         circuit breaker is open, and the outcome of every attempt is
+         recorded by it; GET requests are hedged if enabled.
+        :param endpoint: The API endpoint to call.
+        :type endpoint: str
+        :param method: The HTTP method for the API call (e.g., "GET", "POST").
+        :type method: str
+        :param params: Query parameters to include in the request.
+        :type params: Optional[dict[str, Union[str, int]]]
+        :param data: JSON data to include in the request body.
+        :type data: Optional[dict[str, Any]]
+        :param headers: Additional headers to include in the request.
+        :type headers: Optional[dict[str, str]]
+        :return: The raw response body.
+        :rtype: bytes
+        """
+        self.circuit_breaker.before_call()
         self._ensure_rate_limit()
         url: str = (
             f"{self.settings.API_URL}{endpoint}"
             f"{self.settings.ID_PATH_PARAMETER}{self.settings.API_KEY}"
         )
+        request: Callable[[], bytes] = partial(
+            self._send, method, url, params, data, headers
+        )
+        if self.settings.HEDGE_REQUESTS and method == "GET":
+            return self._hedged(request)
+        return request()
+
+    def _hedged(self, request: Callable[[], bytes]) -> bytes:
+        """
+        Send a request and, if it has not answered after the p95 latency,
+         a duplicate of it, returning the first successful response. The
+         duplicate takes its own circuit breaker permit, so it is not sent
+         when the half-open trial calls are all in flight. The executor of
+         the call is shut down on return: a duplicate not yet started is
+         cancelled, and a slower request still in flight ends within its
+         timeouts with its result discarded.
+        :param request: The request to send
+        :type request: Callable[[], bytes]
+        :return: The raw response body.
+        :rtype: bytes
+        """
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="hedge"
+        )
         try:
-            response: Response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=headers,
-                json=data,
-            )
+            pending: set[Future[bytes]] = {executor.submit(request)}
+            delay: float | None = self._hedge_delay()
+            if delay is not None:
+                done, pending = wait(pending, timeout=delay)
+                if done:
+                    return done.pop().result()
+                try:
+                    self.circuit_breaker.before_call()
+                except CircuitOpenException:
+                    logger.debug("Not hedging request, no circuit permit")
+                else:
+                    logger.debug("Hedging request after %.3f seconds", delay)
+                    self._ensure_rate_limit()
+                    pending.add(executor.submit(request))
+            error: BaseException | None = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if (error := future.exception()) is None:
+                        return future.result()
+            raise error  # type: ignore
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _hedge_delay(self) -> float | None:
+        """
+        Get the delay after which a request is duplicated: the p95 of the
+         recent latencies, at least HEDGE_MIN_DELAY
+        :return: The delay in seconds, None until HEDGE_MIN_SAMPLES
+         latencies are recorded
+        :rtype: Optional[float]
+        """
+        if len(self.latency_tracker) < self.settings.HEDGE_MIN_SAMPLES:
+            return None
+        p95: float | None = self.latency_tracker.percentile(95)
+        return None if p95 is None else max(p95, self.settings.HEDGE_MIN_DELAY)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Union[str, int]]],
+        data: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+    ) -> bytes:
+        """
+        Send a single request through the session, with its retries, and
+         record its outcome and latency. Failed attempts are recorded by
+         the retry policy; a returned response counts as a failure if it
+         is a server error or its body cannot be read.
+        :param method: The HTTP method for the API call (e.g., "GET", "POST").
+        :type method: str
+        :param url: The URL of the request, API key included.
+        :type url: str
+        :param params: Query parameters to include in the request.
+        :type params: Optional[dict[str, Union[str, int]]]
+        :param data: JSON data to include in the request body.
+        :type data: Optional[dict[str, Any]]
+        :param headers: Additional headers to include in the request.
+        :type headers: Optional[dict[str, str]]
+        :return: The raw response body.
+        :rtype: bytes
+        """
+        answered: list[Response] = []
+        try:
+            start_time: float = time.perf_counter()
+            try:
+                response: Response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    json=data,
+                    timeout=(
+                        self.settings.CONNECT_TIMEOUT,
+                        self.settings.READ_TIMEOUT,
+                    ),
+                    hooks={"response": lambda r, **_: answered.append(r)},
+                )
+            except requests.exceptions.RequestException:
+                if answered:
+                    self.circuit_breaker.record_failure()
+                raise
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
             response.raise_for_status()
-            type_adapter: TypeAdapter[T] = TypeAdapter(response_model)
-            print(response.json())
-            print(type(response.json()))
-            model_instance: T = type_adapter.validate_python(response.json())
-            if hasattr(model_instance, "meta") and model_instance.meta is None:
-                logger.warning("Expected pagination data missing in response")
-            return model_instance
+            self.latency_tracker.record(time.perf_counter() - start_time)
+            return response.content
         except requests.exceptions.HTTPError as exc:
             if exc.response is not None and exc.response.status_code == 429:
                 raise RateLimitExceededException(
@@ -0,0 +1,272 @@
+"""
+A module for resilience in the pipeline.services.external.api package.
+"""
+
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from enum import StrEnum
+from types import TracebackType
+from typing import Any, Callable, Self
+
+from pydantic import NonNegativeFloat, PositiveFloat, PositiveInt
+from urllib3 import BaseHTTPResponse, Retry
+from urllib3.connectionpool import ConnectionPool
+from urllib3.exceptions import MaxRetryError, ResponseError
+
+from pipeline.exceptions.exceptions import CircuitOpenException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """
+    States of a circuit breaker
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker over a sliding window of the latest call outcomes.
+    The circuit opens when the failure rate of the window reaches the
+     threshold, and calls fail fast while it is open. After the open
+     timeout, a limited number of trial calls go through: the circuit closes
+     if they all succeed and opens again on the first failure.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float,
+        window_size: PositiveInt,
+        minimum_calls: PositiveInt,
+        open_timeout: PositiveFloat,
+        half_open_calls: PositiveInt,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.minimum_calls: PositiveInt = minimum_calls
+        self.open_timeout: PositiveFloat = open_timeout
+        self.half_open_calls: PositiveInt = half_open_calls
+        self._clock: Callable[[], float] = clock
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state: CircuitState = CircuitState.CLOSED
+        self._opened_at: float = 0.0
+        self._trials_started: int = 0
+        self._trials_succeeded: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        The current state, moving from open to half-open once the open
+         timeout has elapsed
+        :return: The state of the circuit
+        :rtype: CircuitState
+        """
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        The failure rate of the calls in the window
+        :return: The ratio of failed calls, 0 without calls
+        :rtype: float
+        """
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may go through, raising if the circuit is open
+         or all the trial calls of the half-open state are in flight
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            state: CircuitState = self._current_state()
+            if state is CircuitState.CLOSED:
+                return
+            if (
+                state is CircuitState.HALF_OPEN
+                and self._trials_started < self.half_open_calls
+            ):
+                self._trials_started += 1
+                return
+            retry_in: float = max(
+                self._opened_at + self.open_timeout - self._clock(), 0.0
+            )
+        raise CircuitOpenException(
+            f"Circuit is {state}, calls are rejected for {retry_in:.1f}"
+            f" more seconds"
+        )
+
+    def record_success(self) -> None:
+        """
+        Record a call answered by the upstream
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            if self._current_state() is not CircuitState.HALF_OPEN:
+                self._outcomes.append(True)
+                return
+            self._trials_succeeded += 1
+            if self._trials_succeeded >= self.half_open_calls:
+                logger.info("Circuit closed after successful trial calls")
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+
+    def record_failure(self) -> None:
+        """
+        Record a call that failed because of the upstream, opening the
+         circuit if the failure rate reaches the threshold
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            state: CircuitState = self._current_state()
+            if state is CircuitState.HALF_OPEN:
+                self._open("a trial call failed")
+                return
+            self._outcomes.append(False)
+            if state is CircuitState.CLOSED and (
+                len(self._outcomes) >= self.minimum_calls
+                and self._outcomes.count(False) / len(self._outcomes)
+                >= self.failure_rate_threshold
+            ):
+                self._open(
+                    f"{self._outcomes.count(False)} of the last"
+                    f" {len(self._outcomes)} calls failed"
+                )
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trials_started = 0
+            self._trials_succeeded = 0
+        return self._state
+
+    def _open(self, reason: str) -> None:
+        logger.warning(
+            "Circuit opened for %s seconds: %s", self.open_timeout, reason
+        )
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+
+class CircuitBreakerRetry(Retry):
+    """
+    Retry policy reporting every failed attempt to a circuit breaker, so
+     the retries of a call do not hide upstream failures from it. Retrying
+     stops as soon as the circuit opens.
+    """
+
+    def __init__(
+        self, *args: Any, circuit_breaker: CircuitBreaker, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.circuit_breaker: CircuitBreaker = circuit_breaker
+
+    def new(self, **kw: Any) -> Self:
+        """
+        Copy the policy for the next attempt, keeping the circuit breaker
+        :param kw: The retry parameters to override
+        :type kw: Any
+        :return: The retry policy of the next attempt
+        :rtype: Self
+        """
+        return super().new(circuit_breaker=self.circuit_breaker, **kw)
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        _pool: ConnectionPool | None = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> Self:
+        """
+        Record a failed attempt, an error or a server error response, and
+         give up if the circuit is open. Other retried responses, such as
+         429, are answers of the upstream and are not recorded.
+        :param method: The HTTP method of the request
+        :type method: Optional[str]
+        :param url: The URL of the request
+        :type url: Optional[str]
+        :param response: The response of the attempt, if any
+        :type response: Optional[BaseHTTPResponse]
+        :param error: The error of the attempt, if any
+        :type error: Optional[Exception]
+        :param _pool: The connection pool of the request
+        :type _pool: Optional[ConnectionPool]
+        :param _stacktrace: The traceback of the error
+        :type _stacktrace: Optional[TracebackType]
+        :return: The retry policy of the next attempt
+        :rtype: Self
+        """
+        if error is not None or (
+            response is not None and response.status >= 500
+        ):
+            self.circuit_breaker.record_failure()
+            if self.circuit_breaker.state is CircuitState.OPEN:
+                raise MaxRetryError(
+                    _pool,  # type: ignore
+                    url or "",
+                    error or ResponseError("the circuit is open"),
+                )
+        return super().increment(
+            method, url, response, error, _pool, _stacktrace
+        )
+
+
+class LatencyTracker:
+    """
+    Sliding window of the latest request latencies, used to derive the
+     delay of hedged requests
+    """
+
+    def __init__(self, window_size: PositiveInt) -> None:
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, latency: NonNegativeFloat) -> None:
+        """
+        Record the latency of a request
+        :param latency: The latency in seconds
+        :type latency: NonNegativeFloat
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def percentile(self, percent: PositiveInt) -> float | None:
+        """
+        Get a percentile of the recorded latencies
+        :param percent: The percentile, between 1 and 99
+        :type percent: PositiveInt
+        :return: The latency in seconds, None with less than two samples
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            if len(self._latencies) < 2:
+                return None
+            return statistics.quantiles(
+                self._latencies, n=100, method="inclusive"
+            )[percent - 1]
@@ -4,6 +4,7 @@ A module for weather API interactions in the pipeline.services.external.api
 """
 
 import logging
+from typing import Iterable
 
 from pydantic_extra_types.coordinate import Latitude, Longitude
 
@@ -26,6 +27,7 @@ class WeatherApiService(ApiService):
         lat: Latitude | None = None,
         lng: Longitude | None = None,
         units: str = "metric",
+        exclude: Iterable[str] | None = None,
     ) -> APIWeather:
         """
         Retrieves the weather data for a given location.
@@ -35,15 +37,13 @@ class WeatherApiService(ApiService):
         :type lng: Optional[Longitude]
         :param units: The units of measurement (default: metric).
         :type units: str
+        :param exclude: The parts of the response to leave out, e.g.
+         minutely or alerts (default: the API_EXCLUDE setting).
+        :type exclude: Optional[Iterable[str]]
         :return: The weather data for the specified location.
         :rtype: APIWeatherModel
         """
-        latitude: Latitude = lat or self.settings.DEFAULT_LAT
-        longitude: Longitude = lng or self.settings.DEFAULT_LNG
-        endpoint = f"{latitude}{self.settings.PATH_PARAMETER}{longitude}"
-        params: dict[str, str | int] = {
-            "units": units,
-        }
+        endpoint, params = self._build_request(lat, lng, units, exclude)
         weather_data: APIWeather = self._api_call(
             endpoint=endpoint,
             response_model=APIWeather,
@@ -51,3 +51,48 @@ class WeatherApiService(ApiService):
             params=params,
         )
         return weather_data
+
+    @with_logging
+    def get_weather_content(
+        self,
+        lat: Latitude | None = None,
+        lng: Longitude | None = None,
+        units: str = "metric",
+        exclude: Iterable[str] | None = None,
+    ) -> bytes:
+        """
+        Retrieves the raw weather response for a given location, to be
+         stored before it is parsed.
+        :param lat: The latitude for which to retrieve the weather data.
+        :type lat: Optional[Latitude]
+        :param lng: The longitude for which to retrieve the weather data.
+        :type lng: Optional[Longitude]
+        :param units: The units of measurement (default: metric).
+        :type units: str
+        :param exclude: The parts of the response to leave out, e.g.
+         minutely or alerts (default: the API_EXCLUDE setting).
+        :type exclude: Optional[Iterable[str]]
+        :return: The JSON response body.
+        :rtype: bytes
+        """
+        endpoint, params = self._build_request(lat, lng, units, exclude)
+        return self._api_request(endpoint=endpoint, method="GET", params=params)
+
+    def _build_request(
+        self,
+        lat: Latitude | None,
+        lng: Longitude | None,
+        units: str,
+        exclude: Iterable[str] | None,
+    ) -> tuple[str, dict[str, str | int]]:
+        latitude: Latitude = lat or self.settings.DEFAULT_LAT
+        longitude: Longitude = lng or self.settings.DEFAULT_LNG
+        endpoint = f"{latitude}{self.settings.PATH_PARAMETER}{longitude}"
+        params: dict[str, str | int] = {
+            "units": units,
+        }
+        if excluded := ",".join(
+            self.settings.API_EXCLUDE if exclude is None else exclude
+        ):
+            params["exclude"] = excluded
+        return endpoint, params
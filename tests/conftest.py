@@ -0,0 +1,38 @@
+"""
+A module for conftest in the tests package.
+"""
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine, delete
+from sqlalchemy.exc import OperationalError
+
+from app.db.base import Base
+from app.db.session import get_engine
+from app.models.user import User
+
+TEST_USER_PREFIX: str = "tst"
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """
+    Database engine with the users table, skipping the test when the
+     configured database is unreachable, and removing the test users
+     afterward
+    """
+    try:
+        db_engine: Engine = get_engine()
+        Base.metadata.create_all(db_engine, tables=[User.__table__])
+    except OperationalError as exc:
+        pytest.skip(f"Database unavailable: {exc}")
+    with db_engine.begin() as connection:
+        connection.execute(
+            delete(User).where(User.username.startswith(TEST_USER_PREFIX))
+        )
+    yield db_engine
+    with db_engine.begin() as connection:
+        connection.execute(
+            delete(User).where(User.username.startswith(TEST_USER_PREFIX))
+        )
@@ -0,0 +1,68 @@
+"""
+A module for fakes in the tests package.
+"""
+
+import time
+from typing import Any
+
+
+class FakeRedis:
+    """
+    In-memory stand-in of the Redis client subset used by the cache, with
+     key expiration and a switch to simulate an unreachable server
+    """
+
+    def __init__(self) -> None:
+        self.store: dict[str, tuple[float | None, bytes]] = {}
+        self.available: bool = True
+
+    def _check(self) -> None:
+        if not self.available:
+            raise ConnectionError("Redis is unavailable")
+
+    def get(self, name: str) -> bytes | None:
+        """
+        Get the value of a key
+        :param name: The key
+        :type name: str
+        :return: The value or None if the key does not exist or expired
+        :rtype: Optional[bytes]
+        """
+        self._check()
+        entry: tuple[float | None, bytes] | None = self.store.get(name)
+        if entry is None:
+            return None
+        if entry[0] is not None and entry[0] < time.monotonic():
+            del self.store[name]
+            return None
+        return entry[1]
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        """
+        Set the value of a key
+        :param name: The key
+        :type name: str
+        :param value: The value
+        :type value: bytes
+        :param ex: Expiration of the key in seconds
+        :type ex: Optional[int]
+        :return: True, as Redis does
+        :rtype: Any
+        """
+        self._check()
+        self.store[name] = (
+            None if ex is None else time.monotonic() + ex,
+            value,
+        )
+        return True
+
+    def delete(self, *names: str) -> Any:
+        """
+        Delete one or more keys
+        :param names: The keys
+        :type names: str
+        :return: The number of deleted keys
+        :rtype: Any
+        """
+        self._check()
+        return sum(self.store.pop(name, None) is not None for name in names)
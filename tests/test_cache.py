@@ -0,0 +1,162 @@
+"""
+A module for test cache in the tests package.
+"""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from app.core.cache import ReadThroughCache, RedisCacheBackend, TTLLRUCache
+from tests.fakes import FakeRedis
+
+
+def test_ttl_lru_cache_expires_and_evicts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now: list[float] = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache: TTLLRUCache = TTLLRUCache(maxsize=2, ttl=10)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_read_through_loads_once_and_counts_hits() -> None:
+    cache: ReadThroughCache = ReadThroughCache(TTLLRUCache(8, 60))
+    loads: list[str] = []
+
+    def loader() -> bytes:
+        loads.append("user:1")
+        return b"value"
+
+    assert cache.get_or_load("user:1", loader) == b"value"
+    assert cache.get_or_load("user:1", loader) == b"value"
+    assert loads == ["user:1"]
+    snapshot: dict[str, int | float] = cache.metrics.snapshot()
+    assert (snapshot["hits"], snapshot["misses"], snapshot["loads"]) == (
+        1,
+        1,
+        1,
+    )
+
+
+def test_remote_tier_is_shared_and_invalidated() -> None:
+    redis: FakeRedis = FakeRedis()
+    first: ReadThroughCache = ReadThroughCache(
+        TTLLRUCache(8, 5), RedisCacheBackend(redis, 60)
+    )
+    second: ReadThroughCache = ReadThroughCache(
+        TTLLRUCache(8, 5), RedisCacheBackend(redis, 60)
+    )
+    first.get_or_load("user:1", lambda: b"v1")
+    assert second.get_or_load("user:1", lambda: b"unused") == b"v1"
+    assert second.metrics.snapshot()["remote_hits"] == 1
+    second.invalidate("user:1")
+    assert "cache:user:1" not in redis.store
+
+
+def test_remote_errors_fall_back_to_the_loader() -> None:
+    redis: FakeRedis = FakeRedis()
+    redis.available = False
+    cache: ReadThroughCache = ReadThroughCache(
+        TTLLRUCache(8, 60), RedisCacheBackend(redis, 60)
+    )
+    assert cache.get_or_load("user:1", lambda: b"value") == b"value"
+    cache.invalidate("user:1")
+    assert cache.metrics.snapshot()["errors"] == 3
+
+
+def test_invalidation_during_load_skips_the_store() -> None:
+    redis: FakeRedis = FakeRedis()
+    cache: ReadThroughCache = ReadThroughCache(
+        TTLLRUCache(8, 60), RedisCacheBackend(redis, 60)
+    )
+
+    def loader() -> bytes:
+        cache.invalidate("user:1")
+        return b"stale"
+
+    assert cache.get_or_load("user:1", loader) == b"stale"
+    assert cache.local.get("user:1") is None
+    assert redis.store == {}
+    assert cache.get_or_load("user:1", lambda: b"fresh") == b"fresh"
+    assert cache.local.get("user:1") == b"fresh"
+
+
+def test_invalidation_of_another_key_keeps_the_store() -> None:
+    cache: ReadThroughCache = ReadThroughCache(TTLLRUCache(8, 60))
+
+    def loader() -> bytes:
+        cache.invalidate("user:2")
+        return b"value"
+
+    cache.get_or_load("user:1", loader)
+    assert cache.local.get("user:1") == b"value"
+
+
+def test_slow_remote_store_does_not_block_other_keys() -> None:
+    entered: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+
+    class SlowRedis(FakeRedis):
+        def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+            entered.set()
+            release.wait(5)
+            return super().set(name, value, ex)
+
+    redis: SlowRedis = SlowRedis()
+    cache: ReadThroughCache = ReadThroughCache(
+        TTLLRUCache(8, 60), RedisCacheBackend(redis, 60)
+    )
+    thread: threading.Thread = threading.Thread(
+        target=cache.get_or_load, args=("user:1", lambda: b"stale")
+    )
+    thread.start()
+    assert entered.wait(5)
+    invalidating: threading.Thread = threading.Thread(
+        target=cache.invalidate, args=("user:1",)
+    )
+    invalidating.start()
+    invalidating.join(1)
+    assert not invalidating.is_alive()
+    release.set()
+    thread.join(5)
+    assert cache.local.get("user:1") is None
+    assert "cache:user:1" not in redis.store
+
+
+def test_concurrent_misses_share_a_single_load() -> None:
+    cache: ReadThroughCache = ReadThroughCache(TTLLRUCache(8, 60))
+    started: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+    loads: list[int] = []
+
+    def loader() -> bytes:
+        loads.append(1)
+        started.set()
+        release.wait(5)
+        return b"value"
+
+    results: list[bytes] = []
+    threads: list[threading.Thread] = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_load("user:1", loader))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == [b"value"] * 5
+    assert loads == [1]
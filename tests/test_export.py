@@ -0,0 +1,93 @@
+"""
+A module for test export in the tests package.
+"""
+
+import csv
+import io
+import json
+
+from pydantic import BaseModel
+from sqlalchemy import Engine, insert
+
+from app.core.export import iter_csv, iter_ndjson
+from app.crud.user import UserRepository
+from app.db.session import get_session
+from app.models.user import User
+from app.schemas.user import User as UserSchema
+from tests.conftest import TEST_USER_PREFIX
+
+HASHED_PASSWORD: str = "$2b$12$" + "x" * 53
+
+
+class Row(BaseModel):
+    """
+    Model with the kinds of values CSV and JSON must escape
+    """
+
+    name: str
+    note: str | None = None
+
+
+ROWS: list[Row] = [
+    Row(name="plain", note="simple"),
+    Row(name='quote "and" comma, here', note="line\nbreak"),
+    Row(name="unicode ñandú ☂"),
+]
+
+
+def test_ndjson_writes_one_escaped_object_per_line() -> None:
+    chunks: list[bytes] = list(iter_ndjson(ROWS, 2))
+    assert len(chunks) == 2
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    lines: list[bytes] = b"".join(chunks).splitlines()
+    assert [Row.model_validate(json.loads(line)) for line in lines] == ROWS
+
+
+def test_ndjson_of_no_rows_is_empty() -> None:
+    assert b"".join(iter_ndjson([], 2)) == b""
+
+
+def test_csv_writes_a_header_and_escaped_rows() -> None:
+    chunks: list[bytes] = list(iter_csv(ROWS, ["name", "note"], 2, "utf-8"))
+    assert len(chunks) == 2
+    content: str = b"".join(chunks).decode("utf-8")
+    assert content.startswith("name,note\r\n")
+    records: list[dict[str, str]] = list(csv.DictReader(io.StringIO(content)))
+    assert records == [
+        {"name": "plain", "note": "simple"},
+        {"name": 'quote "and" comma, here', "note": "line\nbreak"},
+        {"name": "unicode ñandú ☂", "note": ""},
+    ]
+
+
+def test_csv_of_no_rows_is_only_the_header() -> None:
+    assert b"".join(iter_csv([], ["name", "note"], 2, "utf-8")) == (
+        b"name,note\r\n"
+    )
+
+
+def test_stream_users_yields_every_user_in_id_order(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "username": f"{TEST_USER_PREFIX}exp{index}",
+                    "email": f"{TEST_USER_PREFIX}exp{index}@example.com",
+                    "password": HASHED_PASSWORD,
+                }
+                for index in range(5)
+            ],
+        )
+    users: list[UserSchema] = [
+        user
+        for user in UserRepository(get_session()).stream_users(2)
+        if user.username and user.username.startswith(TEST_USER_PREFIX)
+    ]
+    assert [user.username for user in users] == [
+        f"{TEST_USER_PREFIX}exp{index}" for index in range(5)
+    ]
+    lines: list[bytes] = b"".join(iter_ndjson(users, 2)).splitlines()
+    assert [json.loads(line)["email"] for line in lines] == [
+        f"{TEST_USER_PREFIX}exp{index}@example.com" for index in range(5)
+    ]
@@ -0,0 +1,42 @@
+"""
+A module for test import time in the tests package.
+"""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.import_time import (
+    DEFAULT_BUDGET_MS,
+    DEFAULT_MODULE,
+    ImportTiming,
+    build_report,
+    measure_import_time,
+)
+
+
+def test_application_import_stays_within_budget() -> None:
+    timings: list[ImportTiming] = measure_import_time(DEFAULT_MODULE)
+    report: dict[str, object] = build_report(
+        DEFAULT_MODULE, timings, DEFAULT_BUDGET_MS, 5
+    )
+    assert report["within_budget"], report
+
+
+def test_settings_are_built_on_first_access() -> None:
+    code: str = (
+        "import app.config.init_settings, app.config.settings, app.db.session"
+    )
+    env: dict[str, str] = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("SERVER_", "POSTGRES_"))
+    }
+    completed: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,52 @@
+"""
+A module for test middleware in the tests package.
+"""
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.middleware import CompressionMiddleware, accepted_encodings
+
+BODY: str = "weather " * 200
+
+
+def _client(etag: str) -> TestClient:
+    async def endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(BODY, headers={"ETag": etag})
+
+    app: Starlette = Starlette(routes=[Route("/", endpoint)])
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        gzip_level=6,
+        brotli_quality=4,
+        content_types=["text/"],
+    )
+    return TestClient(app)
+
+
+def test_accepted_encodings_excludes_q_zero() -> None:
+    assert accepted_encodings("gzip;q=0, br, identity") == {"br", "identity"}
+
+
+def test_compression_weakens_a_strong_etag() -> None:
+    response = _client('"abc"').get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.text == BODY
+
+
+def test_compression_keeps_a_weak_etag() -> None:
+    response = _client('W/"abc"').get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["etag"] == 'W/"abc"'
+
+
+def test_identity_keeps_a_strong_etag() -> None:
+    response = _client('"abc"').get(
+        "/", headers={"Accept-Encoding": "gzip;q=0"}
+    )
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
@@ -0,0 +1,150 @@
+"""
+A module for test resilience in the tests package.
+"""
+
+import threading
+import time
+from typing import Any, Iterator
+
+import pytest
+from pydantic import ValidationError
+
+from pipeline.exceptions.exceptions import CircuitOpenException
+from pipeline.services.external.api.resilience import (
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+def _breaker(now: list[float], half_open_calls: int = 2) -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=4,
+        open_timeout=10.0,
+        half_open_calls=half_open_calls,
+        clock=lambda: now[0],
+    )
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.minimum_calls):
+        breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.fixture
+def api_service() -> Iterator[Any]:
+    """
+    API service with hedging enabled after recorded latencies of 10 ms,
+     skipping the test when the pipeline settings are not configured
+    """
+    try:
+        from pipeline.config.settings import get_settings
+        from pipeline.services.external.api.api import ApiService
+    except ValidationError as exc:
+        pytest.skip(
+            f"Pipeline settings unavailable: {exc.error_count()} errors"
+        )
+    service: ApiService = ApiService(
+        get_settings().model_copy(
+            update={
+                "HEDGE_REQUESTS": True,
+                "HEDGE_MIN_SAMPLES": 2,
+                "HEDGE_MIN_DELAY": 0.05,
+            }
+        )
+    )
+    for _ in range(2):
+        service.latency_tracker.record(0.01)
+    yield service
+    service.session.close()
+
+
+def test_circuit_opens_at_the_failure_rate() -> None:
+    now: list[float] = [0.0]
+    breaker: CircuitBreaker = _breaker(now)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call()
+
+
+def test_half_open_circuit_closes_after_the_trial_calls() -> None:
+    now: list[float] = [0.0]
+    breaker: CircuitBreaker = _breaker(now)
+    _open(breaker)
+    now[0] = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failure_rate == 0.0
+    breaker.before_call()
+
+
+def test_half_open_circuit_reopens_on_a_trial_failure() -> None:
+    now: list[float] = [0.0]
+    breaker: CircuitBreaker = _breaker(now)
+    _open(breaker)
+    now[0] = 10.0
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    now[0] = 19.0
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call()
+    now[0] = 20.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+
+
+def test_hedged_request_discards_the_slower_request(api_service: Any) -> None:
+    release: threading.Event = threading.Event()
+    calls: list[int] = []
+    lock: threading.Lock = threading.Lock()
+
+    def request() -> bytes:
+        with lock:
+            calls.append(len(calls))
+            attempt: int = calls[-1]
+        if attempt == 0:
+            release.wait(5)
+            raise ConnectionError("slow request failed after the hedge")
+        return b"hedge"
+
+    start: float = time.perf_counter()
+    try:
+        assert api_service._hedged(request) == b"hedge"
+        assert time.perf_counter() - start < 1.0
+        assert calls == [0, 1]
+    finally:
+        release.set()
+
+
+def test_half_open_circuit_does_not_hedge(api_service: Any) -> None:
+    now: list[float] = [0.0]
+    api_service.circuit_breaker = _breaker(now, half_open_calls=1)
+    _open(api_service.circuit_breaker)
+    now[0] = 10.0
+    api_service.circuit_breaker.before_call()
+    calls: list[float] = []
+
+    def request() -> bytes:
+        calls.append(time.perf_counter())
+        time.sleep(0.2)
+        return b"trial"
+
+    assert api_service._hedged(request) == b"trial"
+    assert len(calls) == 1
+    api_service.circuit_breaker.record_success()
+    assert api_service.circuit_breaker.state is CircuitState.CLOSED
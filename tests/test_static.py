@@ -0,0 +1,95 @@
+"""
+A module for test static in the tests package.
+"""
+
+import gzip
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.core.static import (
+    REVALIDATE_CACHE_CONTROL,
+    CachedStaticFiles,
+    fingerprint_name,
+    precompress_directory,
+)
+
+SCRIPT: bytes = b"console.log('weather');\n" * 200
+
+
+def _client(directory: Path) -> tuple[TestClient, CachedStaticFiles]:
+    static: CachedStaticFiles = CachedStaticFiles(
+        directory=str(directory),
+        max_age=600,
+        memory_max_file_size=1024,
+        memory_max_total_size=4096,
+    )
+    app: Starlette = Starlette(routes=[Mount("/static", static)])
+    return TestClient(app), static
+
+
+def test_fingerprint_name_follows_the_content() -> None:
+    path: Path = Path("images/logo.png")
+    name: str = fingerprint_name(path, b"first")
+    assert name.startswith("logo.") and name.endswith(".png")
+    assert name == fingerprint_name(path, b"first")
+    assert name != fingerprint_name(path, b"second")
+
+
+def test_fingerprinted_names_are_immutable(tmp_path: Path) -> None:
+    (tmp_path / "logo.svg").write_bytes(b"<svg/>")
+    client, static = _client(tmp_path)
+    url: str = static.url_path("logo.svg")
+    assert url == fingerprint_name(Path("logo.svg"), b"<svg/>")
+    response = client.get(f"/static/{url}")
+    assert response.status_code == 200
+    assert response.content == b"<svg/>"
+    assert response.headers["Cache-Control"] == (
+        "public, max-age=600, immutable"
+    )
+
+
+def test_plain_names_revalidate(tmp_path: Path) -> None:
+    (tmp_path / "logo.svg").write_bytes(b"<svg/>")
+    client, static = _client(tmp_path)
+    response = client.get("/static/logo.svg")
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+    assert static.url_path("missing.svg") == "missing.svg"
+    revalidated = client.get(
+        "/static/logo.svg",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_precompressed_variant_is_served(tmp_path: Path) -> None:
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    (tmp_path / "tiny.txt").write_bytes(b"x")
+    written: list[Path] = precompress_directory(str(tmp_path), 64)
+    assert tmp_path / "app.js.gz" in written
+    assert not (tmp_path / "tiny.txt.gz").exists()
+    client, static = _client(tmp_path)
+    url: str = static.url_path("app.js")
+    response = client.get(
+        f"/static/{url}", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Content-Type"].startswith("text/javascript")
+    assert response.headers["Cache-Control"].endswith("immutable")
+    assert response.content == SCRIPT
+    raw = client.get(f"/static/{url}", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in raw.headers
+    assert raw.content == SCRIPT
+    assert "app.js.gz" not in static.fingerprints
+
+
+def test_precompression_skips_incompressible_files(tmp_path: Path) -> None:
+    noise: bytes = gzip.compress(SCRIPT)
+    (tmp_path / "noise.bin").write_bytes(noise)
+    (tmp_path / "noise.bin.gz").write_bytes(b"stale")
+    assert precompress_directory(str(tmp_path)) == []
+    assert not (tmp_path / "noise.bin.gz").exists()
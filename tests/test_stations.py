@@ -0,0 +1,94 @@
+"""
+A module for test stations in the tests package.
+"""
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from pipeline.engineering.stations import (
+    EARTH_RADIUS_KM,
+    StationRegistry,
+    get_station_registry,
+)
+from pipeline.schemas.files.station import Station
+
+STATIONS_FILE: Path = (
+    Path(__file__).resolve().parents[1]
+    / "pipeline"
+    / "data"
+    / "reference"
+    / "stations.csv"
+)
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1: float = math.radians(lat1)
+    phi2: float = math.radians(lat2)
+    a: float = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1)
+        * math.cos(phi2)
+        * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+
+def _random_points(
+    rng: random.Random, count: int
+) -> list[tuple[float, float]]:
+    # Uniform on the sphere, plus the poles and both sides of the
+    # antimeridian.
+    points: list[tuple[float, float]] = [
+        (math.degrees(math.asin(rng.uniform(-1, 1))), rng.uniform(-180, 180))
+        for _ in range(count)
+    ]
+    return points + [(90.0, 0.0), (-90.0, 0.0), (0.0, 180.0), (0.0, -180.0)]
+
+
+def _assert_matches_brute_force(
+    registry: StationRegistry, queries: list[tuple[float, float]]
+) -> None:
+    stations: list[Station] = list(registry.values())
+    for lat, lon in queries:
+        expected: float = min(
+            _haversine(lat, lon, station.lat, station.lon)
+            for station in stations
+        )
+        station, distance = registry.nearest_with_distance(lat, lon)
+        assert distance == pytest.approx(expected, abs=1e-6)
+        assert _haversine(
+            lat, lon, station.lat, station.lon
+        ) == pytest.approx(expected, abs=1e-6)
+
+
+def test_nearest_matches_brute_force_on_random_stations() -> None:
+    rng: random.Random = random.Random(49)
+    registry: StationRegistry = StationRegistry(
+        Station(location=f"station-{index}", lat=lat, lon=lon)
+        for index, (lat, lon) in enumerate(_random_points(rng, 2000))
+    )
+    assert len(registry) == 2004
+    _assert_matches_brute_force(registry, _random_points(rng, 500))
+
+
+def test_nearest_matches_brute_force_on_reference_stations() -> None:
+    registry: StationRegistry = get_station_registry(
+        str(STATIONS_FILE), "utf-8"
+    )
+    rng: random.Random = random.Random(49)
+    queries: list[tuple[float, float]] = [
+        (rng.uniform(-44, -10), rng.uniform(112, 154)) for _ in range(500)
+    ]
+    _assert_matches_brute_force(registry, queries + _random_points(rng, 100))
+    for location in registry:
+        assert registry.nearest(*registry.coordinates(location)).location == (
+            location
+        )
+
+
+def test_nearest_rejects_an_empty_registry() -> None:
+    with pytest.raises(LookupError):
+        StationRegistry([]).nearest(0.0, 0.0)
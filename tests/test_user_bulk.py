@@ -0,0 +1,128 @@
+"""
+A module for test user bulk in the tests package.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import Engine, func, insert, select
+
+from app.config.settings import setting
+from app.core.exceptions import DatabaseException
+from app.crud.user import UserRepository
+from app.db.session import get_session
+from app.main import app
+from app.models.user import User
+from app.schemas.user import UserCreate, UsersBulkResponse
+from tests.conftest import TEST_USER_PREFIX
+
+HASHED_PASSWORD: str = "$2b$12$" + "x" * 53
+
+
+def _user(name: str, password: str = HASHED_PASSWORD) -> UserCreate:
+    return UserCreate.model_construct(
+        username=f"{TEST_USER_PREFIX}{name}",
+        email=f"{TEST_USER_PREFIX}{name}@example.com",
+        password=password,
+        birthdate=None,
+        phone_number=None,
+    )
+
+
+def _count(engine: Engine) -> int:
+    with engine.connect() as connection:
+        return connection.scalar(
+            select(func.count())
+            .select_from(User)
+            .where(User.username.startswith(TEST_USER_PREFIX))
+        )
+
+
+def test_duplicates_are_rejected(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(insert(User).values(_user("taken").model_dump()))
+    existing_email: UserCreate = _user("other")
+    existing_email.email = f"{TEST_USER_PREFIX}taken@example.com"
+    repeated: UserCreate = _user("new")
+    repeated.email = f"{TEST_USER_PREFIX}new2@example.com"
+    result: UsersBulkResponse = UserRepository(get_session()).create_users(
+        [_user("taken"), existing_email, _user("new"), repeated], 10
+    )
+    assert [user.username for user in result.users] == [
+        f"{TEST_USER_PREFIX}new"
+    ]
+    assert [(error.index, error.detail) for error in result.errors] == [
+        (0, "Username already exists"),
+        (1, "Email already exists"),
+        (3, "Username is duplicated in the batch"),
+    ]
+    assert _count(engine) == 2
+
+
+def test_constraint_violation_falls_back_to_savepoints(
+    engine: Engine,
+) -> None:
+    result: UsersBulkResponse = UserRepository(get_session()).create_users(
+        [_user("valid"), _user("plain", "Hk7pH9*35Fu&3U"), _user("valid2")],
+        10,
+    )
+    assert [user.username for user in result.users] == [
+        f"{TEST_USER_PREFIX}valid",
+        f"{TEST_USER_PREFIX}valid2",
+    ]
+    assert [(error.index, error.detail) for error in result.errors] == [
+        (1, "Constraint users_password_length violated")
+    ]
+    assert _count(engine) == 2
+
+
+def test_duplicates_across_chunk_boundaries(engine: Engine) -> None:
+    users: list[UserCreate] = [_user(f"c{index}") for index in range(5)]
+    users.insert(2, _user("c1"))
+    result: UsersBulkResponse = UserRepository(get_session()).create_users(
+        users, 2
+    )
+    assert [user.username for user in result.users] == [
+        f"{TEST_USER_PREFIX}c{index}" for index in range(5)
+    ]
+    assert [(error.index, error.detail) for error in result.errors] == [
+        (2, "Username already exists")
+    ]
+    assert _count(engine) == 5
+
+
+def test_database_error_rolls_back_every_chunk(engine: Engine) -> None:
+    users: list[UserCreate] = [_user("r0"), _user("r1"), _user("r2")]
+    users[2].username = f"{TEST_USER_PREFIX}{'x' * 20}"
+    with pytest.raises(DatabaseException):
+        UserRepository(get_session()).create_users(users, 2)
+    assert _count(engine) == 0
+
+
+def test_bulk_endpoint_renders_the_result(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(insert(User).values(_user("api").model_dump()))
+    client: TestClient = TestClient(app)
+    response: Response = client.post(
+        f"{setting.API_V1_STR}/user/bulk",
+        json=[
+            {
+                "username": f"{TEST_USER_PREFIX}api",
+                "email": f"{TEST_USER_PREFIX}api@example.com",
+                "password": "Hk7pH9*35Fu&3U",
+            }
+        ],
+    )
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "users": [],
+        "errors": [
+            {
+                "index": 0,
+                "username": f"{TEST_USER_PREFIX}api",
+                "email": f"{TEST_USER_PREFIX}api@example.com",
+                "detail": "Username already exists",
+            }
+        ],
+    }
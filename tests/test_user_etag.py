@@ -0,0 +1,105 @@
+"""
+A module for test user etag in the tests package.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import PositiveInt
+from sqlalchemy import Engine, insert, select
+
+from app.config.settings import setting
+from app.main import app
+from app.models.user import User
+from tests.conftest import TEST_USER_PREFIX
+
+HASHED_PASSWORD: str = "$2b$12$" + "x" * 53
+
+
+@pytest.fixture
+def user_id(engine: Engine) -> PositiveInt:
+    with engine.begin() as connection:
+        return connection.scalar(
+            insert(User)
+            .values(
+                username=f"{TEST_USER_PREFIX}etag",
+                email=f"{TEST_USER_PREFIX}etag@example.com",
+                password=HASHED_PASSWORD,
+            )
+            .returning(User.id)
+        )
+
+
+def _url(user_id: PositiveInt) -> str:
+    return f"{setting.API_V1_STR}/user/{user_id}"
+
+
+def _version(engine: Engine, user_id: PositiveInt) -> int:
+    with engine.connect() as connection:
+        return connection.scalar(select(User.version).where(User.id == user_id))
+
+
+def test_get_returns_304_for_a_held_etag(user_id: PositiveInt) -> None:
+    client: TestClient = TestClient(app)
+    response = client.get(_url(user_id))
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{user_id}-1"'
+    for held in (f'"{user_id}-1"', f'W/"{user_id}-1"', f'"0-0", "{user_id}-1"'):
+        not_modified = client.get(
+            _url(user_id), headers={"If-None-Match": held}
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+    assert (
+        client.get(
+            _url(user_id), headers={"If-None-Match": f'"{user_id}-2"'}
+        ).status_code
+        == 200
+    )
+
+
+def test_put_applies_a_matching_if_match(
+    engine: Engine, user_id: PositiveInt
+) -> None:
+    client: TestClient = TestClient(app)
+    response = client.put(
+        _url(user_id),
+        json={"birthdate": "2000-01-01"},
+        headers={"If-Match": f'"{user_id}-1"'},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{user_id}-2"'
+    assert response.json()["birthdate"] == "2000-01-01"
+    assert _version(engine, user_id) == 2
+    refreshed = client.get(_url(user_id))
+    assert refreshed.headers["ETag"] == f'"{user_id}-2"'
+
+
+@pytest.mark.parametrize(
+    "if_match", ['"{id}-2"', 'W/"{id}-1"', '"0-1"'], ids=str
+)
+def test_put_rejects_a_stale_or_weak_if_match(
+    engine: Engine, user_id: PositiveInt, if_match: str
+) -> None:
+    response = TestClient(app).put(
+        _url(user_id),
+        json={"birthdate": "2000-01-01"},
+        headers={"If-Match": if_match.format(id=user_id)},
+    )
+    assert response.status_code == 412
+    assert _version(engine, user_id) == 1
+
+
+def test_concurrent_updates_with_one_etag_apply_once(
+    engine: Engine, user_id: PositiveInt
+) -> None:
+    client: TestClient = TestClient(app)
+    statuses: list[int] = [
+        client.put(
+            _url(user_id),
+            json={"birthdate": birthdate},
+            headers={"If-Match": f'"{user_id}-1"'},
+        ).status_code
+        for birthdate in ("2000-01-01", "2001-01-01")
+    ]
+    assert statuses == [200, 412]
+    assert _version(engine, user_id) == 2